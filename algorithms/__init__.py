@@ -6,3 +6,28 @@ from .dijkstra_sequential import dijkstra_sequential
 from .dijkstra_parallel import dijkstra_parallel
 from .astar_sequential import astar_sequential
 from .astar_parallel import astar_parallel
+from .hda_star import hda_star
+from .ida_star import ida_star
+from .sma_star import sma_star
+from .batch_query import batch_query, BatchResult
+
+# (algorithm, mode) -> solver, in the order the UI lists them
+SOLVERS = {
+    ("BFS", "Sequential"): bfs_sequential,
+    ("BFS", "Parallel"): bfs_parallel,
+    ("DFS", "Sequential"): dfs_sequential,
+    ("DFS", "Parallel"): dfs_parallel,
+    ("Dijkstra", "Sequential"): dijkstra_sequential,
+    ("Dijkstra", "Parallel"): dijkstra_parallel,
+    ("A*", "Sequential"): astar_sequential,
+    ("A*", "Parallel"): astar_parallel,
+    ("HDA*", "Parallel"): hda_star,
+    ("IDA*", "Sequential"): ida_star,
+    ("SMA*", "Sequential"): sma_star,
+}
+
+# solvers whose parallel workers are processes rather than threads
+PROCESS_SOLVERS = {("HDA*", "Parallel")}
+
+# solvers that take batch=k: k cells per step, workload charged in a process pool
+BATCHED_SOLVERS = {("Dijkstra", "Parallel"), ("A*", "Parallel")}
@@ -1,5 +1,9 @@
-import time, heapq, threading, math
-from utils import neighbors
+import time, threading
+from maze import snapshot_for
+from workload import NO_WORK
+from .heuristics import make_heuristic, tie_key
+from .batched import batched_search
+from .indexed_heap import IndexedHeap
 
 THREAD_COLORS = [
     "#ffd54f", "#4fc3f7", "#ce93d8", "#80cbc4",
@@ -7,70 +11,83 @@ THREAD_COLORS = [
     "#9fa8da", "#ffcc80", "#b39ddb", "#ff8a65"
 ]
 
-def heuristic(a, b):
-    return math.sqrt((a[0]-b[0])**2 + (a[1]-b[1])**2)
-
 def astar_parallel(start, goal, n, walls, get_edge_weight,
                    draw_cell, draw_edge, player_update,
-                   speed, stop_event, num_threads=4):
+                   speed, stop_event, num_threads=4, maze=None,
+                   heuristic="manhattan", epsilon=1.0, tie_break="high_g", landmarks=None, workload=NO_WORK, batch=0):
 
     t0 = time.time()
+    maze = snapshot_for(n, walls, get_edge_weight, maze)
+    adj, cells = maze.adj, maze.cells
+    s, t = maze.index(start), maze.index(goal)
+    h = make_heuristic(heuristic, maze, goal, landmarks)
+    tie = tie_key(tie_break)
+
+    if batch:
+        # coordinator + process pool for the per-cell workload (see batched.py)
+        parent = batched_search(maze, s, t, lambda i: epsilon * h(i), tie, draw_cell, THREAD_COLORS,
+                                stop_event, workload, num_threads, batch)
+        return maze.trace(parent, s, t), time.time() - t0
 
     lock = threading.Lock()
-    pq = [(0, start)]
-    g = {start: 0}
-    parent = {start: None}
+    pq = IndexedHeap(len(cells))  # one entry per open cell, decrease-key in place
+    pq.push(s, (0, 0))
+    g = [float("inf")] * len(cells)
+    g[s] = 0
+    parent = [-1] * len(cells)  # -1: not reached yet
+    parent[s] = s
 
-    active_threads = [True] * num_threads
+    queued = threading.Condition(lock)
+    state = {"idle": 0, "done": False}
 
     def worker(tid):
         color = THREAD_COLORS[tid % len(THREAD_COLORS)]
 
         while not stop_event.is_set():
 
-            with lock:
-                if pq:
-                    f, curr = heapq.heappop(pq)
-                else:
-                    active_threads[tid] = False
+            with queued:
+                # as in parallel Dijkstra: an empty heap ends the search only
+                # once every worker is waiting on it
+                while not pq and not state["done"] and not stop_event.is_set():
+                    state["idle"] += 1
+                    if state["idle"] == num_threads:
+                        state["done"] = True
+                        queued.notify_all()
+                        break
+                    queued.wait(0.05)
+                    state["idle"] -= 1
+                if state["done"] or stop_event.is_set():
                     return
+                _, curr = pq.pop()
 
-            draw_cell(curr, color)
+            workload(curr)
+            draw_cell(cells[curr], color)
 
-            if curr == goal:
+            if curr == t:
                 stop_event.set()
                 return
 
-            for nx in neighbors(curr, n):
-                if nx in walls:
-                    continue
-
-                w = get_edge_weight(curr, nx)
+            for nx, w in adj[curr]:
                 new_g = g[curr] + w
-                f_new = new_g + heuristic(nx, goal)
+                h_nx = epsilon * h(nx)
 
                 with lock:
-                    if nx not in g or new_g < g[nx]:
+                    if new_g < g[nx]:
                         g[nx] = new_g
                         parent[nx] = curr
-                        heapq.heappush(pq, (f_new, nx))
+                        pq.push(nx, (new_g + h_nx, tie(new_g, h_nx)))
+                        queued.notify()
 
     threads = []
     for i in range(num_threads):
-        t = threading.Thread(target=worker, args=(i,), daemon=True)
-        t.start()
-        threads.append(t)
+        th = threading.Thread(target=worker, args=(i,), daemon=True)
+        th.start()
+        threads.append(th)
 
-    for t in threads:
-        t.join()
+    for th in threads:
+        th.join()
 
     # Reconstruct path
-    path = []
-    if goal in parent:
-        c = goal
-        while c:
-            path.append(c)
-            c = parent[c]
-        path.reverse()
+    path = maze.trace(parent, s, t)
 
     return path, time.time() - t0
@@ -1,51 +1,49 @@
-import time, heapq, math
-from utils import neighbors
-from utils import heavy_work
-
-def heuristic(a, b):
-    # Euclidean distance
-    return math.sqrt((a[0]-b[0])**2 + (a[1]-b[1])**2)
+import time
+from maze import snapshot_for
+from workload import NO_WORK
+from .heuristics import make_heuristic, tie_key
+from .indexed_heap import IndexedHeap
 
 def astar_sequential(start, goal, n, walls, get_edge_weight,
                      draw_cell, draw_edge, player_update,
-                     speed, stop_event, num_threads=None):
+                     speed, stop_event, num_threads=None, maze=None,
+                     heuristic="manhattan", epsilon=1.0, tie_break="high_g", landmarks=None, workload=NO_WORK):
 
     t0 = time.time()
-
-    pq = [(0, start)]
-    g = {start: 0}
-    parent = {start: None}
+    maze = snapshot_for(n, walls, get_edge_weight, maze)
+    adj, cells = maze.adj, maze.cells
+    s, t = maze.index(start), maze.index(goal)
+    # epsilon > 1: weighted A*, path cost at most epsilon * optimal
+    h = make_heuristic(heuristic, maze, goal, landmarks)
+    tie = tie_key(tie_break)
+
+    pq = IndexedHeap(len(cells))  # one entry per open cell, decrease-key in place
+    pq.push(s, (0, 0))
+    g = [float("inf")] * len(cells)
+    g[s] = 0
+    parent = [-1] * len(cells)  # -1: not reached yet
+    parent[s] = s
 
     while pq and not stop_event.is_set():
-        f, curr = heapq.heappop(pq)
+        _, curr = pq.pop()
 
-        heavy_work()  # 🔥 guarantee slow sequential runtime
+        workload(curr)
 
-        draw_cell(curr, "#F5B7B1")
+        draw_cell(cells[curr], "#F5B7B1")
 
-        if curr == goal:
+        if curr == t:
             break
 
-        for nx in neighbors(curr, n):
-            if nx in walls:
-                continue
-
-            w = get_edge_weight(curr, nx)
+        for nx, w in adj[curr]:
             new_g = g[curr] + w
 
-            if nx not in g or new_g < g[nx]:
+            if new_g < g[nx]:
                 g[nx] = new_g
                 parent[nx] = curr
-                f_new = new_g + heuristic(nx, goal)
-                heapq.heappush(pq, (f_new, nx))
+                h_nx = epsilon * h(nx)
+                pq.push(nx, (new_g + h_nx, tie(new_g, h_nx)))
 
     # path reconstruction
-    path = []
-    if goal in parent:
-        c = goal
-        while c:
-            path.append(c)
-            c = parent[c]
-        path.reverse()
+    path = maze.trace(parent, s, t)
 
     return path, time.time() - t0
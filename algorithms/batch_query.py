@@ -0,0 +1,151 @@
+import time, heapq
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from maze import MazeSnapshot
+
+UNREACHABLE = -1
+
+# maze shared by every task of a worker process (set once by _init_worker)
+_maze = None
+
+
+class BatchResult:
+    """Answers of a batch_query call, stored in flat arrays.
+
+    costs[i] is the cost of query i (UNREACHABLE if there is no path).
+    The path of query i is cells[offsets[i]:offsets[i+1]], each cell
+    packed as x * n + y.
+    """
+
+    __slots__ = ("n", "costs", "offsets", "cells")
+
+    def __init__(self, n, costs, offsets, cells):
+        self.n = n
+        self.costs = costs
+        self.offsets = offsets
+        self.cells = cells
+
+    def __len__(self):
+        return len(self.costs)
+
+    def cost(self, i):
+        return self.costs[i]
+
+    def path(self, i):
+        n = self.n
+        return [divmod(c, n) for c in self.cells[self.offsets[i]:self.offsets[i + 1]]]
+
+
+def _init_worker(maze):
+    global _maze
+    _maze = maze
+
+
+def single_source(maze, source, goals):
+    """One search from source that stops once every goal is settled.
+
+    Uses BFS when the maze is unweighted, Dijkstra otherwise.
+    Returns {goal: (cost, path)} for the reachable goals.
+    """
+    adj = maze.adj
+    s = maze.index(source)
+    targets = {maze.index(g): g for g in goals}
+    if maze.blocked[s]:
+        return {}
+    pending = set(targets)
+    pending.discard(s)
+    parent = [-1] * len(adj)  # -1: not reached yet
+    parent[s] = s
+    dist = [-1] * len(adj)
+    dist[s] = 0
+
+    if not maze.weighted:
+        q = deque([s])
+        while q and pending:
+            curr = q.popleft()
+            pending.discard(curr)
+            d = dist[curr] + 1
+            for nx, _ in adj[curr]:
+                if parent[nx] < 0:
+                    parent[nx] = curr
+                    dist[nx] = d
+                    q.append(nx)
+        # every discovered goal already has its final BFS distance
+    else:
+        pq = [(0, s)]
+        done = bytearray(len(adj))
+        while pq and pending:
+            cost, curr = heapq.heappop(pq)
+            if done[curr]:
+                continue
+            done[curr] = 1
+            pending.discard(curr)
+            for nx, w in adj[curr]:
+                if done[nx]:
+                    continue
+                new_cost = cost + w
+                if dist[nx] < 0 or new_cost < dist[nx]:
+                    dist[nx] = new_cost
+                    parent[nx] = curr
+                    heapq.heappush(pq, (new_cost, nx))
+        for i, g in targets.items():
+            if i != s and not done[i]:  # s is settled even when the loop never ran
+                dist[i] = -1
+
+    answers = {}
+    for i, g in targets.items():
+        if dist[i] >= 0:
+            answers[g] = (dist[i], maze.trace(parent, s, i))
+    return answers
+
+
+def _solve_groups(groups):
+    return [single_source(_maze, s, goals) for s, goals in groups]
+
+
+def batch_query(n, walls, weights, pairs, num_workers=4, maze=None):
+    """Answer many (start, goal) queries against one maze.
+
+    Queries sharing a start are grouped so a single search answers all of
+    their goals; groups are spread across num_workers processes.
+    Returns (BatchResult, elapsed_seconds).
+    """
+    t0 = time.time()
+
+    if maze is None:
+        maze = MazeSnapshot(n, walls, weights)
+    n = maze.n
+
+    groups = {}
+    for s, g in pairs:
+        groups.setdefault(tuple(s), set()).add(tuple(g))
+    groups = list(groups.items())
+
+    answers = {}
+    if num_workers <= 1 or len(groups) <= 1:
+        _init_worker(maze)
+        for (s, _), ans in zip(groups, _solve_groups(groups)):
+            answers[s] = ans
+    else:
+        chunk = max(1, len(groups) // (num_workers * 4))
+        chunks = [groups[i:i + chunk] for i in range(0, len(groups), chunk)]
+        with ProcessPoolExecutor(max_workers=num_workers, initializer=_init_worker,
+                                 initargs=(maze,)) as ex:
+            for part, res in zip(chunks, ex.map(_solve_groups, chunks)):
+                for (s, _), ans in zip(part, res):
+                    answers[s] = ans
+
+    costs = array("q")
+    offsets = array("L", [0])
+    cells = array("L")
+    for s, g in pairs:
+        hit = answers[tuple(s)].get(tuple(g))
+        if hit is None:
+            costs.append(UNREACHABLE)
+        else:
+            costs.append(hit[0])
+            cells.extend(x * n + y for x, y in hit[1])
+        offsets.append(len(cells))
+
+    return BatchResult(n, costs, offsets, cells), time.time() - t0
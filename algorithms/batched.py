@@ -0,0 +1,72 @@
+"""Batched node evaluation for the parallel Dijkstra and A* solvers.
+
+With a CPU-bound workload, threads gain nothing: the per-cell work is pure
+Python and holds the GIL. Here a single coordinator owns the open list. It
+pops the `batch` best entries, has a process pool charge their workload,
+then expands them in key order itself, so the search state is never shared
+and needs no locks.
+
+Entries of one batch are popped before the earlier ones are expanded, so a
+later entry can turn out stale (skipped) or be reached more cheaply
+afterwards (reopened and expanded again). The goal is only accepted once
+no open entry has a smaller key, so paths stay optimal wherever the
+threaded solver's are.
+"""
+import heapq
+from concurrent.futures import ProcessPoolExecutor
+
+# workload of a pool process (set by _init_worker)
+_workload = None
+
+
+def _init_worker(workload):
+    global _workload
+    _workload = workload
+
+
+def _evaluate(chunk):
+    for i in chunk:
+        _workload(i)
+    return len(chunk)
+
+
+def batched_search(maze, s, t, h, tie, draw_cell, colors, stop_event, workload, num_workers, batch):
+    """Parent list of a best-first search from s to t (keys g + h(i), ties by tie(g, h))."""
+    adj, cells = maze.adj, maze.cells
+    num_workers = max(1, num_workers)
+    g = [float("inf")] * len(cells)
+    g[s] = 0
+    parent = [-1] * len(cells)  # -1: not reached yet
+    parent[s] = s
+    hs = h(s)
+    pq = [(hs, tie(0, hs), 0, s)]
+
+    with ProcessPoolExecutor(max_workers=num_workers, initializer=_init_worker,
+                             initargs=(workload,)) as ex:
+        while pq and not stop_event.is_set():
+            popped = []
+            while pq and len(popped) < batch:
+                entry = heapq.heappop(pq)
+                if entry[2] <= g[entry[3]]:
+                    popped.append(entry)
+            chunks = [[e[3] for e in popped[k::num_workers]] for k in range(num_workers)]
+            list(ex.map(_evaluate, [c for c in chunks if c]))
+
+            for k, entry in enumerate(popped):
+                f, _, gc, curr = entry
+                if gc > g[curr]:
+                    continue  # improved by an earlier entry of this batch
+                if curr == t:
+                    if pq and pq[0][0] < f:
+                        heapq.heappush(pq, entry)  # something cheaper is still open
+                        continue
+                    return parent
+                draw_cell(cells[curr], colors[(k % num_workers) % len(colors)])
+                for nx, w in adj[curr]:
+                    new_g = gc + w
+                    if new_g < g[nx]:
+                        g[nx] = new_g
+                        parent[nx] = curr
+                        h_nx = h(nx)
+                        heapq.heappush(pq, (new_g + h_nx, tie(new_g, h_nx), new_g, nx))
+    return parent
@@ -1,48 +1,133 @@
 import time, threading
-from queue import Queue
-from utils import neighbors
+from collections import deque
+from maze import snapshot_for
+from workload import NO_WORK
 
-def worker(q, visited, walls, n, draw_cell, stop_event):
-    while not q.empty() and not stop_event.is_set():
-        curr = q.get()
+def worker(q, parent, adj, cells, draw_cell, stop_event, cond, state, num_threads, workload):
+    try:
+        search(q, parent, adj, cells, draw_cell, stop_event, cond, state, num_threads, workload)
+    except BaseException as e:
+        with cond:
+            # the idle count can no longer reach num_threads: end the search
+            state["error"] = e
+            state["done"] = True
+            cond.notify_all()
 
-        draw_cell(curr, "#FB9070")
+def search(q, parent, adj, cells, draw_cell, stop_event, cond, state, num_threads, workload):
+    while True:
+        with cond:
+            # idle-worker counter: the search is over only when every worker
+            # is waiting on an empty queue, not when one worker sees it empty
+            while not q and not state["done"] and not stop_event.is_set():
+                state["idle"] += 1
+                if state["idle"] == num_threads:
+                    state["done"] = True
+                    cond.notify_all()
+                    break
+                cond.wait(0.05)
+                state["idle"] -= 1
+            if state["done"] or stop_event.is_set():
+                return
+            curr = q.popleft()
 
-        for nx in neighbors(curr, n):
-            if nx in walls:
-                continue
-            if nx not in visited:
-                visited[nx] = curr
-                q.put(nx)
+        workload(curr)
+        draw_cell(cells[curr], "#FB9070")
 
-        q.task_done()
+        for nx, _ in adj[curr]:
+            with cond:
+                if parent[nx] < 0:
+                    parent[nx] = curr
+                    q.append(nx)
+                    cond.notify()
+
+def level_worker(tid, shared, claims, adj, cells, goal, draw_cell, stop_event, barrier, num_threads,
+                 workload):
+    # level-synchronous: every worker expands its slice of the current level,
+    # then all meet at the barrier before the next level starts
+    try:
+        while True:
+            local = shared["next"][tid]
+            for curr in shared["frontier"][tid::num_threads]:
+                if shared["found"] or stop_event.is_set():
+                    break
+                workload(curr)
+                draw_cell(cells[curr], "#FB9070")
+                for nx, _ in adj[curr]:
+                    if nx in claims:
+                        continue
+                    # setdefault is atomic, so exactly one worker claims nx
+                    if claims.setdefault(nx, curr) != curr:
+                        continue
+                    if nx == goal:
+                        # goal's level is settled: its parent is on the current level
+                        shared["found"] = True
+                        break
+                    local.append(nx)
+            barrier.wait()
+            if shared["done"]:
+                return
+    except threading.BrokenBarrierError:
+        return  # another worker failed
+    except BaseException as e:
+        shared["error"] = e
+        barrier.abort()  # release the workers waiting for this one
 
 def bfs_parallel(start, goal, n, walls, get_edge_weight,
                  draw_cell, draw_edge, player_update,
-                 speed, stop_event, num_threads=4):
+                 speed, stop_event, num_threads=4, fast_exit=False, maze=None,
+                 workload=NO_WORK):
 
     t0 = time.time()
+    maze = snapshot_for(n, walls, get_edge_weight, maze)
+    adj, cells = maze.adj, maze.cells
+    s, t = maze.index(start), maze.index(goal)
 
-    q = Queue()
-    q.put(start)
-    visited = {start: None}
-
+    parent = [-1] * len(cells)  # -1: not reached yet
+    parent[s] = s
     threads = []
-    for _ in range(num_threads):
-        th = threading.Thread(target=worker, args=(q, visited, walls, n, draw_cell, stop_event))
-        th.daemon = True
-        th.start()
-        threads.append(th)
+
+    if fast_exit:
+        claims = {s: s}
+        shared = {"frontier": [s], "next": [[] for _ in range(num_threads)],
+                  "found": s == t, "done": s == t}
+
+        def advance():
+            frontier = [c for part in shared["next"] for c in part]
+            shared["frontier"] = frontier
+            shared["next"] = [[] for _ in range(num_threads)]
+            if shared["found"] or not frontier or stop_event.is_set():
+                shared["done"] = True
+
+        barrier = threading.Barrier(num_threads, action=advance)
+        if not shared["done"]:
+            for tid in range(num_threads):
+                th = threading.Thread(target=level_worker,
+                                      args=(tid, shared, claims, adj, cells, t, draw_cell,
+                                            stop_event, barrier, num_threads, workload))
+                th.daemon = True
+                th.start()
+                threads.append(th)
+    else:
+        q = deque([s])
+        cond = threading.Condition()
+        state = {"idle": 0, "done": False}
+        for _ in range(num_threads):
+            th = threading.Thread(target=worker,
+                                  args=(q, parent, adj, cells, draw_cell, stop_event,
+                                        cond, state, num_threads, workload))
+            th.daemon = True
+            th.start()
+            threads.append(th)
 
     for th in threads:
         th.join()
+    error = (shared if fast_exit else state).get("error")
+    if error is not None:
+        raise error
 
-    path = []
-    if goal in visited:
-        c = goal
-        while c:
-            path.append(c)
-            c = visited[c]
-        path.reverse()
+    if fast_exit:
+        for c, p in claims.items():
+            parent[c] = p
+    path = maze.trace(parent, s, t)
 
     return path, time.time() - t0
@@ -1,41 +1,36 @@
 import time
 from collections import deque
-from utils import neighbors
+from maze import snapshot_for
+from workload import NO_WORK
 
 def bfs_sequential(start, goal, n, walls, get_edge_weight,
                    draw_cell, draw_edge, player_update,
-                   speed, stop_event, num_threads=None):
+                   speed, stop_event, num_threads=None, maze=None, workload=NO_WORK):
 
     t0 = time.time()
+    maze = snapshot_for(n, walls, get_edge_weight, maze)
+    adj, cells = maze.adj, maze.cells
+    s, t = maze.index(start), maze.index(goal)
 
-    q = deque([start])
-    visited = {start: None}
+    q = deque([s])
+    parent = [-1] * len(cells)  # -1: not reached yet
+    parent[s] = s
 
     while q and not stop_event.is_set():
         curr = q.popleft()
 
-        # slow sequential version
-        time.sleep(0.001)
+        workload(curr)
 
-        draw_cell(curr, "#FB9070")
+        draw_cell(cells[curr], "#FB9070")
 
-        if curr == goal:
+        if curr == t:
             break
 
-        for nx in neighbors(curr, n):
-            if nx in walls: 
-                continue
-            if nx not in visited:
-                visited[nx] = curr
+        for nx, _ in adj[curr]:
+            if parent[nx] < 0:
+                parent[nx] = curr
                 q.append(nx)
 
-    # reconstruct path
-    path = []
-    if goal in visited:
-        c = goal
-        while c:
-            path.append(c)
-            c = visited[c]
-        path.reverse()
+    path = maze.trace(parent, s, t)
 
     return path, time.time() - t0
@@ -0,0 +1,136 @@
+import asyncio, heapq, time
+from collections import deque
+from maze import snapshot_for
+from workload import NO_WORK
+from .heuristics import make_heuristic
+
+# Cooperative (asyncio) versions of the solvers.
+#
+# Each solver is an async generator yielding (cells, path): cells is a batch of
+# newly expanded cells and path stays None until the last item, which carries
+# the final path ([] when none was found or the solve was stopped). The
+# "Simulated" variants expand num_workers frontier nodes per round, in the
+# order that many threads might pop them, but everything (the workload
+# included) still runs one cell at a time on the event loop: they show how a
+# parallel frontier explores, not how fast real threads would be, and are not
+# comparable with the threaded "Parallel" solvers.
+
+async def solve_steps(kind, start, goal, n, walls, get_edge_weight, stop_event,
+                      num_workers=1, batch_size=32, maze=None, workload=NO_WORK):
+    maze = snapshot_for(n, walls, get_edge_weight, maze)
+    adj, cells = maze.adj, maze.cells
+    s, t = maze.index(start), maze.index(goal)
+    parent = [-1] * len(cells)  # -1: not reached yet
+    parent[s] = s
+    g = [float("inf")] * len(cells)
+    g[s] = 0
+    order = 0
+
+    if kind == "bfs":
+        frontier = deque([s])
+        pop = frontier.popleft
+    elif kind == "dfs":
+        frontier = [s]
+        pop = frontier.pop
+    elif kind in ("dijkstra", "astar"):
+        frontier = [(0, 0, 0, s)]
+    else:
+        raise ValueError(f"unknown solver kind: {kind}")
+    h = make_heuristic("manhattan" if kind == "astar" else "zero", maze, goal)
+
+    found = s == t
+    batch = []
+    while frontier and not found and not stop_event.is_set():
+        rnd = []
+        while frontier and len(rnd) < num_workers:
+            if kind in ("bfs", "dfs"):
+                rnd.append(pop())
+            else:
+                _, _, cost, curr = heapq.heappop(frontier)
+                # skip stale heap entries
+                if cost > g[curr]:
+                    continue
+                rnd.append(curr)
+
+        for curr in rnd:
+            workload(curr)
+            batch.append(cells[curr])
+            if curr == t:
+                found = True
+                break
+            for nx, w in adj[curr]:
+                if kind in ("bfs", "dfs"):
+                    if parent[nx] < 0:
+                        parent[nx] = curr
+                        frontier.append(nx)
+                    continue
+                new_g = g[curr] + w
+                if new_g < g[nx]:
+                    g[nx] = new_g
+                    parent[nx] = curr
+                    f_new = new_g + h(nx)
+                    order += 1
+                    heapq.heappush(frontier, (f_new, order, new_g, nx))
+
+        if len(batch) >= batch_size:
+            yield batch, None
+            batch = []
+            await asyncio.sleep(0)
+
+    yield batch, (maze.trace(parent, s, t) if found else [])
+
+
+ASYNC_SOLVERS = {
+    ("BFS", "Sequential"): "bfs",
+    ("BFS", "Simulated"): "bfs",
+    ("DFS", "Sequential"): "dfs",
+    ("DFS", "Simulated"): "dfs",
+    ("Dijkstra", "Sequential"): "dijkstra",
+    ("Dijkstra", "Simulated"): "dijkstra",
+    ("A*", "Sequential"): "astar",
+    ("A*", "Simulated"): "astar",
+}
+
+
+def make_solver(algo, mode, start, goal, n, walls, get_edge_weight, stop_event,
+                num_threads=4, batch_size=32, maze=None, workload=NO_WORK):
+    workers = num_threads if mode == "Simulated" else 1
+    return solve_steps(ASYNC_SOLVERS[(algo, mode)], start, goal, n, walls, get_edge_weight,
+                       stop_event, num_workers=workers, batch_size=batch_size, maze=maze,
+                       workload=workload)
+
+
+async def race(solvers, stop_event, on_batch=None, delay=0):
+    """Interleave several solves on the running event loop.
+
+    solvers maps a name to an async generator from solve_steps/make_solver.
+    on_batch(name, cells, expanded, elapsed) is called after every batch.
+    Every solver gets one batch per turn (then sleeps `delay` seconds, for
+    animation); setting stop_event ends them all.
+    Returns {name: (path, elapsed_seconds, expanded_cells)}.
+    """
+    results = {}
+
+    async def drive(name, gen):
+        t0 = time.perf_counter()
+        expanded = 0
+        path = []
+        try:
+            async for cells, final in gen:
+                expanded += len(cells)
+                if on_batch is not None:
+                    on_batch(name, cells, expanded, time.perf_counter() - t0)
+                if final is not None:
+                    path = final
+                await asyncio.sleep(delay)
+        finally:
+            await gen.aclose()
+            results[name] = (path, time.perf_counter() - t0, expanded)
+
+    await asyncio.gather(*(drive(name, gen) for name, gen in solvers.items()))
+    return results
+
+
+def run_race(solvers, stop_event, on_batch=None, delay=0):
+    """Blocking entry point: runs race() on a fresh event loop."""
+    return asyncio.run(race(solvers, stop_event, on_batch, delay))
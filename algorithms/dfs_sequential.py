@@ -1,36 +1,36 @@
 # dfs_sequential.py
 import time
-from utils import neighbors
+from maze import snapshot_for
+from workload import NO_WORK
 
 def dfs_sequential(start, goal, n, walls, get_edge_weight,
                    draw_cell, draw_edge, player_update,
-                   speed, stop_event, num_threads=None):
+                   speed, stop_event, num_threads=None, maze=None, workload=NO_WORK):
 
     t0 = time.time()
-    stack = [start]
-    visited = {start: None}
+    maze = snapshot_for(n, walls, get_edge_weight, maze)
+    adj, cells = maze.adj, maze.cells
+    s, t = maze.index(start), maze.index(goal)
+
+    stack = [s]
+    parent = [-1] * len(cells)  # -1: not reached yet
+    parent[s] = s
 
     while stack and not stop_event.is_set():
         curr = stack.pop()
-        draw_cell(curr, "#FFC107")  # visited color
+        workload(curr)
+        draw_cell(cells[curr], "#FFC107")  # visited color
 
-        if curr == goal:
+        if curr == t:
             break
 
-        for nx in neighbors(curr, n):
-            if nx not in walls and nx not in visited:
-                visited[nx] = curr
+        for nx, _ in adj[curr]:
+            if parent[nx] < 0:
+                parent[nx] = curr
                 stack.append(nx)
-        time.sleep(speed)
 
     # build path
-    path = []
-    if goal in visited:
-        c = goal
-        while c:
-            path.append(c)
-            c = visited[c]
-        path.reverse()
+    path = maze.trace(parent, s, t)
 
     elapsed = time.time() - t0
 
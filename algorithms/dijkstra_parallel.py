@@ -1,6 +1,8 @@
-import time, heapq, threading
-from utils import neighbors
-from queue import PriorityQueue
+import time, threading
+from maze import snapshot_for
+from workload import NO_WORK
+from .batched import batched_search
+from .indexed_heap import IndexedHeap
 
 THREAD_COLORS = [
    "#ff8a65"
@@ -8,56 +10,72 @@ THREAD_COLORS = [
 
 def dijkstra_parallel(start, goal, n, walls, get_edge_weight,
                       draw_cell, draw_edge, player_update,
-                      speed, stop_event, num_threads=4):
+                      speed, stop_event, num_threads=4, maze=None, workload=NO_WORK, batch=0):
 
     t0 = time.time()
-    pq = PriorityQueue()
-    pq.put((0, start))
-    dist = {start: 0}
-    parent = {start: None}
+    maze = snapshot_for(n, walls, get_edge_weight, maze)
+    adj, cells = maze.adj, maze.cells
+    s, t = maze.index(start), maze.index(goal)
+
+    if batch:
+        # coordinator + process pool for the per-cell workload (see batched.py)
+        parent = batched_search(maze, s, t, lambda i: 0, lambda g, h: 0, draw_cell, THREAD_COLORS,
+                                stop_event, workload, num_threads, batch)
+        return maze.trace(parent, s, t), time.time() - t0
+
+    pq = IndexedHeap(len(cells))  # one entry per open cell, decrease-key in place
+    pq.push(s, 0)
+    dist = [float("inf")] * len(cells)
+    dist[s] = 0
+    parent = [-1] * len(cells)  # -1: not reached yet
+    parent[s] = s
     lock = threading.Lock()
+    queued = threading.Condition(lock)
+    state = {"idle": 0, "done": False}
 
     def worker(tid):
         color = THREAD_COLORS[tid % len(THREAD_COLORS)]
         while not stop_event.is_set():
-            try:
-                cost, curr = pq.get(timeout=0.1)
-            except:
-                return
+            with queued:
+                # idle-worker counter, as in bfs_parallel: the heap being empty
+                # only ends the search once no worker is still expanding
+                while not pq and not state["done"] and not stop_event.is_set():
+                    state["idle"] += 1
+                    if state["idle"] == num_threads:
+                        state["done"] = True
+                        queued.notify_all()
+                        break
+                    queued.wait(0.05)
+                    state["idle"] -= 1
+                if state["done"] or stop_event.is_set():
+                    return
+                cost, curr = pq.pop()
 
-            draw_cell(curr, color)
-            time.sleep(speed)
-            if curr == goal:
+            workload(curr)
+            draw_cell(cells[curr], color)
+            if curr == t:
                 stop_event.set()
                 return
 
-            for nx in neighbors(curr, n):
-                if nx in walls:
-                    continue
-                w = get_edge_weight(curr, nx)
+            for nx, w in adj[curr]:
                 new_cost = cost + w
                 with lock:
-                    if nx not in dist or new_cost < dist[nx]:
+                    if new_cost < dist[nx]:
                         dist[nx] = new_cost
                         parent[nx] = curr
-                        pq.put((new_cost, nx))
+                        pq.push(nx, new_cost)
+                        queued.notify()
                 
     threads = []
     for i in range(num_threads):
-        t = threading.Thread(target=worker, args=(i,), daemon=True)
-        t.start()
-        threads.append(t)
+        th = threading.Thread(target=worker, args=(i,), daemon=True)
+        th.start()
+        threads.append(th)
 
-    for t in threads:
-        t.join()
+    for th in threads:
+        th.join()
 
     # reconstruct path
-    path = []
-    if goal in parent:
-        c = goal
-        while c:
-            path.append(c)
-            c = parent[c]
-        path.reverse()
-
-    return path, time.time() - t0
\ No newline at end of file
+    path = maze.trace(parent, s, t)
+
+    return path, time.time() - t0
@@ -1,45 +1,68 @@
 import time, heapq
-from utils import neighbors
-from utils import heavy_work
+from maze import snapshot_for
+from workload import NO_WORK
+from .indexed_heap import IndexedHeap
 
 def dijkstra_sequential(start, goal, n, walls, get_edge_weight,
                         draw_cell, draw_edge, player_update,
-                        speed, stop_event, num_threads=None):
+                        speed, stop_event, num_threads=None, maze=None, workload=NO_WORK):
 
     t0 = time.time()
+    maze = snapshot_for(n, walls, get_edge_weight, maze)
+    adj, cells = maze.adj, maze.cells
+    s, t = maze.index(start), maze.index(goal)
 
-    pq = [(0, start)]
-    dist = {start: 0}
-    parent = {start: None}
+    pq = IndexedHeap(len(cells))  # one entry per open cell, decrease-key in place
+    pq.push(s, 0)
+    dist = [float("inf")] * len(cells)
+    dist[s] = 0
+    parent = [-1] * len(cells)  # -1: not reached yet
+    parent[s] = s
 
     while pq and not stop_event.is_set():
-        cost, curr = heapq.heappop(pq)
+        cost, curr = pq.pop()
 
-        heavy_work()  # 🔥 guarantees slow sequential execution
+        workload(curr)
 
-        draw_cell(curr, "#92F1CE")
+        draw_cell(cells[curr], "#92F1CE")
 
-        if curr == goal:
+        if curr == t:
             break
 
-        for nx in neighbors(curr, n):
-            if nx in walls:
-                continue
-
-            w = get_edge_weight(curr, nx)
+        for nx, w in adj[curr]:
             new_cost = cost + w
 
-            if nx not in dist or new_cost < dist[nx]:
+            if new_cost < dist[nx]:
                 dist[nx] = new_cost
                 parent[nx] = curr
-                heapq.heappush(pq, (new_cost, nx))
+                pq.push(nx, new_cost)
 
-    path = []
-    if goal in parent:
-        c = goal
-        while c:
-            path.append(c)
-            c = parent[c]
-        path.reverse()
+    path = maze.trace(parent, s, t)
 
     return path, time.time() - t0
+
+def distances(maze, source, reverse=False):
+    """Full single-source Dijkstra over a MazeSnapshot, no drawing or early exit.
+
+    dist[i] is the cost of source -> i, or of i -> source when reverse is set
+    (the step p -> u costs the weight of u, so the two differ); unreached
+    cells stay at inf.
+    """
+    adj, weights = maze.adj, maze.weights
+    pq = [(0, source)]
+    dist = [float("inf")] * len(adj)
+    dist[source] = 0
+
+    while pq:
+        cost, curr = heapq.heappop(pq)
+        if cost > dist[curr]:
+            continue
+
+        for nx, w in adj[curr]:
+            new_cost = cost + (weights[curr] if reverse else w)
+
+            if new_cost < dist[nx]:
+                dist[nx] = new_cost
+                heapq.heappush(pq, (new_cost, nx))
+
+    return dist
@@ -0,0 +1,220 @@
+"""Flow fields: one reverse search from a goal that routes any number of agents.
+
+cost[i] is the cost of the cheapest path from cell i to the goal (the sum
+of the weights of the cells entered), UNREACHABLE for walls and cut-off
+cells. direction[i] is the index into maze.DIRECTIONS of the step to take
+from i (NO_STEP at the goal and where cost is UNREACHABLE), so an agent
+moves in O(1) per step without searching.
+
+Weights are small integers (utils.generate_weights draws 1..9), so the
+field is built with Dial's bucketed Dijkstra: a ring of max_weight + 1
+buckets replaces the heap. flow_field_for() caches fields per
+(maze fingerprint, goal) and, when only a few cells differ from a cached
+field for the same goal, repairs that field instead of starting over.
+"""
+import heapq
+from array import array
+from collections import OrderedDict
+from maze import DIRECTIONS
+
+UNREACHABLE = -1
+NO_STEP = 255
+CACHE_SIZE = 8
+INCREMENTAL_LIMIT = 0.05  # repair when at most this fraction of cells changed
+
+_cache = OrderedDict()  # (fingerprint, goal) -> FlowField
+
+
+def _dial(maze, goal_index):
+    adj, weights = maze.adj, maze.weights
+    inf = float("inf")
+    dist = [inf] * len(adj)
+    if maze.blocked[goal_index]:
+        return dist
+    ring = max(weights) + 1
+    buckets = [[] for _ in range(ring)]
+    dist[goal_index] = 0
+    buckets[0].append(goal_index)
+    pending, d = 1, 0
+    while pending:
+        bucket = buckets[d % ring]
+        while bucket:
+            u = bucket.pop()
+            pending -= 1
+            if dist[u] != d:
+                continue  # stale entry
+            # reverse step: entering u from any neighbour costs u's weight
+            nd = d + weights[u]
+            for p, _ in adj[u]:
+                if nd < dist[p]:
+                    dist[p] = nd
+                    buckets[nd % ring].append(p)
+                    pending += 1
+        d += 1
+    return dist
+
+
+class FlowField:
+    """Cost-to-goal and next-step fields of one maze and goal."""
+
+    def __init__(self, maze, goal, dist, direction=None, dirty=None):
+        # with `direction` given, only the `dirty` cells get their step recomputed
+        self.n = maze.n
+        self.goal = tuple(goal)
+        self.fingerprint = maze.fingerprint()
+        self.cost = array("l", (UNREACHABLE if d == float("inf") else d for d in dist))
+        if direction is None:
+            self.direction = bytearray([NO_STEP]) * len(dist)
+            dirty = range(len(dist))
+        else:
+            self.direction = bytearray(direction)
+        self._set_directions(maze, dirty)
+
+    @classmethod
+    def build(cls, maze, goal):
+        return cls(maze, goal, _dial(maze, maze.index(goal)))
+
+    def _set_directions(self, maze, cells):
+        n, cost, weights, direction = self.n, self.cost, maze.weights, self.direction
+        g = maze.index(self.goal)
+        for i in cells:
+            direction[i] = NO_STEP
+            if i == g or cost[i] < 0:
+                continue
+            x, y = divmod(i, n)
+            for d, (dx, dy) in enumerate(DIRECTIONS):
+                nx, ny = x + dx, y + dy
+                if 0 <= nx < n and 0 <= ny < n:
+                    j = nx * n + ny
+                    if cost[j] >= 0 and not maze.blocked[j] and weights[j] + cost[j] == cost[i]:
+                        direction[i] = d
+                        break
+
+    def cost_at(self, pos):
+        """Cost from pos to the goal, or UNREACHABLE."""
+        return self.cost[pos[0] * self.n + pos[1]]
+
+    def next_step(self, pos):
+        """The cell to move to from pos, or None at the goal / when the goal is unreachable."""
+        d = self.direction[pos[0] * self.n + pos[1]]
+        if d == NO_STEP:
+            return None
+        dx, dy = DIRECTIONS[d]
+        return (pos[0] + dx, pos[1] + dy)
+
+    def step_all(self, positions):
+        """Advance every agent one step; agents at the goal or cut off stay put."""
+        return [self.next_step(p) or p for p in positions]
+
+    def route(self, pos):
+        """Cells from pos to the goal following the field ([] if unreachable)."""
+        if self.cost_at(pos) < 0:
+            return []
+        path = [tuple(pos)]
+        while (nxt := self.next_step(path[-1])) is not None:
+            path.append(nxt)
+        return path
+
+    def update(self, maze, changed):
+        """Field for `maze`, which differs from this field's maze only at the `changed` indices.
+
+        Cells whose route ran through a cell that got dearer (higher weight or
+        a new wall) are invalidated and refilled from their valid neighbours;
+        cheaper cells push improvements outwards. Only the affected region is
+        searched.
+        """
+        n, weights, adj = self.n, maze.weights, maze.adj
+        g = maze.index(self.goal)
+        if maze.blocked[g] or self.cost[g] < 0:
+            # the goal is walled in, or was: nothing of the old field carries over
+            return FlowField.build(maze, self.goal)
+        inf = float("inf")
+        dist = [inf if c < 0 else c for c in self.cost]
+        changed = set(changed)
+
+        # children in the old next-step tree
+        children = {}
+        for i, d in enumerate(self.direction):
+            if d != NO_STEP:
+                dx, dy = DIRECTIONS[d]
+                children.setdefault(i + dx * n + dy, []).append(i)
+
+        # invalidate everything whose old route entered a changed cell
+        stack = []
+        for c in changed:
+            stack.extend(children.get(c, ()))
+            if maze.blocked[c]:
+                stack.append(c)
+        invalid = set()
+        while stack:
+            i = stack.pop()
+            if i not in invalid:
+                invalid.add(i)
+                stack.extend(children.get(i, ()))
+        for i in invalid:
+            dist[i] = inf
+
+        # seeds: invalid or reopened cells take the best valid neighbour,
+        # changed cells re-offer themselves to their neighbours
+        pq = []
+        for i in invalid | {c for c in changed if not maze.blocked[c]}:
+            if maze.blocked[i]:
+                dist[i] = inf
+                continue
+            for j, w in adj[i]:
+                if j not in invalid and dist[j] + w < dist[i]:
+                    dist[i] = dist[j] + w
+            if dist[i] < inf:
+                heapq.heappush(pq, (dist[i], i))
+        for c in changed:
+            if not maze.blocked[c] and dist[c] < inf:
+                heapq.heappush(pq, (dist[c], c))
+
+        touched = set(invalid) | changed
+        while pq:
+            d, u = heapq.heappop(pq)
+            if d > dist[u]:
+                continue
+            nd = d + weights[u]
+            for p, _ in adj[u]:
+                if nd < dist[p]:
+                    dist[p] = nd
+                    touched.add(p)
+                    heapq.heappush(pq, (nd, p))
+
+        # a cell's best step can only change if it or a neighbour changed
+        dirty = set(touched)
+        for i in touched:
+            dirty.update(j for j, _ in adj[i])
+        return FlowField(maze, self.goal, dist, self.direction, dirty)
+
+
+def _changed_cells(old, new):
+    return [i for i, (a, b, wa, wb) in enumerate(zip(old.blocked, new.blocked, old.weights, new.weights))
+            if a != b or wa != wb]
+
+
+def flow_field_for(maze, goal, previous=None):
+    """Cached FlowField of (maze, goal).
+
+    On a cache miss, `previous` (the MazeSnapshot of an earlier field for
+    the same goal, if the caller has one) lets a field be repaired instead
+    of rebuilt when only a few cells differ.
+    """
+    goal = tuple(goal)
+    key = (maze.fingerprint(), goal)
+    field = _cache.get(key)
+    if field is not None:
+        _cache.move_to_end(key)
+        return field
+    base = _cache.get((previous.fingerprint(), goal)) if previous is not None else None
+    if base is not None and previous.n == maze.n:
+        changed = _changed_cells(previous, maze)
+        if len(changed) <= INCREMENTAL_LIMIT * len(maze.adj):
+            field = base.update(maze, changed)
+    if field is None:
+        field = FlowField.build(maze, goal)
+    _cache[key] = field
+    if len(_cache) > CACHE_SIZE:
+        _cache.popitem(last=False)
+    return field
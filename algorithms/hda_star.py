@@ -0,0 +1,206 @@
+"""Hash-distributed A* (HDA*) over worker processes.
+
+Every cell is owned by one worker, chosen by hashing its index. A worker
+keeps g, parent and an open list for its own cells only; a successor owned
+by someone else is batched and sent to the owner's inbox. The calling
+thread acts as coordinator: it draws expanded cells, broadcasts the best
+goal cost found so far (workers prune anything with f >= that bound) and
+detects termination.
+
+A worker is idle when its inbox is empty and no open entry has f below
+the bound. The search is over when every worker is idle and no node
+message is in flight. The coordinator checks this with probe waves
+(Mattern's four-counter method): each worker answers with its idle flag
+and its counts of node messages sent and received, and termination is
+declared only after two consecutive waves that are all idle, balanced and
+equal. Then no cell with f below the goal cost is left anywhere, so with an
+admissible heuristic the goal cost is optimal.
+"""
+import time, heapq, queue
+import multiprocessing as mp
+from maze import snapshot_for
+from workload import NO_WORK
+from .heuristics import make_heuristic
+
+THREAD_COLORS = [
+    "#ffd54f", "#4fc3f7", "#ce93d8", "#80cbc4",
+    "#ffab91", "#a5d6a7", "#f48fb1", "#bcaaa4",
+    "#9fa8da", "#ffcc80", "#b39ddb", "#ff8a65"
+]
+
+EXPAND_BATCH = 64    # expansions between inbox checks
+IDLE_POLL = 0.005    # seconds a worker with nothing to do waits on its inbox
+PROBE_DELAY = 0.002  # seconds between termination probe waves
+
+
+def owner(i, num_workers):
+    # multiplicative hash, so neighbouring cells land on different workers
+    return ((i * 2654435761) & 0xFFFFFFFF) % num_workers
+
+
+def _worker(wid, maze, s, t, goal, heuristic, landmarks, workload, inboxes, control):
+    num_workers = len(inboxes)
+    h = make_heuristic(heuristic, maze, goal, landmarks)
+    adj = maze.adj
+    inbox = inboxes[wid]
+    inf = float("inf")
+    g, parent, open_ = {}, {}, []
+    bound = inf
+    sent = received = 0
+    if owner(s, num_workers) == wid:
+        g[s] = 0
+        parent[s] = s
+        open_.append((h(s), 0, s))
+
+    def relax(i, gi, pi):
+        if gi < g.get(i, inf):
+            g[i] = gi
+            parent[i] = pi
+            heapq.heappush(open_, (gi + h(i), -gi, i))
+
+    while True:
+        busy = open_ and open_[0][0] < bound
+        try:
+            msg = inbox.get_nowait() if busy else inbox.get(timeout=IDLE_POLL)
+        except queue.Empty:
+            msg = None
+        while msg is not None:
+            kind = msg[0]
+            if kind == "nodes":
+                received += 1
+                for i, gi, pi in msg[1]:
+                    relax(i, gi, pi)
+            elif kind == "bound":
+                bound = min(bound, msg[1])
+            elif kind == "probe":
+                idle = not (open_ and open_[0][0] < bound)
+                control.put(("probe", wid, msg[1], idle, sent, received))
+            elif kind == "stop":
+                for q in inboxes:
+                    q.cancel_join_thread()  # undelivered node messages no longer matter
+                control.put(("parents", wid, parent))
+                return
+            try:
+                msg = inbox.get_nowait()
+            except queue.Empty:
+                msg = None
+
+        outbox = [[] for _ in range(num_workers)]
+        expanded = []
+        while open_ and open_[0][0] < bound and len(expanded) < EXPAND_BATCH:
+            f, neg_g, curr = heapq.heappop(open_)
+            gc = -neg_g
+            if gc > g[curr]:
+                continue  # stale entry
+            workload(curr)
+            expanded.append(curr)
+            if curr == t:
+                bound = gc
+                control.put(("goal", gc))
+                continue
+            for nx, w in adj[curr]:
+                gn = gc + w
+                if gn + h(nx) >= bound:
+                    continue
+                o = owner(nx, num_workers)
+                if o == wid:
+                    relax(nx, gn, curr)
+                else:
+                    outbox[o].append((nx, gn, curr))
+        for o, items in enumerate(outbox):
+            if items:
+                inboxes[o].put(("nodes", items))
+                sent += 1
+        if expanded:
+            control.put(("expanded", wid, expanded))
+
+
+def hda_star(start, goal, n, walls, get_edge_weight,
+             draw_cell, draw_edge, player_update,
+             speed, stop_event, num_threads=4, maze=None,
+             heuristic="manhattan", landmarks=None, workload=NO_WORK):
+
+    t0 = time.time()
+    maze = snapshot_for(n, walls, get_edge_weight, maze)
+    cells = maze.cells
+    s, t = maze.index(start), maze.index(goal)
+    num_workers = max(1, num_threads)
+
+    inboxes = [mp.Queue() for _ in range(num_workers)]
+    control = mp.Queue()
+    procs = [mp.Process(target=_worker, daemon=True,
+                        args=(wid, maze, s, t, goal, heuristic, landmarks, workload, inboxes, control))
+             for wid in range(num_workers)]
+    for p in procs:
+        p.start()
+
+    def broadcast(msg):
+        for q in inboxes:
+            q.put(msg)
+
+    def crashed(wids):
+        # workers only exit cleanly (0) after sending their parents on "stop"
+        return any(procs[w].exitcode not in (None, 0) for w in wids)
+
+    best = float("inf")
+    failed = False
+    wave, replies, last_totals = 0, [], None
+    broadcast(("probe", wave))
+    while not stop_event.is_set():
+        try:
+            msg = control.get(timeout=IDLE_POLL)
+        except queue.Empty:
+            if crashed(range(num_workers)):
+                failed = True  # the dead worker's cells can no longer be searched
+                break
+            continue
+        kind = msg[0]
+        if kind == "expanded":
+            color = THREAD_COLORS[msg[1] % len(THREAD_COLORS)]
+            for i in msg[2]:
+                draw_cell(cells[i], color)
+        elif kind == "goal":
+            if msg[1] < best:
+                best = msg[1]
+                broadcast(("bound", best))
+        elif kind == "probe" and msg[2] == wave:
+            replies.append(msg[3:])
+            if len(replies) == num_workers:
+                idle = all(r[0] for r in replies)
+                totals = (sum(r[1] for r in replies), sum(r[2] for r in replies))
+                if idle and totals[0] == totals[1] and totals == last_totals:
+                    break
+                last_totals = totals if idle and totals[0] == totals[1] else None
+                wave, replies = wave + 1, []
+                time.sleep(PROBE_DELAY)
+                broadcast(("probe", wave))
+
+    broadcast(("stop",))
+    parent = [-1] * len(cells)  # -1: not reached yet
+    pending = set(range(num_workers))
+    while pending:
+        try:
+            msg = control.get(timeout=IDLE_POLL)
+        except queue.Empty:
+            if crashed(pending):
+                failed = True
+                break
+            continue
+        if msg[0] == "parents":
+            for i, p in msg[2].items():
+                parent[i] = p
+            pending.discard(msg[1])
+    for p in procs:
+        if failed and p.is_alive():
+            # a survivor may be stuck flushing its parents into `control`,
+            # which nobody reads any more
+            p.terminate()
+        p.join()
+    control.cancel_join_thread()
+    for q in inboxes:
+        q.cancel_join_thread()
+
+    found = best < float("inf") and not failed and not stop_event.is_set()
+    path = maze.trace(parent, s, t) if found else []
+
+    return path, time.time() - t0
@@ -0,0 +1,71 @@
+"""A* heuristics and open-list tie-breaking.
+
+Every heuristic is a lower bound on the remaining cost when moves are
+4-connected and each step costs the weight of the cell entered, so A*
+stays optimal with epsilon=1. A larger epsilon (weighted A*) expands fewer
+cells and returns a path costing at most epsilon times the optimum.
+
+    "manhattan" - |dx| + |dy| steps times the cheapest step; the tightest
+                  geometric bound for 4-connected moves, no sqrt
+    "euclidean" - straight-line distance times the cheapest step (the
+                  original A* heuristic; weaker than manhattan)
+    "alt"       - landmark triangle bounds (needs a Landmarks table,
+                  see algorithms/landmarks.py), never weaker than manhattan
+                  when combined with it
+    "zero"      - no estimate, A* degenerates to Dijkstra
+"""
+import math
+
+HEURISTICS = ("manhattan", "euclidean", "alt", "zero")
+
+# second element of the IndexedHeap key (f, tie); among equal f the smallest
+# tie is expanded first
+#   "none"   - tie is always 0: equal keys leave the order to the heap (no
+#              stable rule, whichever entry the sift puts on top)
+#   "high_g" - prefer the deeper entry, which is closer to the goal
+#   "low_h"  - prefer the entry with the smaller estimate
+TIE_BREAKS = ("high_g", "low_h", "none")
+
+
+def make_heuristic(name, maze, goal, landmarks=None):
+    """h(i): lower bound on the cost from cell index i to goal (x, y)."""
+    if name not in HEURISTICS:
+        raise ValueError(f"unknown heuristic: {name}")
+    cells = maze.cells
+    gx, gy = goal
+    step = maze.min_weight
+
+    if name == "zero":
+        return lambda i: 0
+    if name == "euclidean":
+        def h(i):
+            x, y = cells[i]
+            return step * math.sqrt((x - gx) ** 2 + (y - gy) ** 2)
+        return h
+
+    def manhattan(i):
+        x, y = cells[i]
+        return step * (abs(x - gx) + abs(y - gy))
+
+    if name == "manhattan":
+        return manhattan
+    if landmarks is None:
+        raise ValueError("the alt heuristic needs a landmarks table")
+    # a ReducedMaze keeps its grid maze as `source`; the tables index grid cells
+    source = getattr(maze, "source", maze)
+    bound = landmarks.bound(source.index(goal))
+    if source is not maze:
+        grid = maze.grid
+        return lambda i: max(bound(grid[i]), manhattan(i))
+    return lambda i: max(bound(i), manhattan(i))
+
+
+def tie_key(policy):
+    """tie(g, h) -> second element of the heap key for the given policy."""
+    if policy == "high_g":
+        return lambda g, h: -g
+    if policy == "low_h":
+        return lambda g, h: h
+    if policy == "none":
+        return lambda g, h: 0
+    raise ValueError(f"unknown tie-breaking policy: {policy}")
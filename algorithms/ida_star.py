@@ -0,0 +1,86 @@
+"""IDA*: iterative-deepening A* in memory proportional to the path length.
+
+Each iteration is a depth-first search that cuts off at f = g + h > bound;
+the next bound is the smallest f that was cut off. Only the current path is
+kept, plus a fixed-size transposition table: a direct-mapped array of
+table_size slots remembering the cheapest g a cell was reached with, so
+transpositions reached no more cheaply are not searched again. The table
+never grows, so memory stays within O(path length + table_size) however
+large the maze is.
+"""
+import time
+from array import array
+from maze import snapshot_for
+from workload import NO_WORK
+from .heuristics import make_heuristic
+
+DEFAULT_TABLE_SIZE = 1 << 16
+
+
+def ida_star(start, goal, n, walls, get_edge_weight,
+             draw_cell, draw_edge, player_update,
+             speed, stop_event, num_threads=None, maze=None,
+             heuristic="manhattan", landmarks=None, workload=NO_WORK,
+             table_size=DEFAULT_TABLE_SIZE):
+
+    t0 = time.time()
+    maze = snapshot_for(n, walls, get_edge_weight, maze)
+    adj, cells = maze.adj, maze.cells
+    s, t = maze.index(start), maze.index(goal)
+    h = make_heuristic(heuristic, maze, goal, landmarks)
+    inf = float("inf")
+
+    # slot = cell % table_size; a slot holds the cell, its best g and the
+    # iteration that stored it
+    size = max(1, table_size)
+    tt_cell = array("l", [-1]) * size
+    tt_g = array("d", [0.0]) * size
+    tt_iter = array("l", [0]) * size
+
+    bound, iteration = h(s), 0
+    while not stop_event.is_set():
+        iteration += 1
+        next_bound = inf
+        path, on_path = [s], {s}
+        # per level: g of the path cell and its successors not tried yet
+        g_stack = [0]
+        todo = [sorted(adj[s], key=lambda e: h(e[0]), reverse=True)]
+        workload(s)
+        draw_cell(cells[s], "#F8C471")
+        found = s == t
+        while todo and not found and not stop_event.is_set():
+            if not todo[-1]:
+                on_path.discard(path.pop())
+                g_stack.pop()
+                todo.pop()
+                continue
+            nx, w = todo[-1].pop()
+            if nx in on_path:
+                continue
+            g = g_stack[-1] + w
+            f = g + h(nx)
+            if f > bound:
+                next_bound = min(next_bound, f)
+                continue
+            slot = nx % size
+            if tt_cell[slot] == nx and (g > tt_g[slot] or (g == tt_g[slot] and tt_iter[slot] == iteration)):
+                continue  # reached before at least as cheaply
+            tt_cell[slot], tt_g[slot], tt_iter[slot] = nx, g, iteration
+            workload(nx)
+            draw_cell(cells[nx], "#F8C471")
+            path.append(nx)
+            on_path.add(nx)
+            g_stack.append(g)
+            if nx == t:
+                found = True
+                break
+            todo.append(sorted(adj[nx], key=lambda e: h(e[0]), reverse=True))
+        if found:
+            parent = dict(zip(path[1:], path))  # links along the path only
+            parent[s] = s
+            return maze.trace(parent, s, t), time.time() - t0
+        if next_bound == inf:
+            break  # nothing was cut off: the goal is unreachable
+        bound = next_bound
+
+    return [], time.time() - t0
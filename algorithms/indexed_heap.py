@@ -0,0 +1,75 @@
+"""Binary min-heap over cell indexes with decrease-key.
+
+A cell is queued at most once: pushing a queued cell with a lower key moves
+it up in place instead of adding a duplicate, so the heap never holds more
+entries than there are open cells and a popped entry is never stale.
+"""
+from array import array
+
+
+class IndexedHeap:
+
+    def __init__(self, size):
+        self.items = []                      # cells in heap order
+        self.keys = [None] * size            # cell -> key while queued
+        self.pos = array("l", [-1]) * size   # cell -> slot in items, -1: not queued
+
+    def __len__(self):
+        return len(self.items)
+
+    def __contains__(self, i):
+        return self.pos[i] >= 0
+
+    def push(self, i, key):
+        """Queue cell i with key, or lower its key; False if already queued at most as high."""
+        p = self.pos[i]
+        if p < 0:
+            p = len(self.items)
+            self.items.append(i)
+        elif not key < self.keys[i]:
+            return False
+        self.keys[i] = key
+        self._sift_up(p, i, key)
+        return True
+
+    def pop(self):
+        """(key, cell) with the smallest key."""
+        items, keys = self.items, self.keys
+        top = items[0]
+        last = items.pop()
+        if items:
+            self._sift_down(0, last, keys[last])
+        self.pos[top] = -1
+        key, keys[top] = keys[top], None
+        return key, top
+
+    def _sift_up(self, p, i, key):
+        items, keys, pos = self.items, self.keys, self.pos
+        while p:
+            up = (p - 1) >> 1
+            j = items[up]
+            if not key < keys[j]:
+                break
+            items[p] = j
+            pos[j] = p
+            p = up
+        items[p] = i
+        pos[i] = p
+
+    def _sift_down(self, p, i, key):
+        items, keys, pos = self.items, self.keys, self.pos
+        size = len(items)
+        while True:
+            c = 2 * p + 1
+            if c >= size:
+                break
+            if c + 1 < size and keys[items[c + 1]] < keys[items[c]]:
+                c += 1
+            j = items[c]
+            if not keys[j] < key:
+                break
+            items[p] = j
+            pos[j] = p
+            p = c
+        items[p] = i
+        pos[i] = p
@@ -0,0 +1,140 @@
+"""Landmark distance tables for the ALT ("A*, landmarks, triangle") heuristic.
+
+For a landmark L, `dist_from[k][i]` is the cost of the cheapest path L -> i
+and `dist_to[k][i]` the cost of i -> L. Step costs depend on the cell
+entered, so the two differ. For any cell v and goal t the triangle
+inequality gives
+
+    d(v, t) >= d(L, t) - d(L, v)    and    d(v, t) >= d(v, L) - d(t, L)
+
+and the best of these over all landmarks is an admissible, consistent bound.
+
+Landmarks are picked farthest-point first (each new one is the open cell
+farthest, in steps, from those already chosen), then the 2k Dijkstra runs
+are spread over worker processes. Tables are stored as uint16 arrays when
+every distance fits, uint32 otherwise, with the type's maximum as the
+"unreachable" marker.
+"""
+from array import array
+from collections import deque, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from .dijkstra_sequential import distances
+
+DEFAULT_K = 4
+CACHE_SIZE = 8
+
+# maze shared by every task of a worker process (set once by _init_worker)
+_maze = None
+_cache = OrderedDict()  # (fingerprint, k) -> Landmarks
+
+
+def _init_worker(maze):
+    global _maze
+    _maze = maze
+
+
+def _typecode(maze):
+    # no shortest path can cost more than every cell weight summed
+    return "H" if sum(maze.weights) < 0xFFFF else "I"
+
+
+def _table(job):
+    source, reverse, typecode = job
+    far = (1 << (8 * array(typecode).itemsize)) - 1
+    dist = distances(_maze, source, reverse)
+    return array(typecode, (far if d == float("inf") else d for d in dist))
+
+
+def _hops(maze, source):
+    adj = maze.adj
+    hops = [-1] * len(adj)
+    hops[source] = 0
+    q = deque([source])
+    while q:
+        curr = q.popleft()
+        for nx, _ in adj[curr]:
+            if hops[nx] < 0:
+                hops[nx] = hops[curr] + 1
+                q.append(nx)
+    return hops
+
+
+def farthest_sources(maze, k, anchor=None):
+    """k landmark cells spread over the component of `anchor` (default: first open cell)."""
+    if anchor is None:
+        anchor = next((i for i, b in enumerate(maze.blocked) if not b), None)
+        if anchor is None:
+            return []
+    # min step count to the chosen landmarks; starts as the distance to the anchor
+    nearest = _hops(maze, anchor)
+    sources = []
+    while len(sources) < k:
+        best = max(range(len(nearest)), key=nearest.__getitem__)
+        if nearest[best] <= 0:
+            break  # component exhausted
+        sources.append(best)
+        for i, d in enumerate(_hops(maze, best)):
+            if 0 <= d < nearest[i]:
+                nearest[i] = d
+    return sources
+
+
+class Landmarks:
+    """Distance tables from and to a few landmark cells of one maze."""
+
+    def __init__(self, fingerprint, sources, dist_from, dist_to):
+        self.fingerprint = fingerprint
+        self.sources = sources
+        self.dist_from = dist_from
+        self.dist_to = dist_to
+
+    @classmethod
+    def build(cls, maze, k=DEFAULT_K, sources=None, num_workers=4):
+        if sources is None:
+            sources = farthest_sources(maze, k)
+        typecode = _typecode(maze)
+        jobs = [(s, reverse, typecode) for reverse in (False, True) for s in sources]
+        if num_workers <= 1 or len(jobs) <= 1:
+            _init_worker(maze)
+            tables = [_table(job) for job in jobs]
+        else:
+            with ProcessPoolExecutor(max_workers=num_workers, initializer=_init_worker,
+                                     initargs=(maze,)) as ex:
+                tables = list(ex.map(_table, jobs))
+        k = len(sources)
+        return cls(maze.fingerprint(), list(sources), tables[:k], tables[k:])
+
+    def bound(self, t):
+        """Lower bound function h(i) on the cost of i -> t."""
+        far = (1 << (8 * self.dist_from[0].itemsize)) - 1 if self.dist_from else 0
+        # only landmarks that reach t (and are reached from it) carry information
+        rows = [(fr, to, fr[t], to[t]) for fr, to in zip(self.dist_from, self.dist_to)
+                if fr[t] != far and to[t] != far]
+
+        def h(i):
+            best = 0
+            for fr, to, fr_t, to_t in rows:
+                fr_i, to_i = fr[i], to[i]
+                if fr_i == far or to_i == far:
+                    continue  # different component: A* never reaches i anyway
+                d = fr_t - fr_i
+                if d > best:
+                    best = d
+                d = to_i - to_t
+                if d > best:
+                    best = d
+            return best
+        return h
+
+
+def landmarks_for(maze, k=DEFAULT_K, num_workers=4):
+    """Landmarks.build with a small per-maze cache (keyed by fingerprint)."""
+    key = (maze.fingerprint(), k)
+    lm = _cache.get(key)
+    if lm is None:
+        lm = _cache[key] = Landmarks.build(maze, k, num_workers=num_workers)
+        if len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+    else:
+        _cache.move_to_end(key)
+    return lm
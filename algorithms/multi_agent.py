@@ -0,0 +1,338 @@
+"""Multi-agent path finding (MAPF) on one maze.
+
+Agents move in lock-step: at every time step each agent moves to an open
+neighbour or waits. Two agents may not share a cell at the same time
+(vertex conflict) or swap cells in one step (edge conflict), and an agent
+that has arrived stays on its goal. Steps take unit time; cell weights are
+ignored.
+
+Two planners:
+  "prioritized" - agents are planned in priority order against a space-time
+                  reservation table of the agents before them. Each round
+                  plans every pending agent in parallel against the table as
+                  it was when the round started, then commits the plans in
+                  priority order; a plan that clashes with one committed
+                  earlier in the round is planned again next round. The first
+                  pending agent always commits, so each round makes progress.
+  "cbs"         - Conflict-Based Search, optimal in sum of costs. The high
+                  level splits on the first conflict, constraining one agent
+                  in each child; the two children's low-level searches run in
+                  parallel. Exponential in the worst case, so after max_nodes
+                  high-level nodes it falls back to prioritized planning.
+
+Low-level searches are space-time A* with the exact BFS distance to the
+goal as heuristic, run in a process pool that holds the maze. Pool
+processes also keep their own copy of the prioritized reservation table:
+each round ships only the paths committed since the oldest copy any of
+them holds, not the whole table.
+"""
+import os, time, heapq, random, threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+METHODS = ("prioritized", "cbs")
+
+# maze, per-cell moves (wait first) and goal distance fields of a worker
+# process (set by _init_worker)
+_maze = None
+_moves = ()
+_dists = {}
+# the worker's reservation table: (run token, paths applied, vertex, edges, rest, last_at)
+_table = None
+
+
+def _init_worker(maze):
+    global _maze, _moves, _dists, _table
+    _maze = maze
+    _moves = tuple((i,) + tuple(j for j, _ in row) for i, row in enumerate(maze.adj))
+    _dists = {}
+    _table = None
+
+
+def _goal_distances(t):
+    dist = _dists.get(t)
+    if dist is None:
+        adj = _maze.adj
+        dist = [-1] * len(adj)
+        dist[t] = 0
+        q = deque([t])
+        while q:
+            curr = q.popleft()
+            for nx, _ in adj[curr]:
+                if dist[nx] < 0:
+                    dist[nx] = dist[curr] + 1
+                    q.append(nx)
+        _dists[t] = dist
+    return dist
+
+
+def space_time_astar(s, t, vertex, edges, rest, last_at, horizon, settle=None):
+    """Cells occupied at time 0, 1, ... on the way from s to t, or None.
+
+    vertex holds forbidden (cell, time) pairs, edges forbidden moves
+    (from, to, departure time), rest the cells occupied for good from some
+    time on, and last_at the last reserved time of each cell; the agent may
+    only stop on t once nobody else passes through it any more.
+
+    From `settle` (one past the last reserved time) on nothing changes any
+    more, so a cell reached then is only searched again if reached earlier:
+    an agent that cannot get through explores about cells * settle states
+    instead of cells * horizon.
+    """
+    moves = _moves
+    dist = _goal_distances(t)
+    if dist[s] < 0 or t in rest or (s, 0) in vertex:
+        return None
+    if settle is None:
+        settle = max(last_at.values(), default=-1) + 1
+    earliest = last_at.get(t, -1) + 1
+    reached = {}  # cell -> earliest time it was reached at or after settle
+    # the agent cannot finish before `earliest` either, so f is at least that
+    open_ = [(max(dist[s], earliest), 0, s)]
+    parent = {(s, 0): None}
+    while open_:
+        _, neg_time, curr = heapq.heappop(open_)
+        now = -neg_time
+        if curr == t and now >= earliest:
+            path, key = [], (curr, now)
+            while key is not None:
+                path.append(key[0])
+                key = parent[key]
+            path.reverse()
+            return path
+        if now >= horizon:
+            continue
+        nt = now + 1
+        if now >= settle and reached.get(curr, now) < now:
+            continue  # reached earlier since this entry was pushed
+        for nx in moves[curr]:
+            if (nx, nt) in parent or (nx, nt) in vertex or (curr, nx, now) in edges:
+                continue
+            if nx in rest and nt >= rest[nx]:
+                continue
+            if nt >= settle:
+                if reached.get(nx, nt + 1) <= nt:
+                    continue
+                reached[nx] = nt
+            parent[(nx, nt)] = (curr, now)
+            # deeper entries first among equal f
+            f = nt + dist[nx]
+            heapq.heappush(open_, (f if f > earliest else earliest, -nt, nx))
+    return None
+
+
+def _plan_batch(job):
+    global _table
+    (token, base, committed, horizon), agents = job
+    if _table is None or _table[0] != token:
+        _table = (token, [0], set(), set(), {}, {})
+    _, applied, vertex, edges, rest, last_at = _table
+    # committed holds the paths from number `base` on; apply the ones not seen yet
+    for path in committed[applied[0] - base:]:
+        _reserve(path, vertex, edges, rest, last_at)
+    applied[0] = base + len(committed)
+    settle = max(last_at.values(), default=-1) + 1
+    return os.getpid(), applied[0], [(k, space_time_astar(s, t, vertex, edges, rest, last_at, horizon, settle))
+                                     for k, s, t in agents]
+
+
+def _plan_constrained(job):
+    k, s, t, vertex, edges, horizon = job
+    last_at = {}
+    for c, when in vertex:
+        if when > last_at.get(c, -1):
+            last_at[c] = when
+    settle = max([when + 1 for _, when in vertex] + [when + 1 for _, _, when in edges], default=0)
+    return k, space_time_astar(s, t, vertex, edges, {}, last_at, horizon, settle)
+
+
+def _clashes(path, vertex, edges, rest, last_at):
+    for when, c in enumerate(path):
+        if (c, when) in vertex or (c in rest and when >= rest[c]):
+            return True
+        if when and (path[when - 1], c, when - 1) in edges:
+            return True
+    goal = path[-1]
+    return goal in rest or last_at.get(goal, -1) >= len(path) - 1
+
+
+def _reserve(path, vertex, edges, rest, last_at):
+    for when, c in enumerate(path):
+        vertex.add((c, when))
+        if when > last_at.get(c, -1):
+            last_at[c] = when
+        if when:
+            # forbid the opposite move in the same step (a swap)
+            edges.add((c, path[when - 1], when - 1))
+    rest[path[-1]] = len(path) - 1
+
+
+def _prioritized(run, agents, num_cells, num_workers, stop_event, pool_size=1):
+    vertex, edges, rest, last_at = set(), set(), {}, {}
+    paths = [None] * len(agents)
+    pending = list(range(len(agents)))
+    rounds = 0
+    token = random.getrandbits(64)  # tells the workers' tables of this run from older ones
+    committed = []  # paths in commit order; the workers' tables replay them
+    known = {}      # pid -> paths its table holds
+    while pending and not stop_event.is_set():
+        rounds += 1
+        horizon = max(last_at.values(), default=0) + num_cells
+        # every process holds at least `base` paths once all have reported back
+        base = min(known.values()) if len(known) >= pool_size else 0
+        table = (token, base, committed[base:], horizon)
+        # round-robin chunks keep early (likely to commit) agents spread out
+        chunks = [[(k, *agents[k]) for k in pending[i::num_workers]] for i in range(num_workers)]
+        plans = {}
+        for pid, applied, result in run(_plan_batch, [(table, c) for c in chunks if c]):
+            known[pid] = applied
+            plans.update(result)
+        retry = []
+        for k in pending:
+            path = plans[k]
+            if path is None:
+                continue  # no path even against the smaller table: give up on k
+            if _clashes(path, vertex, edges, rest, last_at):
+                retry.append(k)
+            else:
+                _reserve(path, vertex, edges, rest, last_at)
+                committed.append(path)
+                paths[k] = path
+        pending = retry
+    return paths, {"rounds": rounds}
+
+
+def first_conflict(paths):
+    """(a, b, vertex_or_None, edge_or_None) for the earliest conflict, or None.
+
+    vertex is (cell, time); edge is (from, to, departure) as agent b moved.
+    """
+    live = [(k, p) for k, p in enumerate(paths) if p]
+    horizon = max((len(p) for _, p in live), default=0)
+    for when in range(horizon):
+        seen, moves = {}, {}
+        for k, p in live:
+            c = p[min(when, len(p) - 1)]
+            if c in seen:
+                return seen[c], k, (c, when), None
+            seen[c] = k
+            if when:
+                prev = p[min(when - 1, len(p) - 1)]
+                if prev != c:
+                    other = moves.get((c, prev))
+                    if other is not None:
+                        return other, k, None, (prev, c, when - 1)
+                    moves[(prev, c)] = k
+    return None
+
+
+def _cbs(run, agents, num_cells, max_nodes, stop_event):
+    horizon = num_cells
+    root = [path for _, path in run(_plan_constrained,
+                                    [(k, s, t, frozenset(), frozenset(), horizon)
+                                     for k, (s, t) in enumerate(agents)])]
+    if any(p is None for p in root):
+        return None, {"nodes": 1}
+    order = 0
+    heap = [(sum(len(p) - 1 for p in root), order, {}, root)]
+    nodes = 0
+    while heap and nodes < max_nodes and not stop_event.is_set():
+        cost, _, constraints, paths = heapq.heappop(heap)
+        nodes += 1
+        conflict = first_conflict(paths)
+        if conflict is None:
+            return paths, {"nodes": nodes}
+        a, b, v, e = conflict
+        jobs = []
+        for k in (a, b):
+            vs, es = constraints.get(k, (frozenset(), frozenset()))
+            if v is not None:
+                vs = vs | {v}
+            elif k == b:
+                es = es | {e}
+            else:
+                # a made the opposite move of e at the same step
+                es = es | {(e[1], e[0], e[2])}
+            s, t = agents[k]
+            jobs.append((k, s, t, vs, es, horizon + max(len(p) for p in paths)))
+        for k, path in run(_plan_constrained, jobs):
+            if path is None:
+                continue
+            child = dict(constraints)
+            job = jobs[0] if jobs[0][0] == k else jobs[1]
+            child[k] = (job[3], job[4])
+            child_paths = list(paths)
+            child_paths[k] = path
+            order += 1
+            heapq.heappush(heap, (sum(len(p) - 1 for p in child_paths), order, child, child_paths))
+    return None, {"nodes": nodes}
+
+
+def solve_agents(maze, agents, method="prioritized", num_workers=4, max_nodes=500, stop_event=None):
+    """Plan agents [(start, goal), ...] given as (x, y) cells on a MazeSnapshot.
+
+    Returns (paths, elapsed, info): paths[k] lists agent k's cell at each
+    time step (start first, goal last) or is None if k got no plan; info
+    has the planner used, makespan, sum of costs and rounds / nodes.
+    """
+    if method not in METHODS:
+        raise ValueError(f"unknown multi-agent method: {method}")
+    t0 = time.time()
+    stop_event = stop_event or threading.Event()
+    idx = [(maze.index(s), maze.index(g)) for s, g in agents]
+    num_cells = len(maze.adj)
+
+    ex = None
+    if num_workers > 1 and len(agents) > 1:
+        ex = ProcessPoolExecutor(max_workers=num_workers, initializer=_init_worker, initargs=(maze,))
+        run = ex.map
+    else:
+        _init_worker(maze)
+        run = map
+    try:
+        info = {"method": method}
+        paths = None
+        if method == "cbs":
+            paths, stats = _cbs(run, idx, num_cells, max_nodes, stop_event)
+            info.update(stats)
+            if paths is None and not stop_event.is_set():
+                info["method"] = "prioritized (cbs node limit)"
+        if paths is None:
+            paths, stats = _prioritized(run, idx, num_cells, max(1, num_workers), stop_event,
+                                        num_workers if ex is not None else 1)
+            info.update(stats)
+    finally:
+        if ex is not None:
+            ex.shutdown()
+
+    cells = maze.cells
+    paths = [[cells[c] for c in p] if p else None for p in paths]
+    done = [p for p in paths if p]
+    info["makespan"] = max((len(p) - 1 for p in done), default=0)
+    info["sum_of_costs"] = sum(len(p) - 1 for p in done)
+    info["failed"] = len(paths) - len(done)
+    return paths, time.time() - t0, info
+
+
+def random_agents(maze, k, rng=random):
+    """k (start, goal) pairs with distinct starts and distinct goals, all in the largest open component."""
+    adj = maze.adj
+    label = [-1] * len(adj)
+    best = []
+    for i in range(len(adj)):
+        if maze.blocked[i] or label[i] >= 0:
+            continue
+        label[i] = i
+        comp, q = [i], deque([i])
+        while q:
+            for nx, _ in adj[q.popleft()]:
+                if label[nx] < 0:
+                    label[nx] = i
+                    comp.append(nx)
+                    q.append(nx)
+        if len(comp) > len(best):
+            best = comp
+    k = min(k, len(best) // 2)
+    picks = rng.sample(best, 2 * k)
+    cells = maze.cells
+    return [(cells[s], cells[g]) for s, g in zip(picks[:k], picks[k:])]
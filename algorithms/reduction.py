@@ -0,0 +1,113 @@
+"""Dead-end filling and corridor contraction of a MazeSnapshot.
+
+ReducedMaze.build(maze, keep=(start, goal)) first fills dead ends: open
+cells with at most one open neighbour are removed, repeatedly, which never
+cuts a path between two kept cells. It then contracts every chain of
+degree-2 cells into a single edge between the cells at its ends (junctions,
+dead-end-free endpoints and kept cells). Edge u -> v costs the weights of
+the chain cells plus v, so costs of paths between kept cells are unchanged.
+
+The result quacks like a MazeSnapshot (adj, cells, index, trace, ...), so
+any solver can take it as `maze=` and expand only junctions; trace() walks
+the stored corridors to return the full grid path. Dijkstra and A* stay
+optimal; BFS then minimises corridors rather than cells.
+"""
+
+
+class ReducedMaze:
+
+    def __init__(self, source, keep, grid, adj, via, filled):
+        self.source = source
+        self.keep = keep
+        self.n = source.n
+        self.grid = grid  # node -> grid index in source
+        self.cells = tuple(source.cells[i] for i in grid)
+        self.adj = adj
+        self.via = via  # (u, v) -> corridor cells strictly between u and v, in order
+        self.weighted = source.weighted
+        self.min_weight = source.min_weight
+        self.filled = filled
+        self._node = {g: k for k, g in enumerate(grid)}
+
+    def __reduce__(self):
+        return (ReducedMaze.build, (self.source, self.keep))
+
+    @classmethod
+    def build(cls, maze, keep=()):
+        adj, weights = maze.adj, maze.weights
+        keep = tuple(tuple(p) for p in keep)
+        kept = {maze.index(p) for p in keep}
+
+        # dead-end filling
+        alive = bytearray(1 - b for b in maze.blocked)
+        degree = [len(row) for row in adj]
+        stack = [i for i in range(len(adj)) if alive[i] and degree[i] <= 1 and i not in kept]
+        filled = 0
+        while stack:
+            i = stack.pop()
+            if not alive[i]:
+                continue
+            alive[i] = 0
+            filled += 1
+            for j, _ in adj[i]:
+                if alive[j]:
+                    degree[j] -= 1
+                    if degree[j] <= 1 and j not in kept:
+                        stack.append(j)
+
+        # corridor contraction: every live cell that is not a plain corridor is a node
+        grid = [i for i in range(len(adj)) if alive[i] and (degree[i] != 2 or i in kept)]
+        node = {g: k for k, g in enumerate(grid)}
+        rows, via = [], {}
+        for u, gu in enumerate(grid):
+            best = {}
+            for first, _ in adj[gu]:
+                if not alive[first]:
+                    continue
+                prev, curr, chain, cost = gu, first, [], 0
+                while curr not in node:
+                    chain.append(curr)
+                    cost += weights[curr]
+                    prev, curr = curr, next(j for j, _ in adj[curr] if alive[j] and j != prev)
+                v = node[curr]
+                cost += weights[curr]
+                # parallel corridors between the same pair: keep the cheapest
+                if v != u and (v not in best or cost < best[v]):
+                    best[v] = cost
+                    via[(u, v)] = tuple(chain)
+            rows.append(tuple(best.items()))
+        return cls(maze, keep, tuple(grid), tuple(rows), via, filled)
+
+    def fingerprint(self):
+        return self.source.fingerprint()
+
+    def index(self, pos):
+        try:
+            return self._node[self.source.index(pos)]
+        except KeyError:
+            raise ValueError(f"{pos} is not a node of the reduced maze; pass it in keep") from None
+
+    def cell(self, i):
+        return self.cells[i]
+
+    def trace(self, parent, s, t):
+        """Full grid path from s to t (node ids) following parent links, or [] if t was not reached."""
+        if parent[t] < 0:
+            return []
+        nodes = [t]
+        c = t
+        while c != s:
+            c = parent[c]
+            nodes.append(c)
+        nodes.reverse()
+        cells = self.source.cells
+        path = [self.cells[s]]
+        for u, v in zip(nodes, nodes[1:]):
+            path.extend(cells[i] for i in self.via[(u, v)])
+            path.append(self.cells[v])
+        return path
+
+    def stats(self):
+        """(open cells, cells filled as dead ends, nodes, directed edges)."""
+        open_cells = len(self.source.blocked) - sum(self.source.blocked)
+        return open_cells, self.filled, len(self.grid), sum(len(r) for r in self.adj)
@@ -0,0 +1,197 @@
+"""SMA*: A* that never holds more than max_nodes search nodes.
+
+Simplified memory-bounded A* (Russell 1992). The open node with the lowest
+f (deepest first) generates its best successor not yet in memory; f values
+are backed up from children to parents, so a node is always worth at least
+its best remaining option. When memory is full, the shallowest leaf with
+the highest f is forgotten: its parent keeps the move with the leaf's f,
+and regrows that subtree only once it is the best option again.
+A successor is not generated while its cell is in memory with a g at
+least as low.
+
+A path needs one node per cell, so a successor max_nodes - 1 steps deep
+that is not the goal gets f = inf. With max_nodes at least the number of
+cells on an optimal path the result is optimal. A breadth-first pass over
+a one-byte-per-cell seen mask returns [] at once when the goal is
+unreachable or even its shortest path would not fit. Otherwise the result
+is the cheapest path that fits, or [] once the root's backed-up f has not
+risen for stall_limit iterations (by default STALL_FACTOR * max_nodes):
+regrowing forgotten subtrees over and over without a better bound means no
+path within the budget is coming.
+"""
+import time, heapq
+from maze import snapshot_for
+from workload import NO_WORK
+from .heuristics import make_heuristic
+
+DEFAULT_MAX_NODES = 10000
+STALL_FACTOR = 1000
+
+# fields of a node record; PENDING is None until the node is first expanded,
+# then the [f, cell, weight] successors it has still to generate
+CELL, G, F, PARENT, DEPTH, CHILDREN, PENDING, VERSION = range(8)
+
+
+def sma_star(start, goal, n, walls, get_edge_weight,
+             draw_cell, draw_edge, player_update,
+             speed, stop_event, num_threads=None, maze=None,
+             heuristic="manhattan", landmarks=None, workload=NO_WORK,
+             max_nodes=DEFAULT_MAX_NODES, stall_limit=None):
+
+    t0 = time.time()
+    maze = snapshot_for(n, walls, get_edge_weight, maze)
+    adj, cells = maze.adj, maze.cells
+    s, t = maze.index(start), maze.index(goal)
+    h = make_heuristic(heuristic, maze, goal, landmarks)
+    inf = float("inf")
+    budget = max(2, max_nodes)
+    steps = min_steps(adj, s, t)
+    if steps < 0 or steps >= budget:
+        return [], time.time() - t0  # unreachable, or no path fits in memory
+    if stall_limit is None:
+        stall_limit = STALL_FACTOR * budget
+
+    nodes = {}     # id -> node record, everything in memory
+    cheapest = {}  # cell -> id of its cheapest node in memory
+    # lazy heaps of (key, -depth, id, version) over nodes with successors to
+    # generate and (-f, depth, id, version) over leaves; entries whose
+    # version is outdated are skipped
+    open_, leaves = [], []
+    ids = iter(range(1 << 62))
+
+    def open_key(node):
+        pending = node[PENDING]
+        if pending is None:
+            return node[F]
+        return min(pending)[0] if pending else (inf if not node[CHILDREN] else None)
+
+    def refresh(i):
+        # back up f from the remaining successors and children, then re-file
+        # the node (and its ancestors, if its f went up)
+        while i is not None:
+            node = nodes[i]
+            old = node[F]
+            if node[PENDING] is not None:
+                best = min([e[0] for e in node[PENDING]] + [nodes[c][F] for c in node[CHILDREN]], default=inf)
+                node[F] = max(old, best)
+            node[VERSION] += 1
+            key = open_key(node)
+            if key is not None:
+                heapq.heappush(open_, (key, -node[DEPTH], i, node[VERSION]))
+            if not node[CHILDREN] and node[PARENT] is not None:
+                heapq.heappush(leaves, (-node[F], node[DEPTH], i, node[VERSION]))
+            if len(open_) + len(leaves) > 8 * budget:
+                compact()
+            if node[F] == old:
+                return
+            i = node[PARENT]
+
+    def compact():
+        # keep the heaps within a constant factor of the budget
+        open_[:] = [(key, -node[DEPTH], i, node[VERSION]) for i, node in nodes.items()
+                    for key in (open_key(node),) if key is not None]
+        leaves[:] = [(-node[F], node[DEPTH], i, node[VERSION]) for i, node in nodes.items()
+                     if not node[CHILDREN] and node[PARENT] is not None]
+        heapq.heapify(open_)
+        heapq.heapify(leaves)
+
+    def add(cell, g, f, parent, depth):
+        i = next(ids)
+        nodes[i] = [cell, g, f, parent, depth, set(), None, 0]
+        if cell not in cheapest or nodes[cheapest[cell]][G] > g:
+            cheapest[cell] = i
+        refresh(i)
+        return i
+
+    def forget_worst(keep):
+        while leaves:
+            _, _, i, version = heapq.heappop(leaves)
+            node = nodes.get(i)
+            if node is None or node[VERSION] != version or node[CHILDREN] or i == keep:
+                continue
+            del nodes[i]
+            if cheapest.get(node[CELL]) == i:
+                del cheapest[node[CELL]]
+            p = nodes[node[PARENT]]
+            p[CHILDREN].discard(i)
+            p[PENDING].append([node[F], node[CELL], node[G] - p[G]])
+            refresh(node[PARENT])
+            return True
+        return False
+
+    root = add(s, 0, h(s), None, 0)
+    found = None
+    bound, stalled = nodes[root][F], 0
+    while open_ and not stop_event.is_set():
+        if nodes[root][F] > bound:
+            bound, stalled = nodes[root][F], 0
+        stalled += 1
+        if stalled > stall_limit:
+            break  # thrashing: the budget does not fit any path it can still find
+        key, _, i, version = open_[0]
+        node = nodes.get(i)
+        if node is None or node[VERSION] != version:
+            heapq.heappop(open_)
+            continue  # stale entry
+        if key == inf:
+            break  # everything left is out of reach within the budget
+        cell = node[CELL]
+        if node[PENDING] is None:
+            workload(cell)
+            draw_cell(cells[cell], "#AED6F1")
+            if cell == t:
+                found = i
+                break
+            node[PENDING] = []
+            for nx, w in adj[cell]:
+                g = node[G] + w
+                if nx != t and node[DEPTH] + 1 >= budget - 1:
+                    f = inf  # a longer path would not fit in memory
+                else:
+                    f = max(node[F], g + h(nx))
+                node[PENDING].append([f, nx, w])
+            refresh(i)
+            continue
+
+        pending = node[PENDING]
+        entry = min(pending)
+        pending.remove(entry)
+        f, nx, w = entry
+        g = node[G] + w
+        other = cheapest.get(nx)
+        if other is not None and nodes[other][G] <= g:
+            refresh(i)  # already in memory at least as cheaply
+            continue
+        c = add(nx, g, max(f, node[F]), i, node[DEPTH] + 1)
+        node[CHILDREN].add(c)
+        refresh(i)
+        while len(nodes) > budget and forget_worst(c):
+            pass
+
+    if found is None:
+        return [], time.time() - t0
+    parent = {s: s}  # links along the path only
+    while found != root:
+        node = nodes[found]
+        parent[node[CELL]] = nodes[node[PARENT]][CELL]
+        found = node[PARENT]
+    return maze.trace(parent, s, t), time.time() - t0
+
+
+def min_steps(adj, s, t):
+    """Fewest moves from s to t, or -1 if t cannot be reached (one byte per cell)."""
+    seen = bytearray(len(adj))
+    seen[s] = 1
+    frontier, steps = [s], 0
+    while frontier:
+        if seen[t]:
+            return steps
+        steps += 1
+        nxt = []
+        for u in frontier:
+            for v, _ in adj[u]:
+                if not seen[v]:
+                    seen[v] = 1
+                    nxt.append(v)
+        frontier = nxt
+    return -1
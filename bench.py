@@ -0,0 +1,348 @@
+"""Headless benchmark harness.
+
+    python bench.py run --size 20 --repeat 5 --algos "BFS:Parallel,A*:Sequential"
+    python bench.py compare <base-revision> <new-revision>
+    python bench.py scaling --size 20 40 --threads 1 2 4 8
+    python bench.py agents --size 64 --agents 300 --method prioritized
+    python bench.py suite benchmarks/smoke.toml [--save-baseline]
+
+Every run is appended to the benchmark history (see history.py) together with
+the git revision, machine info and maze fingerprint; `compare` flags
+statistically significant slowdowns between two revisions.
+"""
+import sys, time, random, argparse, itertools, threading
+
+from algorithms import SOLVERS, PROCESS_SOLVERS, BATCHED_SOLVERS
+from algorithms.heuristics import HEURISTICS, TIE_BREAKS
+from algorithms.landmarks import landmarks_for
+from algorithms.ida_star import DEFAULT_TABLE_SIZE
+from algorithms.sma_star import DEFAULT_MAX_NODES
+from algorithms.reduction import ReducedMaze
+from maze import MazeSnapshot
+from connectivity import Connectivity
+from verify import oracle_for
+from results import ResultsStore
+from history import History, DEFAULT_DB, print_comparison
+from profiling import profile_call, format_hot, MODES as PROFILE_MODES, PROFILE_DIR
+from utils import generate_walls, generate_weights
+from workload import WORKLOADS, make_workload
+
+
+def make_maze(n, density=0.18, seed=None, weighted=False, solvable=False):
+    """Random maze as the app would build it, reproducible when seed is given.
+
+    With solvable=True, wall layouts that cut start off from goal are
+    rejected and redrawn from the same random stream.
+    """
+    rng = random.Random(seed)
+    start, goal = (0, 0), (n - 1, n - 1)
+    walls = generate_walls(n, start, goal, density, rng)
+    while solvable and not Connectivity(n, walls).connected(start, goal):
+        walls = generate_walls(n, start, goal, density, rng)
+    weights = generate_weights(n, rng) if weighted else None
+    return MazeSnapshot(n, walls, weights), start, goal
+
+
+def run_solver(func, maze, start, goal, threads=1, parallel=False, **extra):
+    """Run one solver without a UI. Returns (path, elapsed_seconds, expansions).
+
+    maze may be a MazeSnapshot or a ReducedMaze built from one.
+    """
+    grid = getattr(maze, "source", maze)
+    expansions = itertools.count()
+    params = {
+        "start": start,
+        "goal": goal,
+        "n": grid.n,
+        "walls": grid.walls,
+        "get_edge_weight": grid.edge_weight,
+        "draw_cell": lambda pos, color: next(expansions),
+        "draw_edge": None,
+        "player_update": None,
+        "speed": 0,
+        "stop_event": threading.Event(),
+        "maze": maze,
+    }
+    if parallel:
+        params["num_threads"] = threads
+    params.update(extra)
+    t0 = time.perf_counter()
+    path, used = func(**params)
+    elapsed = used if used else time.perf_counter() - t0
+    return path, elapsed, next(expansions)
+
+
+def backend_for(algo, mode, batch=0):
+    if (algo, mode) in PROCESS_SOLVERS or (batch and (algo, mode) in BATCHED_SOLVERS):
+        return "processes"
+    return "threads" if mode == "Parallel" else "serial"
+
+
+def parse_algos(spec):
+    if spec == "all":
+        return list(SOLVERS)
+    keys = []
+    for item in spec.split(","):
+        algo, _, mode = item.strip().partition(":")
+        for key in SOLVERS:
+            if key[0].lower() == algo.lower() and (not mode or key[1].lower() == mode.lower()):
+                keys.append(key)
+    if not keys:
+        raise SystemExit(f"no solver matches {spec!r}; known: "
+                         + ", ".join(f"{a}:{m}" for a, m in SOLVERS))
+    return keys
+
+
+def cmd_run(args):
+    history = None if args.no_log else History(args.db)
+    store = ResultsStore()
+    keys = parse_algos(args.algos)
+    workload = make_workload(args.workload, args.work_amount)
+    for n in args.size:
+        maze, start, goal = make_maze(n, args.density, args.seed, args.weighted, args.solvable)
+        density = len(maze.walls) / (n * n)
+        fingerprint = maze.fingerprint()
+        astar = {"heuristic": args.heuristic, "epsilon": args.epsilon, "tie_break": args.tie_break}
+        if args.heuristic == "alt" and any(algo in ("A*", "HDA*", "IDA*", "SMA*") for algo, _ in keys):
+            t0 = time.perf_counter()
+            astar["landmarks"] = landmarks_for(maze, args.landmarks, num_workers=args.threads)
+            print(f"n={n:<4} ALT preprocessing ({args.landmarks} landmarks) {time.perf_counter() - t0:9.4f}s")
+        oracle = oracle_for(maze, start) if args.verify else None
+        solve_on = maze
+        if args.reduce:
+            t0 = time.perf_counter()
+            solve_on = ReducedMaze.build(maze, (start, goal))
+            cells, filled, nodes, edges = solve_on.stats()
+            print(f"n={n:<4} reduced {cells} open cells to {nodes} nodes / {edges} edges"
+                  f" ({filled} dead-end cells filled) in {time.perf_counter() - t0:.4f}s")
+        for (algo, mode), _ in itertools.product(keys, range(args.repeat)):
+            parallel = mode == "Parallel"
+            threads = args.threads if parallel else 1
+            backend = backend_for(algo, mode, args.batch)
+            func = SOLVERS[(algo, mode)]
+            profiled = {}
+            if args.profile:
+                def func(_solver=func, _label=f"{algo} {mode} n{n}", **params):
+                    result, profiled["path"], profiled["hot"] = profile_call(
+                        _solver, params, _label, args.profile, args.profile_dir)
+                    return result
+            if algo == "A*":
+                extra = astar
+            elif algo in ("HDA*", "IDA*", "SMA*"):
+                extra = {k: astar[k] for k in ("heuristic", "landmarks") if k in astar}
+                if algo == "IDA*":
+                    extra["table_size"] = args.table_size
+                elif algo == "SMA*":
+                    extra["max_nodes"] = args.max_nodes
+            else:
+                extra = {}
+            extra = dict(extra, workload=workload)
+            if args.batch and (algo, mode) in BATCHED_SOLVERS:
+                extra["batch"] = args.batch
+            path, elapsed, expanded = run_solver(func, solve_on, start, goal, threads, parallel, **extra)
+            verdict = ""
+            if oracle is not None:
+                verdict, value, reference = oracle.check(algo, path, goal, extra.get("epsilon", 1.0),
+                                                           reduced=args.reduce)
+            store.append(algo, mode, elapsed, threads, n=n, density=density, seed=args.seed,
+                         backend=backend, expansions=expanded, verdict=verdict)
+            if history is not None:
+                history.log(algo, mode, elapsed, threads, n=n, density=density, seed=args.seed,
+                            backend=backend, expansions=expanded, maze=fingerprint,
+                            source="bench" if args.workload == "none" else f"bench:{args.workload}")
+            print(f"n={n:<4} {algo:<9} {mode:<10} x{threads:<3} {elapsed:9.4f}s"
+                  f"  expanded={expanded:<6} path={len(path)}"
+                  + (f"  check={verdict}" if verdict else "")
+                  + (f" ({value} vs {reference})" if verdict == "suboptimal" else ""))
+            if profiled:
+                print(f"  profile: {profiled['path']}")
+                print("  " + format_hot(profiled["hot"][:args.profile_top]).replace("\n", "\n  "))
+    print()
+    print(f"{'group':<34} {'runs':>4} {'mean':>9} {'median':>9} {'stddev':>9} {'speedup':>8}")
+    for algo, mode, backend, threads, agg, speedup in store.summary():
+        name = f"{algo} {mode} {backend} x{threads}"
+        sp = "-" if speedup is None else f"{speedup:.2f}x"
+        wrong = store.wrong_count(algo, mode, backend, threads)
+        flag = f"  {wrong} wrong answer(s)" if wrong else ""
+        print(f"{name:<34} {agg.count:>4} {agg.mean:9.4f} {agg.median:9.4f} {agg.stddev:9.4f} {sp:>8}{flag}")
+    if store.wrong_count():
+        print(f"\n{store.wrong_count()} run(s) returned a wrong answer", file=sys.stderr)
+        return 1
+    return 0
+
+
+def cmd_compare(args):
+    history = History(args.db)
+    revisions = history.revisions()
+    base = args.base or (revisions[-2] if len(revisions) > 1 else None)
+    new = args.new or (revisions[-1] if revisions else None)
+    if not base or not new:
+        print("need two revisions in the history to compare", file=sys.stderr)
+        return 2
+    report = history.compare(base, new, alpha=args.alpha, min_change=args.min_change)
+    if not report:
+        print(f"no algorithm/backend combination was timed at both {base} and {new}")
+        return 0
+    print_comparison(report, base, new)
+    slower = [r for r in report if r[5]]
+    if slower:
+        print(f"\n{len(slower)} significant slowdown(s) from {base} to {new}")
+        return 1
+    return 0
+
+
+def cmd_scaling(args):
+    from scaling import sweep, print_sweep, PARALLEL_SOLVERS
+    keys = [k for k in parse_algos(args.algos) if k in PARALLEL_SOLVERS]
+    if not keys:
+        raise SystemExit("scaling needs at least one parallel solver")
+    progress = lambda done, total, label: print(f"[{done}/{total}] {label}", file=sys.stderr)
+    result = sweep(keys, args.size, args.threads, args.repeat, args.density, args.seed,
+                   args.weighted, progress, workload=make_workload(args.workload, args.work_amount))
+    print_sweep(result)
+    return 0
+
+
+def cmd_agents(args):
+    from algorithms.multi_agent import solve_agents, random_agents
+    for n in args.size:
+        maze, _, _ = make_maze(n, args.density, args.seed)
+        agents = random_agents(maze, args.agents, random.Random(args.seed))
+        paths, elapsed, info = solve_agents(maze, agents, args.method, args.workers, args.max_nodes)
+        print(f"n={n:<4} agents={len(agents):<5} {info['method']:<28} {elapsed:9.4f}s"
+              f"  makespan={info['makespan']} sum_of_costs={info['sum_of_costs']} failed={info['failed']}")
+    return 0
+
+
+def cmd_suite(args):
+    import json, os
+    from suites import load_suite, pin_cpus, run_suite, make_report, compare, print_report
+    suite = load_suite(args.suite)
+    cpus = pin_cpus(args.cpus or suite.get("cpus"))
+    if cpus:
+        print(f"pinned to CPUs {sorted(cpus)}", file=sys.stderr)
+    history = None if args.no_log else History(args.db)
+
+    def log(case, maze, elapsed):
+        if history is not None:
+            history.log(case.algo, case.mode, elapsed, case.threads, n=case.n, density=case.density,
+                        seed=case.seed, backend=case.backend, maze=maze.fingerprint(),
+                        source=f"suite:{suite['name']}")
+
+    progress = lambda done, total, key: print(f"[{done}/{total}] {key}", file=sys.stderr)
+    report = make_report(suite, run_suite(suite, progress, log), cpus)
+    baseline_path = args.baseline or os.path.splitext(args.suite)[0] + ".baseline.json"
+    baseline = None
+    if os.path.exists(baseline_path) and not args.save_baseline:
+        with open(baseline_path) as f:
+            baseline = json.load(f)
+    rows = compare(report, baseline, args.alpha, args.min_change)
+    print_report(rows, suite["name"])
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump(report, f, indent=1)
+    if args.save_baseline:
+        with open(baseline_path, "w") as f:
+            json.dump(report, f, indent=1)
+        print(f"\nbaseline saved to {baseline_path}")
+        return 0
+    if baseline is None:
+        print(f"\nno baseline at {baseline_path}; rerun with --save-baseline to store one")
+    slower = [r for r in rows if r[5]]
+    if slower:
+        print(f"\n{len(slower)} significant slowdown(s) against {baseline_path}")
+        return 1
+    return 0
+
+
+def add_workload_args(parser):
+    parser.add_argument("--workload", choices=WORKLOADS, default="none",
+                        help="synthetic cost per expanded cell, the same for every solver")
+    parser.add_argument("--work-amount", type=float,
+                        help="cpu: loop iterations, io: seconds, memory: buffer touches per cell")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Headless maze solver benchmarks")
+    parser.add_argument("--db", default=DEFAULT_DB, help="benchmark history database")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run = sub.add_parser("run", help="time solvers on random mazes and log the runs")
+    run.add_argument("--algos", default="all", help='"all" or e.g. "BFS:Parallel,A*"')
+    run.add_argument("--size", type=int, nargs="+", default=[20])
+    run.add_argument("--density", type=float, default=0.18)
+    run.add_argument("--seed", type=int, default=0)
+    run.add_argument("--weighted", action="store_true")
+    run.add_argument("--solvable", action="store_true", help="redraw mazes with no start-goal path")
+    run.add_argument("--threads", type=int, default=4)
+    run.add_argument("--repeat", type=int, default=3)
+    run.add_argument("--reduce", action="store_true",
+                     help="fill dead ends and contract corridors before solving")
+    run.add_argument("--heuristic", choices=HEURISTICS, default=HEURISTICS[0], help="A* heuristic")
+    run.add_argument("--epsilon", type=float, default=1.0, help="A* weight; >1 trades optimality for speed")
+    run.add_argument("--tie-break", choices=TIE_BREAKS, default=TIE_BREAKS[0])
+    run.add_argument("--landmarks", type=int, default=4, help="landmark count for --heuristic alt")
+    run.add_argument("--table-size", type=int, default=DEFAULT_TABLE_SIZE,
+                     help="IDA* transposition table slots")
+    run.add_argument("--max-nodes", type=int, default=DEFAULT_MAX_NODES, help="SMA* node budget")
+    run.add_argument("--verify", action="store_true",
+                     help="check every path against a reference distance field; exit 1 on wrong answers")
+    add_workload_args(run)
+    run.add_argument("--batch", type=int, default=0,
+                     help="parallel Dijkstra/A*: expand this many cells per step, workload in processes")
+    run.add_argument("--no-log", action="store_true", help="do not write to the history")
+    run.add_argument("--profile", choices=PROFILE_MODES, help="profile every run (adds overhead)")
+    run.add_argument("--profile-dir", default=PROFILE_DIR)
+    run.add_argument("--profile-top", type=int, default=8, help="hot functions to print per run")
+    run.set_defaults(func=cmd_run)
+
+    cmp_ = sub.add_parser("compare", help="flag slowdowns between two revisions")
+    cmp_.add_argument("base", nargs="?", help="baseline revision (default: second newest)")
+    cmp_.add_argument("new", nargs="?", help="revision to check (default: newest)")
+    cmp_.add_argument("--alpha", type=float, default=0.05)
+    cmp_.add_argument("--min-change", type=float, default=0.05,
+                      help="ignore slowdowns smaller than this fraction")
+    cmp_.set_defaults(func=cmd_compare)
+
+    scl = sub.add_parser("scaling", help="strong/weak scaling sweep of the parallel solvers")
+    scl.add_argument("--algos", default="all")
+    scl.add_argument("--size", type=int, nargs="+", default=[20])
+    scl.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8, 12])
+    scl.add_argument("--density", type=float, default=0.18)
+    scl.add_argument("--seed", type=int, default=0)
+    scl.add_argument("--weighted", action="store_true")
+    scl.add_argument("--repeat", type=int, default=3)
+    add_workload_args(scl)
+    scl.set_defaults(func=cmd_scaling)
+
+    agt = sub.add_parser("agents", help="multi-agent path finding on random mazes")
+    agt.add_argument("--size", type=int, nargs="+", default=[64])
+    agt.add_argument("--density", type=float, default=0.15)
+    agt.add_argument("--seed", type=int, default=0)
+    agt.add_argument("--agents", type=int, default=100)
+    agt.add_argument("--method", choices=("prioritized", "cbs"), default="prioritized")
+    agt.add_argument("--workers", type=int, default=4)
+    agt.add_argument("--max-nodes", type=int, default=500, help="CBS high-level node limit")
+    agt.set_defaults(func=cmd_agents)
+
+    ste = sub.add_parser("suite", help="run a declarative benchmark suite (TOML/JSON) against its baseline")
+    ste.add_argument("suite", help="suite file, e.g. benchmarks/smoke.toml")
+    ste.add_argument("--baseline", help="baseline report (default: <suite>.baseline.json)")
+    ste.add_argument("--save-baseline", action="store_true", help="store this run as the baseline")
+    ste.add_argument("--report", help="also write this run's report (JSON) here")
+    ste.add_argument("--cpus", type=int, nargs="+", help="pin to these CPUs (overrides the suite)")
+    ste.add_argument("--alpha", type=float, default=0.05)
+    ste.add_argument("--min-change", type=float, default=0.05,
+                     help="ignore slowdowns smaller than this fraction")
+    ste.add_argument("--no-log", action="store_true", help="do not write to the history")
+    ste.set_defaults(func=cmd_suite)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,107 @@
+"""Connected components of the open cells, for answering "is there a path?" up front.
+
+Union-find over packed cell indices (x * n + y). Opening a cell only merges
+components, so remove_wall is a few unions (on a fresh union-find node, as
+the cell's old node may still link it to the set it had before it was
+walled). Adding a wall can split a component; add_wall first checks locally
+whether the new wall's open neighbours are still joined and rebuilds the
+whole index only if they are not.
+"""
+from collections import deque
+from maze import DIRECTIONS
+
+
+class Connectivity:
+
+    def __init__(self, n, walls=()):
+        self.n = n
+        self.blocked = bytearray(n * n)
+        for x, y in walls:
+            if 0 <= x < n and 0 <= y < n:
+                self.blocked[x * n + y] = 1
+        self.rebuild()
+
+    def rebuild(self):
+        n, blocked = self.n, self.blocked
+        self.node = list(range(n * n))  # cell -> its current union-find node
+        self.parent = list(range(n * n))
+        self.size = [1] * (n * n)
+        for i in range(n * n):
+            if blocked[i]:
+                continue
+            x, y = divmod(i, n)
+            if x + 1 < n and not blocked[i + n]:
+                self._union(i, i + n)
+            if y + 1 < n and not blocked[i + 1]:
+                self._union(i, i + 1)
+
+    def _find(self, i):
+        parent = self.parent
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]  # path halving
+            i = parent[i]
+        return i
+
+    def _union(self, a, b):
+        a, b = self._find(a), self._find(b)
+        if a == b:
+            return
+        if self.size[a] < self.size[b]:
+            a, b = b, a
+        self.parent[b] = a
+        self.size[a] += self.size[b]
+
+    def _open_neighbors(self, i):
+        n = self.n
+        x, y = divmod(i, n)
+        for dx, dy in DIRECTIONS:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < n and 0 <= ny < n and not self.blocked[nx * n + ny]:
+                yield nx * n + ny
+
+    def connected(self, a, b):
+        """True if open cells a and b (x, y) are joined by a path of open cells."""
+        n = self.n
+        i, j = a[0] * n + a[1], b[0] * n + b[1]
+        if self.blocked[i] or self.blocked[j]:
+            return False
+        return self._find(self.node[i]) == self._find(self.node[j])
+
+    def remove_wall(self, pos):
+        i = pos[0] * self.n + pos[1]
+        if not self.blocked[i]:
+            return
+        self.blocked[i] = 0
+        self.node[i] = len(self.parent)
+        self.parent.append(self.node[i])
+        self.size.append(1)
+        for j in self._open_neighbors(i):
+            self._union(self.node[i], self.node[j])
+
+    def add_wall(self, pos):
+        i = pos[0] * self.n + pos[1]
+        if self.blocked[i]:
+            return
+        self.blocked[i] = 1
+        # the walled cell stays in the union-find tree as an inner node;
+        # connected() never answers for it, so the sets stay valid unless
+        # the wall cut its component in two
+        around = list(self._open_neighbors(i))
+        if len(around) > 1 and not self._still_joined(around):
+            self.rebuild()
+
+    def _still_joined(self, cells):
+        # BFS from one neighbour until it has seen all the others; usually
+        # they meet again a few steps around the new wall
+        want = set(cells[1:])
+        seen = {cells[0]}
+        q = deque([cells[0]])
+        while q:
+            for j in self._open_neighbors(q.popleft()):
+                if j not in seen:
+                    seen.add(j)
+                    want.discard(j)
+                    if not want:
+                        return True
+                    q.append(j)
+        return False
@@ -0,0 +1,175 @@
+import os, sys, json, math, time, sqlite3, platform, subprocess
+from contextlib import closing
+
+DEFAULT_DB = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bench_history.sqlite")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    ts REAL NOT NULL,
+    revision TEXT,
+    machine TEXT,
+    maze TEXT,
+    source TEXT,
+    algo TEXT NOT NULL,
+    mode TEXT NOT NULL,
+    backend TEXT NOT NULL,
+    threads INTEGER NOT NULL,
+    n INTEGER,
+    density REAL,
+    seed INTEGER,
+    expansions INTEGER,
+    time REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_by_revision ON runs (revision, algo, mode, backend, threads);
+"""
+
+
+def machine_info():
+    return {
+        "system": platform.system(),
+        "release": platform.release(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpus": os.cpu_count(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+    }
+
+
+def git_revision(path=None):
+    """Short HEAD hash of the checkout (with -dirty for local edits), or None."""
+    path = path or os.path.dirname(os.path.abspath(__file__))
+    try:
+        rev = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=path,
+                             capture_output=True, text=True, timeout=5).stdout.strip()
+        if not rev:
+            return None
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=path,
+                               capture_output=True, text=True, timeout=5).stdout.strip()
+        return rev + "-dirty" if dirty else rev
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def _betacf(a, b, x):
+    # continued fraction for the incomplete beta function (Numerical Recipes)
+    qab, qap, qam = a + b, a + 1.0, a - 1.0
+    c, d = 1.0, 1.0 - qab * x / qap
+    d = 1.0 / (d if abs(d) > 1e-30 else 1e-30)
+    h = d
+    for m in range(1, 200):
+        m2 = 2 * m
+        aa = m * (b - m) * x / ((qam + m2) * (a + m2))
+        d = 1.0 + aa * d
+        d = 1.0 / (d if abs(d) > 1e-30 else 1e-30)
+        c = 1.0 + aa / c
+        c = c if abs(c) > 1e-30 else 1e-30
+        h *= d * c
+        aa = -(a + m) * (qab + m) * x / ((a + m2) * (qap + m2))
+        d = 1.0 + aa * d
+        d = 1.0 / (d if abs(d) > 1e-30 else 1e-30)
+        c = 1.0 + aa / c
+        c = c if abs(c) > 1e-30 else 1e-30
+        delta = d * c
+        h *= delta
+        if abs(delta - 1.0) < 3e-12:
+            break
+    return h
+
+
+def _betai(a, b, x):
+    if x <= 0.0:
+        return 0.0
+    if x >= 1.0:
+        return 1.0
+    lbeta = math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b)
+    front = math.exp(lbeta + a * math.log(x) + b * math.log(1.0 - x))
+    if x < (a + 1.0) / (a + b + 2.0):
+        return front * _betacf(a, b, x) / a
+    return 1.0 - front * _betacf(b, a, 1.0 - x) / b
+
+
+def welch_test(xs, ys):
+    """Welch's t-test. Returns (t, two-sided p-value); p is 1.0 when undecidable."""
+    nx, ny = len(xs), len(ys)
+    if nx < 2 or ny < 2:
+        return 0.0, 1.0
+    mx, my = sum(xs) / nx, sum(ys) / ny
+    vx = sum((v - mx) ** 2 for v in xs) / (nx - 1)
+    vy = sum((v - my) ** 2 for v in ys) / (ny - 1)
+    se2 = vx / nx + vy / ny
+    if se2 == 0:
+        return 0.0, (1.0 if mx == my else 0.0)
+    t = (my - mx) / math.sqrt(se2)
+    df = se2 ** 2 / ((vx / nx) ** 2 / (nx - 1) + (vy / ny) ** 2 / (ny - 1))
+    return t, _betai(df / 2.0, 0.5, df / (df + t * t))
+
+
+class History:
+    """On-disk log of every benchmark run (SQLite), keyed by git revision."""
+
+    def __init__(self, path=DEFAULT_DB):
+        self.path = path
+        self.revision = git_revision()
+        self.machine = json.dumps(machine_info(), sort_keys=True)
+        with closing(self._connect()) as db:
+            db.executescript(SCHEMA)
+
+    def _connect(self):
+        # one short-lived connection per call, so any thread may log
+        return sqlite3.connect(self.path, timeout=10)
+
+    def log(self, algo, mode, time_s, threads, n=None, density=None, seed=None,
+            backend="threads", expansions=None, maze=None, source="app", revision=None):
+        with closing(self._connect()) as db, db:
+            db.execute(
+                "INSERT INTO runs (ts, revision, machine, maze, source, algo, mode, backend,"
+                " threads, n, density, seed, expansions, time)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (time.time(), revision or self.revision, self.machine, maze, source, algo, mode,
+                 backend, threads, n, density, seed, expansions, time_s))
+
+    def revisions(self):
+        """Known revisions, oldest first."""
+        with closing(self._connect()) as db:
+            return [r for (r,) in db.execute(
+                "SELECT revision FROM runs WHERE revision IS NOT NULL"
+                " GROUP BY revision ORDER BY MIN(ts)")]
+
+    def timings(self, revision, maze=None):
+        """{(algo, mode, backend, threads): [time, ...]} for one revision."""
+        sql = "SELECT algo, mode, backend, threads, time FROM runs WHERE revision = ?"
+        args = [revision]
+        if maze is not None:
+            sql += " AND maze = ?"
+            args.append(maze)
+        groups = {}
+        with closing(self._connect()) as db:
+            for algo, mode, backend, threads, t in db.execute(sql, args):
+                groups.setdefault((algo, mode, backend, threads), []).append(t)
+        return groups
+
+    def compare(self, base, new, alpha=0.05, min_change=0.05, maze=None):
+        """Compare every group timed at both revisions.
+
+        Returns [(group, base_mean, new_mean, ratio, p_value, regressed)] where
+        regressed means new is slower by more than min_change with p < alpha.
+        """
+        old, cur = self.timings(base, maze), self.timings(new, maze)
+        report = []
+        for key in sorted(set(old) & set(cur)):
+            xs, ys = old[key], cur[key]
+            mx, my = sum(xs) / len(xs), sum(ys) / len(ys)
+            _, p = welch_test(xs, ys)
+            ratio = my / mx if mx > 0 else float("inf")
+            report.append((key, mx, my, ratio, p, p < alpha and ratio > 1.0 + min_change))
+        return report
+
+
+def print_comparison(report, base, new, out=sys.stdout):
+    print(f"{'group':<40} {base:>12} {new:>12} {'ratio':>7} {'p':>7}", file=out)
+    for (algo, mode, backend, threads), mx, my, ratio, p, regressed in report:
+        name = f"{algo} {mode} {backend} x{threads}"
+        flag = "  SLOWER" if regressed else ""
+        print(f"{name:<40} {mx:12.4f} {my:12.4f} {ratio:7.2f} {p:7.3f}{flag}", file=out)
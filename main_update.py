@@ -3,10 +3,6 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import threading
 import time
-import tempfile
-import webbrowser
-import pandas as pd
-import plotly.express as px
 import random
 
 # Optional image support
@@ -757,9 +753,10 @@ class MazeApp:
             matplotlib.use('Agg')  # Use non-interactive backend
             import matplotlib.pyplot as plt
             from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+            import pandas as pd  # loaded on first chart, keeps startup light
         except ImportError:
             messagebox.showerror("Matplotlib Required", 
-                                "Please install matplotlib to view charts:\n\npip install matplotlib")
+                                "Please install matplotlib and pandas to view charts:\n\npip install matplotlib pandas")
             return
         
         # Create new window
@@ -0,0 +1,133 @@
+import hashlib
+from array import array
+from utils import neighbors
+from weights import CellWeights
+
+# same order as utils.neighbors, so solvers expand cells in the same order
+DIRECTIONS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+
+
+class MazeSnapshot:
+    """Read-only copy of a maze, built once per run and shared by all workers.
+
+    Cells are packed row-major (index = x * n + y). `blocked[i]` is 1 for a
+    wall, `weights[i]` is the cost of stepping onto cell i, kept as a dense
+    byte plane (weights may be passed as a {(x, y): w} dict or a
+    weights.CellWeights). Nothing can be changed after construction, so
+    threads and processes read it lock-free.
+
+    Open neighbours are precomputed in CSR form: the passable neighbours of
+    cell i are targets[offsets[i]:offsets[i+1]], and costs[k] is the weight
+    of stepping onto targets[k]. `adj[i]` is the same row as a tuple of
+    (target, cost) pairs, the fastest form to loop over in Python; `cells[i]`
+    maps an index back to its (x, y) tuple.
+    """
+
+    __slots__ = ("n", "walls", "blocked", "weights", "weighted", "min_weight",
+                 "offsets", "targets", "costs", "adj", "cells")
+
+    def __init__(self, n, walls=(), weights=None):
+        walls = frozenset(w for w in walls if 0 <= w[0] < n and 0 <= w[1] < n)
+        blocked = bytearray(n * n)
+        for x, y in walls:
+            blocked[x * n + y] = 1
+        store = weights if isinstance(weights, CellWeights) else CellWeights(n, weights)
+        flat = store.dense()
+
+        offsets, targets, costs = array("l", [0]), array("l"), array("l")
+        for i in range(n * n):
+            if not blocked[i]:
+                x, y = divmod(i, n)
+                for dx, dy in DIRECTIONS:
+                    nx, ny = x + dx, y + dy
+                    if 0 <= nx < n and 0 <= ny < n:
+                        j = nx * n + ny
+                        if not blocked[j]:
+                            targets.append(j)
+                            costs.append(flat[j])
+            offsets.append(len(targets))
+        adj = tuple(tuple(zip(targets[offsets[i]:offsets[i + 1]], costs[offsets[i]:offsets[i + 1]]))
+                    for i in range(n * n))
+
+        set_ = object.__setattr__
+        set_(self, "n", n)
+        set_(self, "walls", walls)
+        set_(self, "blocked", bytes(blocked))
+        set_(self, "weights", bytes(flat) if flat.typecode == "B" else tuple(flat))
+        set_(self, "weighted", bool(store))
+        # cheapest possible step, used to scale admissible heuristics
+        set_(self, "min_weight", min(costs) if costs else 1)
+        set_(self, "offsets", offsets)
+        set_(self, "targets", targets)
+        set_(self, "costs", costs)
+        set_(self, "adj", adj)
+        set_(self, "cells", tuple(divmod(i, n) for i in range(n * n)))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("MazeSnapshot is immutable")
+
+    def __reduce__(self):
+        # ship only the source data (weights in COO form); the receiver rebuilds the tables
+        return (MazeSnapshot, (self.n, tuple(self.walls), CellWeights.from_dense(self.n, self.weights)))
+
+    @classmethod
+    def from_edge_weight(cls, n, walls, get_edge_weight):
+        """Snapshot a maze given the solver-style (walls, get_edge_weight) pair.
+
+        Step costs in this app depend only on the cell being entered, so each
+        cell's weight is read once through any in-bounds neighbour.
+        """
+        weights = {}
+        if get_edge_weight is not None:
+            for x in range(n):
+                for y in range(n):
+                    b = (x, y)
+                    a = next(neighbors(b, n), b)
+                    w = get_edge_weight(a, b)
+                    if w != 1:
+                        weights[b] = w
+        return cls(n, walls, weights)
+
+    def fingerprint(self):
+        """Short stable hash of size, walls and weights, for telling mazes apart across runs."""
+        h = hashlib.sha1(str(self.n).encode())
+        h.update(self.blocked)
+        # widened to 4 bytes per cell so fingerprints match those logged before the byte plane
+        h.update(array("I", iter(self.weights)).tobytes())
+        return h.hexdigest()[:16]
+
+    def weight_dict(self):
+        """Weights in the {(x, y): w} form used by utils.generate_weights (non-1 cells only)."""
+        return {self.cells[i]: w for i, w in enumerate(self.weights) if w != 1}
+
+    def index(self, pos):
+        return pos[0] * self.n + pos[1]
+
+    def cell(self, i):
+        return self.cells[i]
+
+    def is_wall(self, pos):
+        return self.blocked[pos[0] * self.n + pos[1]] == 1
+
+    def edge_weight(self, a, b):
+        return self.weights[b[0] * self.n + b[1]]
+
+    def trace(self, parent, s, t):
+        """Cells from s to t following parent links (parent[s] == s), or [] if t was not reached."""
+        if parent[t] < 0:
+            return []
+        cells = self.cells
+        path = [cells[t]]
+        c = t
+        while c != s:
+            c = parent[c]
+            path.append(cells[c])
+        path.reverse()
+        return path
+
+
+def snapshot_for(n, walls, get_edge_weight, maze=None):
+    """The snapshot a solver should read: `maze` if given, else one built from the legacy args."""
+    if maze is not None:
+        return maze
+    return MazeSnapshot.from_edge_weight(n, walls, get_edge_weight)
@@ -2,9 +2,16 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import threading
 import time
-import pandas as pd
-import random
-from utils import generate_weights, in_bounds
+import queue
+import itertools
+from functools import partial
+from utils import generate_weights, generate_walls, in_bounds
+from maze import MazeSnapshot
+from connectivity import Connectivity
+from verify import oracle_for
+from results import ResultsStore, FIELD_NAMES, NO_SEED, WRONG_VERDICTS
+from history import History
+from profiling import profile_call
 
 # Optional image support
 try:
@@ -22,10 +29,33 @@ from algorithms.dijkstra_sequential import dijkstra_sequential
 from algorithms.dijkstra_parallel import dijkstra_parallel
 from algorithms.astar_sequential import astar_sequential
 from algorithms.astar_parallel import astar_parallel
+from algorithms.hda_star import hda_star
+from algorithms.ida_star import ida_star
+from algorithms.sma_star import sma_star
+from algorithms import BATCHED_SOLVERS
+from algorithms.cooperative import ASYNC_SOLVERS, make_solver, run_race
+from algorithms.heuristics import HEURISTICS
+from algorithms.landmarks import landmarks_for
+from algorithms.reduction import ReducedMaze
+from algorithms.multi_agent import METHODS as AGENT_METHODS, solve_agents, random_agents
+from workload import WORKLOADS, make_workload
 
 MAX_GRID_SIZE = 20
 MIN_CELL_SIZE = 20
 MAX_CELL_SIZE = 50
+RACE_CELL_AREA = 210
+AGENT_STEP_MS = 200
+AGENT_COLORS = ["#ffd54f", "#4fc3f7", "#ce93d8", "#80cbc4", "#ffab91", "#a5d6a7",
+                "#f48fb1", "#bcaaa4", "#9fa8da", "#ffcc80", "#b39ddb", "#ff8a65"]
+
+# exploration colours used by each solver, reused for the race viewports
+# (the simulated racers take the colour of the threaded solver they model)
+RACE_COLORS = {
+    ("BFS", "Sequential"): "#FB9070", ("BFS", "Simulated"): "#FB9070",
+    ("DFS", "Sequential"): "#FFC107", ("DFS", "Simulated"): "#A48CE8",
+    ("Dijkstra", "Sequential"): "#92F1CE", ("Dijkstra", "Simulated"): "#ff8a65",
+    ("A*", "Sequential"): "#F5B7B1", ("A*", "Simulated"): "#ffd54f",
+}
 
 def center_window(win, width, height):
     win.update_idletasks()
@@ -65,7 +95,10 @@ class MazeApp:
         self.stop_event = threading.Event()
         self.num_threads = 4
         self.walls = set()
-        self.results = []  # (algo, mode, time, threads)
+        self.connectivity = Connectivity(self.n, self.walls)  # rebuilt whenever walls change
+        self.results = ResultsStore()
+        self.history = None  # opened on the first recorded run
+        self.last_profile = None  # (run label, profile file, hot rows)
         self.cell_size = 36  # Initial cell size
         self.grid_x_offset = 0
         self.grid_y_offset = 0
@@ -137,6 +170,24 @@ class MazeApp:
         chart_btn.pack(side="left", padx=(0,8))
         chart_btn.config(highlightthickness=2, highlightbackground=self.glow_purple)
         make_neon_button(chart_btn, self.button_cyan, self.glow_purple)
+        race_btn = tk.Button(topbar, text="Race", font=("Segoe UI", 10, "bold"),
+                             bg=self.button_purple, fg="black", bd=0, padx=10, pady=6,
+                             activebackground=self.glow_purple, command=self.open_race_setup)
+        race_btn.pack(side="left", padx=(0,8))
+        race_btn.config(highlightthickness=2, highlightbackground=self.glow_purple)
+        make_neon_button(race_btn, self.button_purple, self.glow_purple)
+        scaling_btn = tk.Button(topbar, text="Scaling", font=("Segoe UI", 10, "bold"),
+                                bg=self.button_cyan, fg="black", bd=0, padx=10, pady=6,
+                                activebackground=self.glow_purple, command=self.show_scaling_window)
+        scaling_btn.pack(side="left", padx=(0,8))
+        scaling_btn.config(highlightthickness=2, highlightbackground=self.glow_purple)
+        make_neon_button(scaling_btn, self.button_cyan, self.glow_purple)
+        agents_btn = tk.Button(topbar, text="Agents", font=("Segoe UI", 10, "bold"),
+                               bg=self.button_purple, fg="black", bd=0, padx=10, pady=6,
+                               activebackground=self.glow_purple, command=self.open_agents_setup)
+        agents_btn.pack(side="left", padx=(0,8))
+        agents_btn.config(highlightthickness=2, highlightbackground=self.glow_purple)
+        make_neon_button(agents_btn, self.button_purple, self.glow_purple)
         main = tk.Frame(self.root, bg=self.neon_bg)
         main.pack(fill="both", expand=True, padx=14, pady=(6,14))
         panel_width = 260
@@ -178,6 +229,7 @@ class MazeApp:
                     if self.weighted_mode:
                         self.weights = generate_weights(self.n)
                     self.walls = {(i, j) for (i, j) in self.walls if i < self.n and j < self.n}
+                    self.connectivity = Connectivity(self.n, self.walls)
                     self.calculate_cell_size()
                     self.update_canvas_size()
             except Exception:
@@ -196,6 +248,32 @@ class MazeApp:
                                     bg=self.panel_bg, fg="#25313c", highlightthickness=0,
                                     command=self.update_speed)
         self.speed_slider.pack()
+        tk.Label(left_card, text="Profiling", font=("Segoe UI", 11), fg="#25313c", bg=self.panel_bg).pack(anchor="w", padx=12, pady=(6,0))
+        self.profile_mode = tk.StringVar(value="off")
+        for text, value in (("Off", "off"), ("cProfile", "cprofile"), ("Sampling", "sample")):
+            tk.Radiobutton(left_card, text=text, variable=self.profile_mode, value=value,
+                           bg=self.panel_bg, fg="#25313c", selectcolor=self.neon_bg).pack(anchor="w", padx=18)
+        tk.Label(left_card, text="Workload per cell", font=("Segoe UI", 11), fg="#25313c", bg=self.panel_bg).pack(anchor="w", padx=12, pady=(6,0))
+        self.workload_var = tk.StringVar(value=WORKLOADS[0])
+        ttk.Combobox(left_card, textvariable=self.workload_var, values=WORKLOADS,
+                     state="readonly", width=10).pack(anchor="w", padx=18, pady=(2,4))
+        tk.Label(left_card, text="A* Heuristic / \u03b5", font=("Segoe UI", 11), fg="#25313c", bg=self.panel_bg).pack(anchor="w", padx=12, pady=(6,0))
+        astar_frame = tk.Frame(left_card, bg=self.panel_bg)
+        astar_frame.pack(anchor="w", padx=18, pady=(2,4))
+        self.heuristic_var = tk.StringVar(value=HEURISTICS[0])
+        ttk.Combobox(astar_frame, textvariable=self.heuristic_var, values=HEURISTICS,
+                     state="readonly", width=10).pack(side="left")
+        self.epsilon_spin = tk.Spinbox(astar_frame, from_=1.0, to=3.0, increment=0.1, width=4, font=("Segoe UI",10))
+        self.epsilon_spin.pack(side="left", padx=(6,0))
+        self.verify_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(left_card, text="Verify answers", variable=self.verify_var,
+                       bg=self.panel_bg, fg="#25313c", selectcolor=self.neon_bg).pack(anchor="w", padx=12, pady=(4,0))
+        self.batch_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(left_card, text="Batch cells to processes", variable=self.batch_var,
+                       bg=self.panel_bg, fg="#25313c", selectcolor=self.neon_bg).pack(anchor="w", padx=12, pady=(4,0))
+        self.compress_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(left_card, text="Compress corridors", variable=self.compress_var,
+                       bg=self.panel_bg, fg="#25313c", selectcolor=self.neon_bg).pack(anchor="w", padx=12, pady=(4,0))
         tk.Label(left_card, text="Algorithms", font=("Segoe UI", 11), fg="#25313c", bg=self.panel_bg).pack(anchor="w", padx=12, pady=(6,4))
         btn_cfg = {"width":22, "padx":6, "pady":6, "bd":0}
         def neon_btn(parent, text, cmd, primary=True):
@@ -209,12 +287,16 @@ class MazeApp:
             return b
         neon_btn(left_card, "Sequential BFS", lambda: self.run("BFS","Sequential",bfs_sequential), primary=True)
         neon_btn(left_card, "Parallel BFS", lambda: self.run("BFS","Parallel",bfs_parallel), primary=False)
+        neon_btn(left_card, "Parallel BFS (fast exit)", lambda: self.run("BFS fast-exit","Parallel",partial(bfs_parallel, fast_exit=True)), primary=False)
         neon_btn(left_card, "Sequential DFS", lambda: self.run("DFS","Sequential",dfs_sequential), primary=True)
         neon_btn(left_card, "Parallel DFS", lambda: self.run("DFS","Parallel",dfs_parallel), primary=False)
         neon_btn(left_card, "Sequential Dijkstra", lambda: self.run("Dijkstra","Sequential",dijkstra_sequential), primary=True)
         neon_btn(left_card, "Parallel Dijkstra", lambda: self.run("Dijkstra","Parallel",dijkstra_parallel), primary=False)
         neon_btn(left_card, "Sequential A*", lambda: self.run("A*","Sequential",astar_sequential), primary=True)
         neon_btn(left_card, "Parallel A*", lambda: self.run("A*","Parallel",astar_parallel), primary=False)
+        neon_btn(left_card, "HDA* (processes)", lambda: self.run("HDA*","Parallel",hda_star), primary=False)
+        neon_btn(left_card, "IDA* (bounded memory)", lambda: self.run("IDA*","Sequential",ida_star), primary=True)
+        neon_btn(left_card, "SMA* (bounded memory)", lambda: self.run("SMA*","Sequential",sma_star), primary=True)
         self.canvas_card = tk.Frame(main, bg=self.neon_bg)
         self.canvas_card.pack(side="right", expand=True, fill="both")
         self.canvas_inner = tk.Frame(self.canvas_card, bg=self.grid_bg, bd=2, relief="raised")
@@ -269,6 +351,7 @@ class MazeApp:
                     if self.weighted_mode:
                         self.weights = generate_weights(self.n)
                     self.walls = {(i, j) for (i, j) in self.walls if i < self.n and j < self.n}
+                    self.connectivity = Connectivity(self.n, self.walls)
                     self.calculate_cell_size()
                     self.update_canvas_size()
             except ValueError:
@@ -406,6 +489,33 @@ class MazeApp:
     def get_edge_weight(self, a, b):
         return 1 if not self.weighted_mode else self.weights.get(b, 1)
 
+    def record_result(self, algo, mode, elapsed, threads, maze, backend, expansions, verdict=""):
+        density = len(maze.walls) / (maze.n * maze.n)
+        self.results.append(algo, mode, elapsed, threads, n=maze.n, density=density,
+                            backend=backend, expansions=expansions, verdict=verdict)
+        try:
+            if self.history is None:
+                self.history = History()
+            self.history.log(algo, mode, elapsed, threads, n=maze.n, density=density,
+                             backend=backend, expansions=expansions, maze=maze.fingerprint())
+        except Exception:
+            pass  # the history is best effort, a run must never fail because of it
+
+    def astar_options(self, maze):
+        heuristic = self.heuristic_var.get()
+        try:
+            epsilon = max(1.0, float(self.epsilon_spin.get()))
+        except ValueError:
+            epsilon = 1.0
+        options = {"heuristic": heuristic, "epsilon": epsilon}
+        if heuristic == "alt":
+            # cached per maze; grids here are too small to amortise worker processes
+            options["landmarks"] = landmarks_for(maze, num_workers=1)
+        return options
+
+    def snapshot(self):
+        return MazeSnapshot(self.n, self.walls, self.weights if self.weighted_mode else None)
+
     def stop(self):
         self.stop_event.set()
 
@@ -415,17 +525,13 @@ class MazeApp:
         time.sleep(0.05)
         self.stop_event.clear()
 
-        # Generate all possible cells except start and goal
-        all_cells = [(i, j) for i in range(self.n) for j in range(self.n)
-                    if (i, j) != self.start and (i, j) != self.goal]
-
-        # Randomly pick ~18% of cells to be walls
-        k = int(len(all_cells) * 0.18)
-        self.walls = set(random.sample(all_cells, k))
+        # Randomly pick ~18% of cells (never start or goal) to be walls
+        self.walls = generate_walls(self.n, self.start, self.goal, 0.18)
 
         # Ensure start and goal are never walls (redundant safety)
         self.walls.discard(self.start)
         self.walls.discard(self.goal)
+        self.connectivity = Connectivity(self.n, self.walls)
 
         # Regenerate weights if in weighted mode
         if self.weighted_mode:
@@ -437,20 +543,34 @@ class MazeApp:
     def run(self, algo_name, mode, func):
         self.stop_event.clear()
         self.draw_grid()
+        # freeze the maze now so reset/resize during the solve can't affect it
+        maze, start, goal = self.snapshot(), self.start, self.goal
+        reachable = self.connectivity.connected(start, goal)
+        # solvers then expand only junctions; the path comes back cell by cell
+        solve_on = ReducedMaze.build(maze, (start, goal)) if self.compress_var.get() and reachable else maze
+        profile_mode = self.profile_mode.get()
+        verify = self.verify_var.get()
+        expansions = itertools.count()
+        def draw_cell(pos, color):
+            next(expansions)
+            self.draw_cell(pos, color)
         def task():
             start_time = time.time()
             threads_used = 1
             params = {
-                "start": self.start,
-                "goal": self.goal,
-                "n": self.n,
-                "walls": self.walls,
-                "get_edge_weight": self.get_edge_weight,
-                "draw_cell": self.draw_cell,
+                "start": start,
+                "goal": goal,
+                "n": maze.n,
+                "walls": maze.walls,
+                "get_edge_weight": maze.edge_weight,
+                "draw_cell": draw_cell,
                 "draw_edge": None,
                 "player_update": None,
                 "speed": self.speed,
-                "stop_event": self.stop_event
+                "stop_event": self.stop_event,
+                "maze": solve_on,
+                # same synthetic cost for sequential and parallel runs
+                "workload": make_workload(self.workload_var.get())
             }
             if "Parallel" in mode:
                 try:
@@ -461,9 +581,33 @@ class MazeApp:
                 except:
                     threads_used = self.num_threads
                     params["num_threads"] = threads_used
-            path, used_time = func(**params)
+            if algo_name == "A*" and reachable:
+                params.update(self.astar_options(maze))
+            elif algo_name in ("HDA*", "IDA*", "SMA*") and reachable:
+                options = self.astar_options(maze)
+                params.update(heuristic=options["heuristic"], landmarks=options.get("landmarks"))
+            batched = self.batch_var.get() and (algo_name, mode) in BATCHED_SOLVERS
+            if batched:
+                params["batch"] = 4 * threads_used
+            if not reachable:
+                # start and goal lie in different components: nothing to search
+                path, used_time = [], time.time() - start_time
+            elif profile_mode != "off":
+                label = f"{algo_name} ({mode})"
+                (path, used_time), prof_path, hot = profile_call(func, params, label, profile_mode)
+                self.last_profile = (label, prof_path, hot)
+            else:
+                path, used_time = func(**params)
             elapsed = used_time if used_time else time.time() - start_time
-            self.results.append((algo_name, mode, elapsed, threads_used))
+            verdict = ""
+            if verify and reachable and not self.stop_event.is_set():
+                # weighted A* promises at most epsilon times the optimum
+                verdict, _, _ = oracle_for(maze, start).check(algo_name, path, goal, params.get("epsilon", 1.0),
+                                                              reduced=solve_on is not maze)
+            check = f"\nCheck: {verdict}" if verdict else ""
+            if reachable:
+                backend = "processes" if func is hda_star or batched else "threads" if "Parallel" in mode else "serial"
+                self.record_result(algo_name, mode, elapsed, threads_used, maze, backend, next(expansions), verdict)
             def show_result_window(title, message, success=True):
                 win = tk.Toplevel(self.root)
                 win.title(title)
@@ -486,24 +630,225 @@ class MazeApp:
                 self.highlight_path(path)
                 show_result_window(
                     "Algorithm Complete",
-                    f"{algo_name} ({mode})\nTime: {elapsed:.4f} seconds\nThreads used: {threads_used}\nPath length: {len(path)}",
+                    f"{algo_name} ({mode})\nTime: {elapsed:.4f} seconds\nThreads used: {threads_used}\nPath length: {len(path)}{check}",
                     success=True
                 )
+            elif not reachable:
+                show_result_window(
+                    "No Path Found",
+                    f"{algo_name} ({mode})\nStart and goal are not connected;\nthe solver was not run.",
+                    success=False
+                )
             else:
                 show_result_window(
                     "No Path Found",
-                    f"{algo_name} ({mode})\nTime: {elapsed:.4f} seconds\nThreads used: {threads_used}\nNo path found from start to goal!",
+                    f"{algo_name} ({mode})\nTime: {elapsed:.4f} seconds\nThreads used: {threads_used}\nNo path found from start to goal!{check}",
                     success=False
                 )
         threading.Thread(target=task, daemon=True).start()
 
+    def open_race_setup(self):
+        win = tk.Toplevel(self.root)
+        win.title("Race Setup")
+        center_window(win, 300, 420)
+        win.configure(bg=self.panel_bg)
+        tk.Label(win, text="Pick the racers", font=("Segoe UI", 14, "bold"),
+                 fg=self.text_light, bg=self.panel_bg).pack(pady=(12, 6))
+        picks = {}
+        for key in ASYNC_SOLVERS:
+            picks[key] = tk.BooleanVar(value=True)
+            tk.Checkbutton(win, text=f"{key[1]} {key[0]}", variable=picks[key],
+                           bg=self.panel_bg, fg="#25313c", selectcolor=self.neon_bg).pack(anchor="w", padx=40)
+        def go():
+            selected = [k for k, v in picks.items() if v.get()]
+            win.destroy()
+            if selected:
+                self.start_race(selected)
+        go_btn = tk.Button(win, text="Start Race", font=("Segoe UI", 10, "bold"),
+                           bg=self.button_cyan, fg="black", bd=0, padx=15, pady=8,
+                           activebackground=self.glow_purple, command=go)
+        go_btn.pack(pady=14)
+        make_neon_button(go_btn, self.button_cyan, self.glow_purple)
+        win.transient(self.root)
+        win.grab_set()
+
+    def start_race(self, selected):
+        """Run the selected solvers together on one snapshot of the maze.
+
+        Solvers run cooperatively on an asyncio loop in one background thread;
+        their batches go through a queue that the Tk loop drains into one
+        mini viewport per solver.
+        """
+        self.stop_event.clear()
+        maze = self.snapshot()
+        n, start, goal, walls = maze.n, self.start, self.goal, maze.walls
+        try:
+            threads = max(1, int(self.thread_spin.get()))
+        except ValueError:
+            threads = self.num_threads
+        workload = make_workload(self.workload_var.get())
+
+        win = tk.Toplevel(self.root)
+        win.title("Algorithm Race")
+        win.configure(bg=self.neon_bg)
+        cell = max(3, RACE_CELL_AREA // n)
+        cols = min(4, len(selected))
+        views = {}
+        for idx, key in enumerate(selected):
+            name = f"{key[1]} {key[0]}"
+            frame = tk.Frame(win, bg=self.panel_bg, highlightthickness=2, highlightbackground=self.glow_purple)
+            frame.grid(row=idx // cols, column=idx % cols, padx=6, pady=6)
+            tk.Label(frame, text=name, font=("Segoe UI", 10, "bold"), fg=self.text_light, bg=self.panel_bg).pack()
+            canvas = tk.Canvas(frame, width=n * cell, height=n * cell, bg=self.cream, highlightthickness=0)
+            canvas.pack(padx=4)
+            for (i, j) in walls:
+                canvas.create_rectangle(j * cell, i * cell, (j + 1) * cell, (i + 1) * cell,
+                                        fill=self.dark_blue, outline="")
+            for (i, j), fill in ((start, self.teal), (goal, self.red)):
+                canvas.create_rectangle(j * cell, i * cell, (j + 1) * cell, (i + 1) * cell, fill=fill, outline="")
+            counter = tk.Label(frame, text="0 expanded", font=("Segoe UI", 9), fg="#25313c", bg=self.panel_bg)
+            counter.pack(pady=(0, 4))
+            views[name] = (canvas, counter, RACE_COLORS[key])
+
+        events = queue.Queue()
+        solvers = {f"{key[1]} {key[0]}": make_solver(key[0], key[1], start, goal, n, walls, maze.edge_weight,
+                                                     self.stop_event, num_threads=threads, batch_size=4, maze=maze,
+                                                     workload=workload)
+                   for key in selected}
+
+        def on_batch(name, cells, expanded, elapsed):
+            events.put((name, cells, expanded, elapsed, None))
+
+        def task():
+            results = run_race(solvers, self.stop_event, on_batch, delay=self.speed)
+            # race times include the animation delay and the other racers' turns,
+            # so they are shown here but kept out of the results and the history
+            for key in selected:
+                name = f"{key[1]} {key[0]}"
+                path, elapsed, expanded = results[name]
+                events.put((name, [], expanded, elapsed, path))
+
+        def drain():
+            try:
+                while True:
+                    name, cells, expanded, elapsed, path = events.get_nowait()
+                    canvas, counter, color = views[name]
+                    for (i, j) in cells:
+                        if (i, j) not in (start, goal):
+                            canvas.create_rectangle(j * cell, i * cell, (j + 1) * cell, (i + 1) * cell,
+                                                    fill=color, outline="")
+                    rate = expanded / elapsed if elapsed > 0 else 0.0
+                    text = f"{expanded} expanded | {rate:,.0f}/s"
+                    if path is not None:
+                        for (i, j) in path:
+                            canvas.create_rectangle(j * cell, i * cell, (j + 1) * cell, (i + 1) * cell,
+                                                    fill=self.yellow, outline=self.red)
+                        text += f" | {elapsed:.3f}s | path {len(path) or 'none'}"
+                    counter.config(text=text)
+            except queue.Empty:
+                pass
+            except tk.TclError:
+                return
+            if win.winfo_exists():
+                win.after(30, drain)
+
+        win.protocol("WM_DELETE_WINDOW", lambda: (self.stop_event.set(), win.destroy()))
+        threading.Thread(target=task, daemon=True).start()
+        drain()
+
+    def open_agents_setup(self):
+        win = tk.Toplevel(self.root)
+        win.title("Multi-agent Setup")
+        center_window(win, 300, 260)
+        win.configure(bg=self.panel_bg)
+        tk.Label(win, text="Agents", font=("Segoe UI", 14, "bold"),
+                 fg=self.text_light, bg=self.panel_bg).pack(pady=(12, 6))
+        count = tk.Spinbox(win, from_=1, to=100, width=6, font=("Segoe UI",10))
+        count.delete(0, "end"); count.insert(0, "8")
+        count.pack(pady=(0, 6))
+        method = tk.StringVar(value=AGENT_METHODS[0])
+        for value, text in zip(AGENT_METHODS, ("Prioritized planning", "Conflict-based search")):
+            tk.Radiobutton(win, text=text, variable=method, value=value,
+                           bg=self.panel_bg, fg="#25313c", selectcolor=self.neon_bg).pack(anchor="w", padx=50)
+        def go():
+            try:
+                k = max(1, int(count.get()))
+            except ValueError:
+                k = 8
+            win.destroy()
+            self.start_agents(k, method.get())
+        go_btn = tk.Button(win, text="Plan", font=("Segoe UI", 10, "bold"),
+                           bg=self.button_cyan, fg="black", bd=0, padx=15, pady=8,
+                           activebackground=self.glow_purple, command=go)
+        go_btn.pack(pady=14)
+        make_neon_button(go_btn, self.button_cyan, self.glow_purple)
+        win.transient(self.root)
+        win.grab_set()
+
+    def start_agents(self, count, method):
+        """Plan random agents on a snapshot of the maze in the background, then animate them."""
+        self.stop_event.clear()
+        self.draw_grid()
+        maze = self.snapshot()
+        agents = random_agents(maze, count)
+        try:
+            workers = max(1, int(self.thread_spin.get()))
+        except ValueError:
+            workers = self.num_threads
+        done = queue.Queue()
+        threading.Thread(target=lambda: done.put(solve_agents(maze, agents, method, workers,
+                                                              stop_event=self.stop_event)),
+                         daemon=True).start()
+
+        def wait():
+            try:
+                paths, elapsed, info = done.get_nowait()
+            except queue.Empty:
+                self.root.after(50, wait)
+                return
+            if not self.stop_event.is_set():
+                self.animate_agents(agents, paths, elapsed, info)
+        wait()
+
+    def animate_agents(self, agents, paths, elapsed, info):
+        c = self.cell_size
+        def corner(pos):
+            return self.grid_x_offset + pos[1] * c, self.grid_y_offset + pos[0] * c
+        tokens = []
+        for k, ((start, goal), path) in enumerate(zip(agents, paths)):
+            color = AGENT_COLORS[k % len(AGENT_COLORS)]
+            gx, gy = corner(goal)
+            self.canvas.create_rectangle(gx + 3, gy + 3, gx + c - 3, gy + c - 3, outline=color, width=3)
+            x, y = corner(start)
+            tokens.append(self.canvas.create_oval(x + 5, y + 5, x + c - 5, y + c - 5, fill=color,
+                                                  outline="black" if path else self.red, width=2))
+        steps = info["makespan"]
+
+        def step(t):
+            if self.stop_event.is_set():
+                return
+            for token, path in zip(tokens, paths):
+                if path:
+                    x, y = corner(path[min(t, len(path) - 1)])
+                    self.canvas.coords(token, x + 5, y + 5, x + c - 5, y + c - 5)
+            if t < steps:
+                self.root.after(AGENT_STEP_MS, step, t + 1)
+            else:
+                messagebox.showinfo("Agents Arrived",
+                                    f"{len(agents)} agents ({info['method']})\n"
+                                    f"Planning time: {elapsed:.3f} s\n"
+                                    f"Makespan: {info['makespan']} steps\n"
+                                    f"Sum of costs: {info['sum_of_costs']}\n"
+                                    f"Without a plan: {info['failed']}")
+        step(0)
+
     def show_results_table(self):
         if not self.results:
             messagebox.showwarning("No Results", "Run some algorithms first!")
             return
         win = tk.Toplevel(self.root)
         win.title("Execution Results")
-        center_window(win, 750, 480)
+        center_window(win, 960, 640)
         win.configure(bg=self.teal)
         title_label = tk.Label(
             win,
@@ -535,11 +880,11 @@ class MazeApp:
         style.map("Custom.Treeview",
                 background=[('selected', self.glow_cyan)],
                 foreground=[('selected', 'black')])
-        cols = ("Algorithm", "Mode", "Time (s)", "Threads")
+        cols = ("Algorithm", "Mode", "Backend", "Time (s)", "Threads", "Size", "Expanded", "Check")
         tree = ttk.Treeview(table_frame, columns=cols, show="headings", style="Custom.Treeview")
         for col in cols:
             tree.heading(col, text=col, anchor="center")
-            tree.column(col, anchor="center", width=150, minwidth=100)
+            tree.column(col, anchor="center", width=110, minwidth=70)
         vsb = ttk.Scrollbar(table_frame, orient="vertical", command=tree.yview)
         hsb = ttk.Scrollbar(table_frame, orient="horizontal", command=tree.xview)
         tree.configure(yscrollcommand=vsb.set, xscrollcommand=hsb.set)
@@ -548,11 +893,46 @@ class MazeApp:
         hsb.grid(row=1, column=0, sticky="ew", padx=5)
         table_frame.grid_rowconfigure(0, weight=1)
         table_frame.grid_columnconfigure(0, weight=1)
-        for i, (algo, mode, t, th) in enumerate(self.results):
+        for i, row in enumerate(self.results.rows()):
+            r = dict(zip(FIELD_NAMES, row))
             tag = "evenrow" if i % 2 == 0 else "oddrow"
-            tree.insert("", tk.END, values=(algo, mode, f"{t:.4f}", th), tags=(tag,))
+            if r["verdict"] in WRONG_VERDICTS:
+                tag = "wrongrow"
+            tree.insert("", tk.END, values=(r["algo"], r["mode"], r["backend"], f"{r['time']:.4f}",
+                                            r["threads"], r["n"], r["expansions"], r["verdict"] or "-"),
+                        tags=(tag,))
         tree.tag_configure("evenrow", background="#1a0f30", foreground="#E6DCC3")
         tree.tag_configure("oddrow", background=self.panel_bg, foreground="#1a0f30")
+        tree.tag_configure("wrongrow", background=self.red, foreground="#E6DCC3")
+        sum_cols = ("Group", "Runs", "Mean (s)", "Median (s)", "Std dev", "95% CI", "Speedup")
+        summary = ttk.Treeview(table_frame, columns=sum_cols, show="headings", style="Custom.Treeview", height=6)
+        for col in sum_cols:
+            summary.heading(col, text=col, anchor="center")
+            summary.column(col, anchor="center", width=110, minwidth=70)
+        summary.column("Group", width=220)
+        summary.grid(row=2, column=0, columnspan=2, sticky="ew", padx=5, pady=(8, 5))
+        for algo, mode, backend, th, agg, speedup in self.results.summary():
+            lo, hi = agg.ci95
+            sp = "-" if speedup is None else f"{speedup:.2f}x"
+            wrong = self.results.wrong_count(algo, mode, backend, th)
+            if wrong:
+                sp += f" ({wrong} wrong)"  # speedup bought with wrong answers
+            summary.insert("", tk.END, values=(
+                f"{algo} {mode} ({backend}, {th}t)", agg.count, f"{agg.mean:.4f}", f"{agg.median:.4f}",
+                f"{agg.stddev:.4f}", f"{lo:.4f}–{hi:.4f}", sp))
+        if self.last_profile:
+            label, prof_path, hot = self.last_profile
+            tk.Label(table_frame, text=f"Hot functions — {label}   ({prof_path})", font=("Segoe UI", 9, "bold"),
+                     fg=self.text_light, bg=self.panel_bg, anchor="w").grid(row=3, column=0, columnspan=2, sticky="ew", padx=5)
+            hot_cols = ("Function", "Calls/Samples", "Self (s)", "Total (s)")
+            hot_tree = ttk.Treeview(table_frame, columns=hot_cols, show="headings", style="Custom.Treeview", height=5)
+            for col in hot_cols:
+                hot_tree.heading(col, text=col, anchor="center")
+                hot_tree.column(col, anchor="center", width=110, minwidth=70)
+            hot_tree.column("Function", width=420, anchor="w")
+            hot_tree.grid(row=4, column=0, columnspan=2, sticky="ew", padx=5, pady=(0, 5))
+            for fn, count, own, total in hot[:10]:
+                hot_tree.insert("", tk.END, values=(fn, count, f"{own:.4f}", f"{total:.4f}"))
         btn_frame = tk.Frame(win, bg=self.neon_bg)
         btn_frame.pack(pady=(15, 20))
         clear_btn = tk.Button(btn_frame, text="Clear Results",
@@ -560,7 +940,8 @@ class MazeApp:
                             bg=self.button_purple, fg="black",
                             bd=0, padx=15, pady=8,
                             activebackground=self.glow_purple,
-                            command=lambda: (self.results.clear(), tree.delete(*tree.get_children())))
+                            command=lambda: (self.results.clear(), tree.delete(*tree.get_children()),
+                                             summary.delete(*summary.get_children())))
         clear_btn.pack(side="left", padx=10)
         clear_btn.config(highlightthickness=2, highlightbackground=self.glow_purple)
         make_neon_button(clear_btn, self.button_purple, self.glow_purple)
@@ -583,8 +964,8 @@ class MazeApp:
         close_btn.config(highlightthickness=2, highlightbackground=self.glow_cyan)
         make_neon_button(close_btn, self.panel_bg, self.glow_cyan)
         total_runs = len(self.results)
-        seq_runs = len([r for r in self.results if r[1] == "Sequential"])
-        par_runs = len([r for r in self.results if r[1] == "Parallel"])
+        seq_runs = self.results.count("Sequential")
+        par_runs = self.results.count("Parallel")
         stats_label = tk.Label(win,
                             text=f"Total Runs: {total_runs} | Sequential: {seq_runs} | Parallel: {par_runs}",
                             font=("Segoe UI", 9),
@@ -609,9 +990,10 @@ class MazeApp:
             if file_path:
                 with open(file_path, 'w', newline='') as csvfile:
                     writer = csv.writer(csvfile)
-                    writer.writerow(["Algorithm", "Mode", "Time (s)", "Threads"])
-                    for a, m, t, th in self.results:
-                        writer.writerow([a, m, f"{t:.4f}", th])
+                    writer.writerow(FIELD_NAMES)
+                    for row in self.results.rows():
+                        writer.writerow(["" if v == NO_SEED and k == "seed" else v
+                                         for k, v in zip(FIELD_NAMES, row)])
                 messagebox.showinfo("Export Successful", f"Results exported to:\n{file_path}")
         except Exception as e:
             messagebox.showerror("Export Error", f"Failed to export results: {str(e)}")
@@ -642,25 +1024,13 @@ class MazeApp:
         )
         title_label.pack(pady=(10, 5))
         fig, ax = plt.subplots(figsize=(10, 6), facecolor='#050014')
-        df = pd.DataFrame(self.results, columns=["Algorithm", "Mode", "Time", "Threads"])
-        algorithms = sorted(df["Algorithm"].unique())
+        algorithms = self.results.algorithms()
         sequential_color = self.button_purple
         parallel_color = self.button_cyan
         x = range(len(algorithms))
         width = 0.35
-        sequential_times = []
-        parallel_times = []
-        for algo in algorithms:
-            seq_data = df[(df["Algorithm"] == algo) & (df["Mode"] == "Sequential")]
-            par_data = df[(df["Algorithm"] == algo) & (df["Mode"] == "Parallel")]
-            if not seq_data.empty:
-                sequential_times.append(seq_data["Time"].mean())
-            else:
-                sequential_times.append(0)
-            if not par_data.empty:
-                parallel_times.append(par_data["Time"].mean())
-            else:
-                parallel_times.append(0)
+        sequential_times = [self.results.mean_time(algo, "Sequential") for algo in algorithms]
+        parallel_times = [self.results.mean_time(algo, "Parallel") for algo in algorithms]
         bars1 = ax.bar([i - width/2 for i in x], sequential_times, width, 
                       label='Sequential', color=sequential_color, edgecolor='white', linewidth=1)
         bars2 = ax.bar([i + width/2 for i in x], parallel_times, width, 
@@ -719,3 +1089,85 @@ class MazeApp:
         note_label.pack(pady=(0, 5))
         chart_win.transient(self.root)
         chart_win.grab_set()
+
+    def show_scaling_window(self):
+        """Sweep every parallel solver over 1..12 threads and plot strong/weak scaling."""
+        try:
+            import matplotlib
+            matplotlib.use('Agg')
+            import matplotlib.pyplot as plt
+            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        except ImportError:
+            messagebox.showerror("Matplotlib Required",
+                                "Please install matplotlib to view charts:\n\npip install matplotlib")
+            return
+        from scaling import sweep
+        self.stop_event.clear()
+        n, weighted = self.n, self.weighted_mode
+        workload = make_workload(self.workload_var.get())
+        win = tk.Toplevel(self.root)
+        win.title("Scaling Analysis")
+        center_window(win, 1000, 720)
+        win.configure(bg=self.neon_bg)
+        tk.Label(win, text=f"Strong / weak scaling of the parallel solvers (n={n})",
+                 font=("Verdana", 16, "bold"), fg=self.glow_cyan, bg=self.neon_bg).pack(pady=(10, 5))
+        status = tk.Label(win, text="Measuring...", font=("Segoe UI", 10), fg="#bcdcff", bg=self.neon_bg)
+        status.pack()
+        events = queue.Queue()
+
+        def task():
+            try:
+                result = sweep(sizes=(n,), repeat=1, weighted=weighted, stop_event=self.stop_event,
+                               workload=workload,
+                               progress=lambda done, total, label: events.put((f"[{done}/{total}] {label}", None)))
+            except InterruptedError:
+                events.put(("Stopped.", None))
+                return
+            events.put(("Done.", result))
+
+        def plot(result):
+            fig, axes = plt.subplots(2, 2, figsize=(10, 6.5), facecolor='#050014')
+            titles = ("Strong scaling: speedup", "Strong scaling: efficiency",
+                      "Karp-Flatt serial fraction", "Weak scaling: efficiency")
+            for ax, title in zip(axes.flat, titles):
+                ax.set_facecolor("#25222B")
+                ax.set_title(title, color=self.glow_cyan, fontsize=11)
+                ax.tick_params(colors='white')
+                ax.set_xlabel("threads", color='white')
+                ax.grid(True, alpha=0.2, color='white', linestyle='--')
+            for (algo, mode), curves in result.items():
+                rows = curves["strong"][n]
+                ps = [r[0] for r in rows]
+                axes[0][0].plot(ps, [r[2] for r in rows], marker="o", label=algo)
+                axes[0][1].plot(ps, [r[3] for r in rows], marker="o", label=algo)
+                kf = [(r[0], r[4]) for r in rows if r[4] is not None]
+                axes[1][0].plot([p for p, _ in kf], [e for _, e in kf], marker="o", label=algo)
+                weak = curves["weak"]
+                axes[1][1].plot([r[0] for r in weak], [r[3] for r in weak], marker="o", label=algo)
+            top = max(max(r[0] for r in c["strong"][n]) for c in result.values())
+            axes[0][0].plot([1, top], [1, top], color="white", linestyle=":", label="ideal")
+            for ax in axes.flat:
+                ax.legend(facecolor='#050014', edgecolor='white', labelcolor='white', fontsize=8)
+            plt.tight_layout()
+            canvas = FigureCanvasTkAgg(fig, master=win)
+            canvas.draw()
+            canvas.get_tk_widget().pack(expand=True, fill='both', padx=10, pady=10)
+
+        def drain():
+            try:
+                while True:
+                    text, result = events.get_nowait()
+                    status.config(text=text)
+                    if result:
+                        plot(result)
+                        return
+            except queue.Empty:
+                pass
+            except tk.TclError:
+                return
+            if win.winfo_exists():
+                win.after(100, drain)
+
+        win.protocol("WM_DELETE_WINDOW", lambda: (self.stop_event.set(), win.destroy()))
+        threading.Thread(target=task, daemon=True).start()
+        drain()
@@ -0,0 +1,132 @@
+"""Opt-in profiling of single solver runs.
+
+Two modes:
+  "cprofile" - deterministic cProfile of the calling thread and of every
+               thread started during the run; saved as a pstats .prof file.
+  "sample"   - low-overhead sampler reading every thread's stack each
+               `interval` seconds; saved as collapsed stacks (.folded), the
+               input format of flamegraph tools.
+Both return the hottest functions as (label, count, self_s, total_s) rows.
+"""
+import os, re, sys, time, pstats, cProfile, threading, itertools
+from collections import Counter
+
+PROFILE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "profiles")
+MODES = ("cprofile", "sample")
+
+_run_ids = itertools.count(1)
+
+
+def _slug(text):
+    return re.sub(r"[^A-Za-z0-9]+", "_", text).strip("_").lower() or "run"
+
+
+def _out_path(label, ext, out_dir):
+    os.makedirs(out_dir, exist_ok=True)
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    return os.path.join(out_dir, f"{_slug(label)}-{stamp}-{os.getpid()}-{next(_run_ids)}{ext}")
+
+
+def _func_label(filename, line, name):
+    return f"{os.path.basename(filename)}:{line}({name})"
+
+
+def _run_cprofile(call, path, top):
+    thread_profiles = []
+
+    def start_thread_profile(frame, event, arg):
+        # installed in each new thread by threading.setprofile; hands over to
+        # a per-thread cProfile on the first event
+        prof = cProfile.Profile()
+        thread_profiles.append(prof)
+        prof.enable()
+
+    main = cProfile.Profile()
+    threading.setprofile(start_thread_profile)
+    main.enable()
+    try:
+        result = call()
+    finally:
+        main.disable()
+        threading.setprofile(None)
+
+    stats = pstats.Stats(main)
+    for prof in thread_profiles:
+        try:
+            stats.add(prof)
+        except TypeError:
+            pass  # thread never recorded anything
+    stats.dump_stats(path)
+
+    rows = []
+    for (filename, line, name), (cc, nc, tt, ct, _) in stats.stats.items():
+        rows.append((_func_label(filename, line, name), nc, tt, ct))
+    rows.sort(key=lambda r: r[2], reverse=True)
+    return result, rows[:top]
+
+
+def _run_sampler(call, path, top, interval):
+    stacks = Counter()
+    done = threading.Event()
+    # only the calling thread and threads the run starts (e.g. not the Tk loop)
+    caller = threading.get_ident()
+    ignore = set(sys._current_frames()) - {caller}
+
+    def sampler():
+        ignore.add(threading.get_ident())
+        while not done.wait(interval):
+            for tid, frame in sys._current_frames().items():
+                if tid in ignore:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(_func_label(code.co_filename, code.co_firstlineno, code.co_name))
+                    frame = frame.f_back
+                stacks[tuple(reversed(stack))] += 1
+
+    # the solver runs on the calling thread, so sample from a helper thread
+    th = threading.Thread(target=sampler, daemon=True)
+    th.start()
+    try:
+        result = call()
+    finally:
+        done.set()
+        th.join()
+
+    with open(path, "w") as f:
+        for stack, count in stacks.most_common():
+            f.write(";".join(stack) + f" {count}\n")
+
+    own, inclusive = Counter(), Counter()
+    for stack, count in stacks.items():
+        own[stack[-1]] += count
+        for label in set(stack):
+            inclusive[label] += count
+    rows = [(label, count, count * interval, inclusive[label] * interval)
+            for label, count in own.most_common(top)]
+    return result, rows
+
+
+def profile_call(func, params, label, mode="cprofile", out_dir=PROFILE_DIR, top=15, interval=0.001):
+    """Call func(**params) under a profiler.
+
+    Returns (func's result, saved profile path, hot rows).
+    """
+    if mode not in MODES:
+        raise ValueError(f"unknown profile mode: {mode}")
+    call = lambda: func(**params)
+    if mode == "cprofile":
+        path = _out_path(label, ".prof", out_dir)
+        result, rows = _run_cprofile(call, path, top)
+    else:
+        path = _out_path(label, ".folded", out_dir)
+        result, rows = _run_sampler(call, path, top, interval)
+    return result, path, rows
+
+
+def format_hot(rows):
+    lines = [f"{'function':<52} {'count':>8} {'self s':>9} {'total s':>9}"]
+    for label, count, own, total in rows:
+        lines.append(f"{label[:52]:<52} {count:>8} {own:9.4f} {total:9.4f}")
+    return "\n".join(lines)
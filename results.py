@@ -0,0 +1,158 @@
+import math, bisect
+from array import array
+
+# Column layout of a results store: (name, array typecode). "U" columns hold
+# short labels and are dictionary-encoded into an array of codes.
+FIELDS = (
+    ("algo", "U"),
+    ("mode", "U"),
+    ("backend", "U"),
+    ("time", "d"),
+    ("threads", "l"),
+    ("n", "l"),
+    ("density", "d"),
+    ("seed", "q"),
+    ("expansions", "q"),
+    ("verdict", "U"),
+)
+FIELD_NAMES = tuple(name for name, _ in FIELDS)
+
+NO_SEED = -1
+
+# verdicts (see verify.py) that count as a wrong answer; "" means unverified
+WRONG_VERDICTS = frozenset(("invalid", "suboptimal", "missed"))
+
+# two-sided 95% Student-t critical values for df = 1..30 (1.96 beyond)
+_T95 = (12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+        2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+        2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042)
+
+
+def t95(df):
+    if df < 1:
+        return float("nan")
+    return _T95[df - 1] if df <= len(_T95) else 1.96
+
+
+class Aggregate:
+    """Running statistics of one group of timings, updated on every add()."""
+
+    __slots__ = ("count", "mean", "m2", "ordered")
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.ordered = []
+
+    def add(self, x):
+        # Welford's update keeps mean/variance exact without a second pass
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (x - self.mean)
+        bisect.insort(self.ordered, x)
+
+    @property
+    def median(self):
+        k = self.count
+        if not k:
+            return float("nan")
+        mid = k // 2
+        return self.ordered[mid] if k % 2 else (self.ordered[mid - 1] + self.ordered[mid]) / 2
+
+    @property
+    def stddev(self):
+        return math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else 0.0
+
+    @property
+    def ci95(self):
+        """95% confidence interval of the mean, (low, high)."""
+        if self.count < 2:
+            return (self.mean, self.mean)
+        half = t95(self.count - 1) * self.stddev / math.sqrt(self.count)
+        return (self.mean - half, self.mean + half)
+
+
+class ResultsStore:
+    """Append-only columnar store of solver runs with live aggregates.
+
+    Every column is a flat array (see FIELDS). Aggregates are kept per
+    (algo, mode, backend, threads) group and per (algo, mode), so summaries
+    and charts never rescan the rows.
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self.columns = {name: array("H" if code == "U" else code) for name, code in FIELDS}
+        self.labels = {name: [] for name, code in FIELDS if code == "U"}
+        self._codes = {name: {} for name in self.labels}
+        self.groups = {}
+        self.by_mode = {}
+        self.wrong = {}  # group -> number of runs with a wrong answer
+
+    def __len__(self):
+        return len(self.columns["time"])
+
+    def _encode(self, name, value):
+        codes = self._codes[name]
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(self.labels[name])
+            self.labels[name].append(value)
+        return code
+
+    def append(self, algo, mode, time, threads, n=0, density=0.0, seed=None,
+               backend="threads", expansions=0, verdict=""):
+        row = {"algo": algo, "mode": mode, "backend": backend, "time": time,
+               "threads": threads, "n": n, "density": density,
+               "seed": NO_SEED if seed is None else seed, "expansions": expansions,
+               "verdict": verdict}
+        for name, code in FIELDS:
+            value = row[name]
+            self.columns[name].append(self._encode(name, value) if code == "U" else value)
+        self.groups.setdefault((algo, mode, backend, threads), Aggregate()).add(time)
+        self.by_mode.setdefault((algo, mode), Aggregate()).add(time)
+        if verdict in WRONG_VERDICTS:
+            key = (algo, mode, backend, threads)
+            self.wrong[key] = self.wrong.get(key, 0) + 1
+
+    def column(self, name):
+        if name in self.labels:
+            labels = self.labels[name]
+            return [labels[c] for c in self.columns[name]]
+        return self.columns[name]
+
+    def rows(self):
+        """Yield each run as a tuple in FIELD_NAMES order."""
+        return zip(*(self.column(name) for name in FIELD_NAMES))
+
+    def algorithms(self):
+        return sorted(self.labels["algo"])
+
+    def count(self, mode):
+        return sum(agg.count for (_, m), agg in self.by_mode.items() if m == mode)
+
+    def mean_time(self, algo, mode):
+        agg = self.by_mode.get((algo, mode))
+        return agg.mean if agg else 0.0
+
+    def speedup(self, algo, mode, backend, threads):
+        """Mean sequential time of algo divided by the group's mean time."""
+        base = self.by_mode.get((algo, "Sequential"))
+        agg = self.groups.get((algo, mode, backend, threads))
+        if not base or not agg or agg.mean <= 0:
+            return None
+        return base.mean / agg.mean
+
+    def wrong_count(self, algo=None, mode=None, backend=None, threads=None):
+        """Wrong answers in one group, or in all groups when called without arguments."""
+        if algo is None:
+            return sum(self.wrong.values())
+        return self.wrong.get((algo, mode, backend, threads), 0)
+
+    def summary(self):
+        """[(algo, mode, backend, threads, Aggregate, speedup)] sorted by group."""
+        return [key + (agg, self.speedup(*key)) for key, agg in sorted(self.groups.items())]
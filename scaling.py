@@ -0,0 +1,101 @@
+"""Strong and weak scaling sweeps for the parallel solvers.
+
+Strong scaling keeps the maze fixed and varies the worker count p:
+speedup S = T(1) / T(p), efficiency E = S / p and the Karp-Flatt
+experimentally determined serial fraction e = (1/S - 1/p) / (1 - 1/p).
+Weak scaling grows the maze with p (cells proportional to p, so the side is
+n0 * sqrt(p)) and reports efficiency T(1, n0) / T(p, n_p).
+"""
+import math
+
+from algorithms import SOLVERS
+from bench import make_maze, run_solver
+from workload import NO_WORK
+
+PARALLEL_SOLVERS = [key for key in SOLVERS if key[1] == "Parallel"]
+DEFAULT_THREADS = (1, 2, 4, 8, 12)
+
+
+def karp_flatt(speedup, p):
+    if p <= 1 or speedup <= 0:
+        return None
+    return (1.0 / speedup - 1.0 / p) / (1.0 - 1.0 / p)
+
+
+def weak_size(n0, p):
+    return max(n0, round(n0 * math.sqrt(p)))
+
+
+def mean_time(key, n, p, repeat=3, density=0.18, seed=0, weighted=False, stop_event=None,
+              workload=NO_WORK):
+    maze, start, goal = make_maze(n, density, seed, weighted)
+    total = 0.0
+    for _ in range(repeat):
+        if stop_event is not None and stop_event.is_set():
+            raise InterruptedError("scaling sweep stopped")
+        _, elapsed, _ = run_solver(SOLVERS[key], maze, start, goal, p, parallel=True, workload=workload)
+        total += elapsed
+    return total / repeat
+
+
+def strong_rows(times):
+    """[(p, time)] with p=1 first -> [(p, time, speedup, efficiency, karp_flatt)]."""
+    base = times[0][1]
+    rows = []
+    for p, t in times:
+        s = base / t if t > 0 else 0.0
+        rows.append((p, t, s, s / p, karp_flatt(s, p)))
+    return rows
+
+
+def weak_rows(times):
+    """[(p, n, time)] with p=1 first -> [(p, n, time, weak_efficiency)]."""
+    base = times[0][2]
+    return [(p, n, t, base / t if t > 0 else 0.0) for p, n, t in times]
+
+
+def sweep(keys=None, sizes=(20,), threads=DEFAULT_THREADS, repeat=3, density=0.18,
+          seed=0, weighted=False, progress=None, stop_event=None, workload=NO_WORK):
+    """Run strong scaling at every size and weak scaling from the smallest size.
+
+    Returns {key: {"strong": {n: strong_rows}, "weak": weak_rows}}.
+    progress(done, total, label) is called after every measurement.
+    """
+    keys = list(keys or PARALLEL_SOLVERS)
+    threads = sorted(set(threads) | {1})
+    n0 = min(sizes)
+    total = len(keys) * (len(sizes) + 1) * len(threads)
+    done = 0
+    out = {}
+    for key in keys:
+        strong = {}
+        for n in sizes:
+            times = []
+            for p in threads:
+                times.append((p, mean_time(key, n, p, repeat, density, seed, weighted, stop_event, workload)))
+                done += 1
+                if progress:
+                    progress(done, total, f"{key[0]} strong n={n} p={p}")
+            strong[n] = strong_rows(times)
+        weak = []
+        for p in threads:
+            n = weak_size(n0, p)
+            weak.append((p, n, mean_time(key, n, p, repeat, density, seed, weighted, stop_event, workload)))
+            done += 1
+            if progress:
+                progress(done, total, f"{key[0]} weak n={n} p={p}")
+        out[key] = {"strong": strong, "weak": weak_rows(weak)}
+    return out
+
+
+def print_sweep(result):
+    for (algo, mode), curves in result.items():
+        for n, rows in curves["strong"].items():
+            print(f"\n{algo} {mode} - strong scaling, n={n}")
+            print(f"{'p':>4} {'time':>10} {'speedup':>8} {'effic.':>7} {'K-F e':>7}")
+            for p, t, s, e, kf in rows:
+                print(f"{p:>4} {t:10.4f} {s:8.2f} {e:7.2f} {'-' if kf is None else f'{kf:.3f}':>7}")
+        print(f"\n{algo} {mode} - weak scaling")
+        print(f"{'p':>4} {'n':>5} {'time':>10} {'effic.':>7}")
+        for p, n, t, e in curves["weak"]:
+            print(f"{p:>4} {n:>5} {t:10.4f} {e:7.2f}")
@@ -1,7 +1,9 @@
-import tkinter as tk
 import time
+_T0 = time.perf_counter()
+
+import tkinter as tk
 import os
-from maze_app import MazeApp
+import sys
 
 try:
     from PIL import Image, ImageTk
@@ -9,6 +11,14 @@ except Exception:
     Image = None
     ImageTk = None
 
+_T_IMPORTS = time.perf_counter()
+
+# `python start_screen.py --startup-time` (or MAZE_STARTUP_TIME=1) prints
+# import and first-paint latency, then exits
+MEASURE_STARTUP = "--startup-time" in sys.argv or bool(os.environ.get("MAZE_STARTUP_TIME"))
+BG_RESIZE_DELAY_MS = 80
+BG_CACHE_SIZE = 4
+
 class StartScreen:
     def __init__(self):
         self.root = tk.Tk()
@@ -26,6 +36,9 @@ class StartScreen:
 
         self.bg_label = tk.Label(self.root)
         self.bg_label.place(x=0, y=0, relwidth=1, relheight=1)
+        self.bg_cache = {}
+        self.bg_pending = None
+        self.bg_size = None
         if self.original_img is not None and ImageTk is not None:
             self.root.bind("<Configure>", self.resize_bg)
 
@@ -79,16 +92,43 @@ class StartScreen:
         self.start_btn.pack(padx=4, pady=4)
         self.colors = ["#488285", "#f8edce", "#ff6b6b", "#ffd84f"]
         self.animate()
+        if MEASURE_STARTUP:
+            self.t_built = time.perf_counter()
+            self.root.after_idle(self.report_startup)
         self.root.mainloop()
 
     def resize_bg(self, event):
-        if self.original_img:
+        # <Configure> fires for every child widget and many times per drag:
+        # only react to the window itself and resize once it settles
+        if event.widget is not self.root or (event.width, event.height) == self.bg_size:
+            return
+        self.bg_size = (event.width, event.height)
+        if self.bg_pending is not None:
+            self.root.after_cancel(self.bg_pending)
+        self.bg_pending = self.root.after(BG_RESIZE_DELAY_MS, self.apply_bg)
+
+    def apply_bg(self):
+        self.bg_pending = None
+        size = self.bg_size
+        photo = self.bg_cache.get(size)
+        if photo is None:
             try:
-                img = self.original_img.resize((event.width, event.height), Image.LANCZOS)
-                self.bg_image = ImageTk.PhotoImage(img)
-                self.bg_label.config(image=self.bg_image)
+                photo = ImageTk.PhotoImage(self.original_img.resize(size, Image.LANCZOS))
             except Exception:
-                pass
+                return
+            if len(self.bg_cache) >= BG_CACHE_SIZE:
+                self.bg_cache.pop(next(iter(self.bg_cache)))
+            self.bg_cache[size] = photo
+        self.bg_image = photo
+        self.bg_label.config(image=photo)
+
+    def report_startup(self):
+        self.root.update()
+        painted = time.perf_counter()
+        print(f"imports:      {(_T_IMPORTS - _T0) * 1000:8.1f} ms")
+        print(f"window built: {(self.t_built - _T_IMPORTS) * 1000:8.1f} ms")
+        print(f"first paint:  {(painted - _T0) * 1000:8.1f} ms (since launch)")
+        self.root.destroy()
 
     def animate(self):
         color = self.colors[int(time.time() * 2) % len(self.colors)]
@@ -103,6 +143,7 @@ class StartScreen:
             self.root.destroy()
         except:
             pass
+        from maze_app import MazeApp  # deferred so the splash paints first
         main_root = tk.Tk()
         MazeApp(main_root)
         main_root.mainloop()
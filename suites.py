@@ -0,0 +1,171 @@
+"""Declarative benchmark suites.
+
+A suite is a TOML (Python 3.11+) or JSON file:
+
+    name = "smoke"
+    repeat = 5          # timed runs per case
+    warmup = 1          # untimed runs per case before those
+    cpus = [0, 1]       # optional: pin the process to these CPUs
+
+    [[scenario]]
+    generator = "random"            # see GENERATORS
+    sizes = [20, 40]
+    seeds = [0, 1]
+    densities = [0.18]
+    weighted = true
+    algorithms = ["BFS", "A*:Parallel"]
+    backends = ["serial", "threads"]  # optional filter
+    threads = [1, 4]                  # parallel solvers only
+    workload = "cpu"                  # optional, see workload.py
+    work_amount = 20000
+    batch = 16                        # optional, parallel Dijkstra/A* only
+
+Every scenario expands to cases in a fixed order (size, density, seed,
+algorithm, threads), mazes come from seeded generators, so two runs of a
+suite time exactly the same work. The report holds every case's times and
+can be stored as a baseline that later runs are compared against with the
+same Welch test `bench.py compare` uses.
+"""
+import os, sys, json, time
+from collections import namedtuple
+
+from algorithms import SOLVERS, BATCHED_SOLVERS
+from bench import make_maze, run_solver, parse_algos, backend_for
+from history import welch_test
+from workload import make_workload
+
+GENERATORS = {
+    "random": lambda n, density, seed, weighted: make_maze(n, density, seed, weighted),
+    "solvable": lambda n, density, seed, weighted: make_maze(n, density, seed, weighted, solvable=True),
+}
+SCENARIO_KEYS = {"generator", "sizes", "seeds", "densities", "weighted", "algorithms", "backends", "threads",
+                 "workload", "work_amount", "batch"}
+
+Case = namedtuple("Case", "generator n density seed weighted algo mode backend threads workload batch")
+
+
+def case_key(case):
+    return (f"{case.algo} {case.mode} {case.backend} x{case.threads} {case.generator}"
+            f" n{case.n} d{case.density:g} s{case.seed}" + (" weighted" if case.weighted else "")
+            + ("" if case.workload.name == "none" else f" {case.workload!r}")
+            + (f" batch{case.batch}" if case.batch else ""))
+
+
+def load_suite(path):
+    if path.endswith(".toml"):
+        import tomllib
+        with open(path, "rb") as f:
+            suite = tomllib.load(f)
+    else:
+        with open(path) as f:
+            suite = json.load(f)
+    suite.setdefault("name", os.path.splitext(os.path.basename(path))[0])
+    if not suite.get("scenario"):
+        raise ValueError(f"{path}: a suite needs at least one [[scenario]]")
+    for sc in suite["scenario"]:
+        unknown = set(sc) - SCENARIO_KEYS
+        if unknown:
+            raise ValueError(f"{path}: unknown scenario keys {sorted(unknown)}")
+        if sc.get("generator", "random") not in GENERATORS:
+            raise ValueError(f"{path}: unknown generator {sc['generator']!r}; known: {', '.join(GENERATORS)}")
+    return suite
+
+
+def expand(suite):
+    """Cases of the suite in the order they run."""
+    cases = []
+    for sc in suite["scenario"]:
+        keys = parse_algos(",".join(sc.get("algorithms", ["all"])))
+        backends = sc.get("backends")
+        workload = make_workload(sc.get("workload", "none"), sc.get("work_amount"))
+        for n in sc.get("sizes", [20]):
+            for density in sc.get("densities", [0.18]):
+                for seed in sc.get("seeds", [0]):
+                    for algo, mode in keys:
+                        batch = sc.get("batch", 0) if (algo, mode) in BATCHED_SOLVERS else 0
+                        backend = backend_for(algo, mode, batch)
+                        if backends and backend not in backends:
+                            continue
+                        for threads in (sc.get("threads", [4]) if mode == "Parallel" else [1]):
+                            cases.append(Case(sc.get("generator", "random"), n, density, seed,
+                                              bool(sc.get("weighted", False)), algo, mode, backend, threads,
+                                              workload, batch))
+    return cases
+
+
+def pin_cpus(cpus):
+    """Restrict this process to `cpus`; returns the set applied, or None where unsupported."""
+    if not cpus or not hasattr(os, "sched_setaffinity"):
+        return None
+    os.sched_setaffinity(0, cpus)
+    return os.sched_getaffinity(0)
+
+
+def run_suite(suite, progress=None, log=None):
+    """{case_key: [time, ...]} in run order.
+
+    progress(done, total, key) is called after every case, log(case, maze,
+    elapsed) after every timed run.
+    """
+    cases = expand(suite)
+    repeat, warmup = suite.get("repeat", 3), suite.get("warmup", 1)
+    mazes, results = {}, {}
+    for done, case in enumerate(cases, 1):
+        spec = (case.generator, case.n, case.density, case.seed, case.weighted)
+        if spec not in mazes:
+            mazes[spec] = GENERATORS[case.generator](case.n, case.density, case.seed, case.weighted)
+        maze, start, goal = mazes[spec]
+        func, parallel = SOLVERS[(case.algo, case.mode)], case.mode == "Parallel"
+        extra = {"workload": case.workload}
+        if case.batch:
+            extra["batch"] = case.batch
+        for _ in range(warmup):
+            run_solver(func, maze, start, goal, case.threads, parallel, **extra)
+        times = results[case_key(case)] = []
+        for _ in range(repeat):
+            _, elapsed, _ = run_solver(func, maze, start, goal, case.threads, parallel, **extra)
+            times.append(elapsed)
+            if log is not None:
+                log(case, maze, elapsed)
+        if progress is not None:
+            progress(done, len(cases), case_key(case))
+    return results
+
+
+def make_report(suite, results, cpus=None):
+    return {
+        "suite": suite["name"],
+        "created": time.time(),
+        "cpus": sorted(cpus) if cpus else None,
+        "repeat": suite.get("repeat", 3),
+        "warmup": suite.get("warmup", 1),
+        "results": results,
+    }
+
+
+def compare(report, baseline, alpha=0.05, min_change=0.05):
+    """[(key, mean, base_mean_or_None, ratio_or_None, p_or_None, regressed)] in report order."""
+    old = baseline["results"] if baseline else {}
+    rows = []
+    for key, ys in report["results"].items():
+        my = sum(ys) / len(ys)
+        xs = old.get(key)
+        if not xs:
+            rows.append((key, my, None, None, None, False))
+            continue
+        mx = sum(xs) / len(xs)
+        _, p = welch_test(xs, ys) if len(xs) > 1 and len(ys) > 1 else (0.0, 1.0)
+        ratio = my / mx if mx > 0 else float("inf")
+        rows.append((key, my, mx, ratio, p, p < alpha and ratio > 1.0 + min_change))
+    return rows
+
+
+def print_report(rows, name, out=sys.stdout):
+    print(f"suite {name}", file=out)
+    print(f"{'case':<60} {'mean':>9} {'baseline':>9} {'ratio':>7} {'p':>7}", file=out)
+    for key, my, mx, ratio, p, regressed in rows:
+        if mx is None:
+            print(f"{key:<60} {my:9.4f} {'-':>9} {'-':>7} {'-':>7}", file=out)
+        else:
+            flag = "  SLOWER" if regressed else ""
+            print(f"{key:<60} {my:9.4f} {mx:9.4f} {ratio:7.2f} {p:7.3f}{flag}", file=out)
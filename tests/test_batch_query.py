@@ -0,0 +1,38 @@
+import random
+
+import pytest
+
+from algorithms.batch_query import batch_query, UNREACHABLE
+from bench import make_maze
+from verify import oracle_for
+
+
+def random_pairs(maze, rng, count):
+    n = maze.n
+    cells = [(x, y) for x in range(n) for y in range(n)]
+    starts = rng.sample(cells, 5)
+    return [(s, rng.choice(cells)) for s in starts for _ in range(count)] + [(s, s) for s in starts]
+
+
+@pytest.mark.parametrize("weighted", [False, True])
+@pytest.mark.parametrize("workers", [1, 2])
+def test_answers_match_oracle(weighted, workers):
+    maze, _, _ = make_maze(16, 0.25, 3, weighted=weighted)
+    pairs = random_pairs(maze, random.Random(1), 8)
+    result, _ = batch_query(maze.n, maze.walls, None, pairs, num_workers=workers, maze=maze)
+    assert len(result) == len(pairs)
+    for i, (s, g) in enumerate(pairs):
+        oracle = oracle_for(maze, s)
+        path = result.path(i)
+        if maze.is_wall(s) or maze.is_wall(g) or oracle.hops[maze.index(g)] < 0:
+            assert result.cost(i) == UNREACHABLE and path == []
+            continue
+        verdict, value, reference = oracle.check("Dijkstra", path, g)
+        assert verdict == "ok" and result.cost(i) == value == reference
+
+
+def test_start_equal_to_goal():
+    maze, start, _ = make_maze(10, 0.2, 0, weighted=True)
+    result, _ = batch_query(maze.n, maze.walls, None, [(start, start), (start, start)],
+                            num_workers=1, maze=maze)
+    assert list(result.costs) == [0, 0] and result.path(1) == [start]
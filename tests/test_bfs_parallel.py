@@ -0,0 +1,34 @@
+from functools import partial
+
+import pytest
+
+from algorithms.bfs_parallel import bfs_parallel
+from bench import make_maze, run_solver
+from verify import oracle_for
+
+
+class FailAt:
+    """Workload that raises on its k-th call."""
+
+    def __init__(self, k):
+        self.k = k
+
+    def __call__(self, i):
+        self.k -= 1
+        if self.k == 0:
+            raise RuntimeError("workload failed")
+
+
+@pytest.mark.parametrize("fast_exit", [False, True])
+def test_fewest_steps(fast_exit):
+    for seed in range(4):
+        maze, start, goal = make_maze(20, 0.2, seed, solvable=True)
+        path, _, _ = run_solver(partial(bfs_parallel, fast_exit=fast_exit), maze, start, goal, 4, True)
+        assert oracle_for(maze, start).check("BFS", path, goal)[0] == "ok"
+
+
+@pytest.mark.parametrize("fast_exit", [False, True])
+def test_worker_error_is_raised_not_deadlocked(fast_exit):
+    maze, start, goal = make_maze(30, 0.15, 1, solvable=True)
+    with pytest.raises(RuntimeError):
+        run_solver(partial(bfs_parallel, fast_exit=fast_exit), maze, start, goal, 4, True, workload=FailAt(50))
@@ -0,0 +1,54 @@
+import random
+
+from connectivity import Connectivity
+from maze import MazeSnapshot
+from verify import Oracle
+
+
+def assert_matches_bfs(conn, n, walls, rng):
+    maze = MazeSnapshot(n, walls)
+    for _ in range(4):
+        a = (rng.randrange(n), rng.randrange(n))
+        hops = Oracle(maze, a).hops
+        for x in range(n):
+            for y in range(n):
+                expected = not maze.is_wall(a) and hops[maze.index((x, y))] >= 0
+                assert conn.connected(a, (x, y)) == expected
+
+
+def test_build_matches_bfs():
+    rng = random.Random(0)
+    for _ in range(20):
+        n = rng.randint(1, 10)
+        walls = {(x, y) for x in range(n) for y in range(n) if rng.random() < 0.35}
+        assert_matches_bfs(Connectivity(n, walls), n, walls, rng)
+
+
+def test_add_and_remove_wall_match_bfs():
+    for seed in range(60):
+        rng = random.Random(seed)
+        n = rng.randint(2, 9)
+        walls = {(x, y) for x in range(n) for y in range(n) if rng.random() < 0.3}
+        conn = Connectivity(n, walls)
+        for _ in range(15):
+            cell = (rng.randrange(n), rng.randrange(n))
+            if cell in walls:
+                walls.discard(cell)
+                conn.remove_wall(cell)
+            else:
+                walls.add(cell)
+                conn.add_wall(cell)
+            assert_matches_bfs(conn, n, walls, rng)
+
+
+def test_wall_that_splits_a_corridor():
+    # one open row; walling its middle cuts it in two, reopening joins it again
+    n = 5
+    walls = {(x, y) for x in range(1, n) for y in range(n)}
+    conn = Connectivity(n, walls)
+    assert conn.connected((0, 0), (0, 4))
+    conn.add_wall((0, 2))
+    assert not conn.connected((0, 0), (0, 4)) and conn.connected((0, 3), (0, 4))
+    assert not conn.connected((0, 2), (0, 2))
+    conn.remove_wall((0, 2))
+    assert conn.connected((0, 0), (0, 4))
@@ -0,0 +1,66 @@
+import random
+
+from algorithms.dijkstra_sequential import distances
+from algorithms.flow_field import FlowField, UNREACHABLE, NO_STEP, _changed_cells
+from maze import MazeSnapshot, DIRECTIONS
+
+
+def assert_field(field, maze):
+    """cost matches a reverse Dijkstra and every direction steps one weight closer."""
+    g = maze.index(field.goal)
+    ref = distances(maze, g, reverse=True) if not maze.blocked[g] else [float("inf")] * len(maze.adj)
+    n = maze.n
+    for i, c in enumerate(field.cost):
+        assert c == (UNREACHABLE if ref[i] == float("inf") else ref[i])
+        d = field.direction[i]
+        if c <= 0:
+            assert d == NO_STEP
+        else:
+            dx, dy = DIRECTIONS[d]
+            j = i + dx * n + dy
+            assert field.cost[j] + maze.weights[j] == c
+
+
+def random_maze(rng, n, walls=None):
+    if walls is None:
+        walls = {(x, y) for x in range(n) for y in range(n) if rng.random() < 0.25}
+    weights = {(x, y): rng.randint(1, 9) for x in range(n) for y in range(n) if rng.random() < 0.5}
+    return MazeSnapshot(n, walls, weights), walls, weights
+
+
+def test_build_matches_dijkstra():
+    rng = random.Random(0)
+    for _ in range(30):
+        n = rng.randint(2, 12)
+        maze, _, _ = random_maze(rng, n)
+        assert_field(FlowField.build(maze, (rng.randrange(n), rng.randrange(n))), maze)
+
+
+def test_update_matches_build_over_wall_toggles():
+    for seed in range(400):
+        rng = random.Random(seed)
+        n = rng.randint(2, 8)
+        goal = (rng.randrange(n), rng.randrange(n))
+        maze, walls, weights = random_maze(rng, n)
+        field = FlowField.build(maze, goal)
+        for _ in range(4):
+            walls = set(walls)
+            for _ in range(rng.randint(1, 3)):
+                cell = goal if rng.random() < 0.2 else (rng.randrange(n), rng.randrange(n))
+                walls ^= {cell}
+            new = MazeSnapshot(n, walls, weights)
+            field = field.update(new, _changed_cells(maze, new))
+            assert list(field.cost) == list(FlowField.build(new, goal).cost)
+            assert_field(field, new)
+            maze = new
+
+
+def test_reopened_goal():
+    # seed 353, n=3: the goal (0, 1) is walled, then reopened together with (2, 1)
+    rng = random.Random(353)
+    maze, walls, weights = random_maze(rng, 3, {(0, 1), (1, 1)})
+    field = FlowField.build(maze, (0, 1))
+    new = MazeSnapshot(3, (walls - {(0, 1)}) | {(2, 1)}, weights)
+    field = field.update(new, _changed_cells(maze, new))
+    assert field.cost_at((0, 1)) == 0
+    assert list(field.cost) == list(FlowField.build(new, (0, 1)).cost)
@@ -0,0 +1,38 @@
+import os, time
+
+from algorithms.hda_star import hda_star
+from bench import make_maze, run_solver
+from verify import oracle_for
+
+
+class CrashAt:
+    """Workload that kills the worker process expanding `cell`."""
+
+    def __init__(self, cell):
+        self.cell = cell
+
+    def __call__(self, i):
+        if i == self.cell:
+            os._exit(3)
+
+
+def test_optimal_on_weighted_mazes():
+    for seed in range(4):
+        maze, start, goal = make_maze(20, 0.2, seed, weighted=True, solvable=True)
+        path, _, _ = run_solver(hda_star, maze, start, goal, 3, True)
+        assert oracle_for(maze, start).check("HDA*", path, goal)[0] == "ok"
+
+
+def test_unreachable_goal():
+    maze, start, goal = make_maze(20, 0.3, 2)
+    path, _, _ = run_solver(hda_star, maze, start, goal, 2, True)
+    assert path == []
+
+
+def test_worker_killed_mid_search():
+    # the goal's owner dies as it expands the goal, when the survivors hold
+    # large parent maps to flush
+    maze, start, goal = make_maze(120, 0.15, 1, solvable=True)
+    t0 = time.time()
+    path, _, _ = run_solver(hda_star, maze, start, goal, 4, True, workload=CrashAt(maze.index(goal)))
+    assert path == [] and time.time() - t0 < 20
@@ -0,0 +1,36 @@
+import random
+
+from algorithms.indexed_heap import IndexedHeap
+
+
+def test_matches_a_reference_priority_map():
+    for seed in range(50):
+        rng = random.Random(seed)
+        size = rng.randint(1, 40)
+        heap, ref = IndexedHeap(size), {}
+        for _ in range(200):
+            if ref and rng.random() < 0.3:
+                key, cell = heap.pop()
+                assert key == ref.pop(cell) == min([key] + list(ref.values()))
+                assert cell not in heap
+                continue
+            cell, key = rng.randrange(size), rng.randint(0, 30)
+            lowered = cell not in ref or key < ref[cell]
+            assert heap.push(cell, key) == lowered
+            if lowered:
+                ref[cell] = key
+            assert len(heap) == len(ref) and cell in heap
+        popped = [heap.pop()[0] for _ in range(len(heap))]
+        assert popped == sorted(ref.values())
+
+
+def test_decrease_key_moves_the_entry_in_place():
+    heap = IndexedHeap(4)
+    for cell, key in ((0, (5, 0)), (1, (3, 0)), (2, (4, 0))):
+        heap.push(cell, key)
+    assert heap.push(0, (1, 0))
+    assert not heap.push(0, (2, 0)) and not heap.push(0, (1, 0))
+    assert len(heap) == 3
+    assert [heap.pop() for _ in range(3)] == [((1, 0), 0), ((3, 0), 1), ((4, 0), 2)]
+    # a popped cell can be queued again
+    assert heap.push(0, (9, 0)) and heap.pop() == ((9, 0), 0)
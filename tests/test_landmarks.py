@@ -0,0 +1,45 @@
+import random
+
+from algorithms.astar_sequential import astar_sequential
+from algorithms.dijkstra_sequential import distances
+from algorithms.heuristics import make_heuristic
+from algorithms.landmarks import Landmarks
+from bench import make_maze, run_solver
+from verify import oracle_for
+
+
+def test_bound_is_admissible_and_consistent():
+    for seed in range(6):
+        maze, _, _ = make_maze(14, 0.25, seed, weighted=True)
+        lm = Landmarks.build(maze, k=3, num_workers=1)
+        rng = random.Random(seed)
+        goals = rng.sample([i for i, b in enumerate(maze.blocked) if not b], 5)
+        for t in goals:
+            h = lm.bound(t)
+            exact = distances(maze, t, reverse=True)  # exact[i]: cost of i -> t
+            assert h(t) == 0
+            for i, row in enumerate(maze.adj):
+                if exact[i] == float("inf"):
+                    continue
+                assert h(i) <= exact[i]
+                for j, w in row:
+                    assert h(i) <= w + h(j)
+
+
+def test_process_tables_match_serial():
+    maze, _, _ = make_maze(16, 0.2, 1, weighted=True)
+    serial = Landmarks.build(maze, k=4, num_workers=1)
+    pooled = Landmarks.build(maze, k=4, num_workers=2)
+    assert serial.sources == pooled.sources
+    assert [list(a) for a in serial.dist_from] == [list(a) for a in pooled.dist_from]
+    assert [list(a) for a in serial.dist_to] == [list(a) for a in pooled.dist_to]
+
+
+def test_alt_astar_is_optimal():
+    for seed in range(4):
+        maze, start, goal = make_maze(20, 0.2, seed, weighted=True, solvable=True)
+        lm = Landmarks.build(maze, num_workers=1)
+        path, _, _ = run_solver(astar_sequential, maze, start, goal, heuristic="alt", landmarks=lm)
+        assert oracle_for(maze, start).check("A*", path, goal)[0] == "ok"
+        h = make_heuristic("alt", maze, goal, lm)
+        assert h(maze.index(start)) <= oracle_for(maze, start).cost[maze.index(goal)]
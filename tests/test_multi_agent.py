@@ -0,0 +1,86 @@
+import heapq, itertools, random
+
+import pytest
+
+from algorithms.multi_agent import solve_agents, random_agents, first_conflict
+from bench import make_maze
+from maze import MazeSnapshot
+
+
+def assert_valid(maze, agents, paths):
+    for (start, goal), path in zip(agents, paths):
+        assert path[0] == start and path[-1] == goal
+        for a, b in zip(path, path[1:]):
+            assert abs(a[0] - b[0]) + abs(a[1] - b[1]) <= 1 and not maze.is_wall(b)
+    assert first_conflict(paths) is None
+
+
+def joint_optimum(maze, agents):
+    """Sum of costs of the best joint plan, by Dijkstra over joint states.
+
+    An agent standing on its goal may finish (stay there for good); every
+    step costs the number of agents not finished yet.
+    """
+    idx = [(maze.index(s), maze.index(g)) for s, g in agents]
+    moves = [(i,) + tuple(j for j, _ in row) for i, row in enumerate(maze.adj)]
+    start = (tuple(s for s, _ in idx), (False,) * len(idx))
+    best, heap = {start: 0}, [(0, start)]
+    while heap:
+        cost, (pos, done) = heapq.heappop(heap)
+        if cost > best[(pos, done)]:
+            continue
+        if all(done):
+            return cost
+        for k, (p, (_, g)) in enumerate(zip(pos, idx)):
+            if not done[k] and p == g:
+                state = (pos, done[:k] + (True,) + done[k + 1:])
+                if cost < best.get(state, float("inf")):
+                    best[state] = cost
+                    heapq.heappush(heap, (cost, state))
+        options = [(p,) if d else moves[p] for p, d in zip(pos, done)]
+        step = cost + done.count(False)
+        for nxt in itertools.product(*options):
+            if len(set(nxt)) < len(nxt):
+                continue
+            if any(nxt[a] == pos[b] and nxt[b] == pos[a] and a != b
+                   for a in range(len(pos)) for b in range(a + 1, len(pos))):
+                continue
+            state = (nxt, done)
+            if step < best.get(state, float("inf")):
+                best[state] = step
+                heapq.heappush(heap, (step, state))
+    return None
+
+
+@pytest.mark.parametrize("method", ["prioritized", "cbs"])
+@pytest.mark.parametrize("workers", [1, 2])
+def test_plans_are_conflict_free(method, workers):
+    maze, _, _ = make_maze(16, 0.15, 3)
+    agents = random_agents(maze, 20, random.Random(4))
+    paths, _, info = solve_agents(maze, agents, method, workers, max_nodes=50)
+    planned = [(a, p) for a, p in zip(agents, paths) if p]
+    assert len(planned) == len(agents) - info["failed"]
+    assert_valid(maze, [a for a, _ in planned], [p for _, p in planned])
+
+
+def test_cbs_is_optimal_on_small_instances():
+    for seed in range(12):
+        rng = random.Random(seed)
+        n = 4
+        walls = set(rng.sample([(x, y) for x in range(n) for y in range(n)], 3))
+        maze = MazeSnapshot(n, walls)
+        agents = random_agents(maze, 3, rng)
+        paths, _, info = solve_agents(maze, agents, "cbs", 1, max_nodes=2000)
+        optimum = joint_optimum(maze, agents)
+        if optimum is None:
+            continue
+        assert info["method"] == "cbs"
+        assert_valid(maze, agents, paths)
+        assert info["sum_of_costs"] == optimum
+
+
+def test_blocked_agent_fails_fast():
+    # a corridor whose far end is the goal of an agent that arrives first
+    maze = MazeSnapshot(3, {(1, 0), (1, 1), (1, 2), (2, 0), (2, 1), (2, 2)})
+    paths, _, info = solve_agents(maze, [((0, 1), (0, 2)), ((0, 0), (0, 2))], "prioritized", 1)
+    assert paths[0] == [(0, 1), (0, 2)] and paths[1] is None and info["failed"] == 1
@@ -0,0 +1,49 @@
+from algorithms.bfs_sequential import bfs_sequential
+from algorithms.dijkstra_sequential import dijkstra_sequential
+from algorithms.reduction import ReducedMaze
+from bench import make_maze, run_solver
+from verify import oracle_for
+
+
+def test_dijkstra_on_reduced_maze_is_optimal():
+    for seed in range(8):
+        maze, start, goal = make_maze(20, 0.25, seed, weighted=True, solvable=True)
+        reduced = ReducedMaze.build(maze, keep=(start, goal))
+        path, _, _ = run_solver(dijkstra_sequential, reduced, start, goal)
+        # check() walks the expanded grid path cell by cell
+        verdict, value, reference = oracle_for(maze, start).check("Dijkstra", path, goal)
+        assert verdict == "ok" and value == reference
+
+
+def test_bfs_on_reduced_maze_returns_a_valid_path():
+    for seed in range(8):
+        maze, start, goal = make_maze(20, 0.25, seed, solvable=True)
+        reduced = ReducedMaze.build(maze, keep=(start, goal))
+        path, _, _ = run_solver(bfs_sequential, reduced, start, goal)
+        assert oracle_for(maze, start).check("BFS", path, goal, reduced=True)[0] == "ok"
+
+
+def test_edges_cost_their_expanded_corridor():
+    maze, start, goal = make_maze(24, 0.2, 5, weighted=True)
+    reduced = ReducedMaze.build(maze, keep=(start, goal))
+    for u, row in enumerate(reduced.adj):
+        for v, w in row:
+            parent = {u: u, v: u}
+            path = reduced.trace(parent, u, v)
+            assert path[0] == reduced.cells[u] and path[-1] == reduced.cells[v]
+            assert w == sum(maze.edge_weight(a, b) for a, b in zip(path, path[1:]))
+
+
+def test_reduction_shrinks_the_graph():
+    maze, start, goal = make_maze(30, 0.3, 7)
+    reduced = ReducedMaze.build(maze, keep=(start, goal))
+    open_cells, filled, nodes, _ = reduced.stats()
+    assert filled > 0 and nodes < open_cells - filled
+    assert reduced.cells[reduced.index(start)] == start
+
+
+def test_unreachable_goal():
+    maze, start, goal = make_maze(20, 0.3, 2)
+    reduced = ReducedMaze.build(maze, keep=(start, goal))
+    path, _, _ = run_solver(dijkstra_sequential, reduced, start, goal)
+    assert path == []
@@ -0,0 +1,36 @@
+import time
+
+from algorithms.sma_star import sma_star
+from bench import make_maze, run_solver
+from verify import oracle_for
+
+
+def solve(maze, start, goal, **extra):
+    t0 = time.perf_counter()
+    path, _, _ = run_solver(sma_star, maze, start, goal, **extra)
+    return path, time.perf_counter() - t0
+
+
+def test_unreachable_goal_returns_empty():
+    maze, start, goal = make_maze(20, 0.3, 2)
+    assert oracle_for(maze, start).hops[maze.index(goal)] < 0
+    path, took = solve(maze, start, goal, max_nodes=100)
+    assert path == [] and took < 5
+
+
+def test_budget_below_shortest_path_returns_empty():
+    maze, start, goal = make_maze(20, 0.18, 0, weighted=True, solvable=True)
+    oracle = oracle_for(maze, start)
+    steps = oracle.hops[maze.index(goal)]
+    path, took = solve(maze, start, goal, max_nodes=steps)
+    assert path == [] and took < 5
+    path, _ = solve(maze, start, goal)
+    assert oracle.check("SMA*", path, goal)[0] == "ok"
+
+
+def test_stall_limit_ends_thrashing():
+    # a budget this close to the path length forgets and regrows for a long time
+    maze, start, goal = make_maze(20, 0.25, 5, weighted=True)
+    path, took = solve(maze, start, goal, max_nodes=60, stall_limit=1000)
+    assert took < 5
+    assert path == [] or oracle_for(maze, start).check("SMA*", path, goal)[0] == "ok"
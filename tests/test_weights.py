@@ -0,0 +1,56 @@
+import pickle, random
+
+from maze import MazeSnapshot
+from weights import CellWeights
+
+
+def random_weights(rng, n, top=9):
+    return {(x, y): rng.randint(2, top) for x in range(n) for y in range(n) if rng.random() < 0.2}
+
+
+def test_forms_agree():
+    for seed in range(20):
+        rng = random.Random(seed)
+        n = rng.randint(1, 12)
+        sparse = random_weights(rng, n, top=rng.choice((9, 300, 70000)))
+        cw = CellWeights(n, sparse)
+        plane = cw.dense()
+        assert list(plane) == [sparse.get(divmod(i, n), 1) for i in range(n * n)]
+        indices, values = cw.coo()
+        assert list(indices) == sorted(x * n + y for x, y in sparse)
+        assert CellWeights.from_coo(n, indices, values).as_dict() == sparse
+        assert CellWeights.from_dense(n, plane).as_dict() == sparse
+        assert pickle.loads(pickle.dumps(cw)).as_dict() == sparse
+        assert cw.density() == len(sparse) / (n * n)
+
+
+def test_wraps_the_dict_without_copying():
+    sparse = {(1, 1): 5}
+    cw = CellWeights(3, sparse)
+    cw.set((0, 2), 7)
+    cw.set((1, 1), 1)
+    assert cw.as_dict() is sparse and sparse == {(0, 2): 7}
+    assert cw.get((0, 2)) == 7 and cw.get((1, 1)) == 1
+
+
+def test_set_patches_the_dense_plane():
+    rng = random.Random(3)
+    n = 8
+    cw = CellWeights(n, random_weights(rng, n))
+    cw.dense()
+    for _ in range(50):
+        pos, w = (rng.randrange(n), rng.randrange(n)), rng.choice((1, 2, 9, 400))
+        cw.set(pos, w)
+        assert cw.dense()[pos[0] * n + pos[1]] == w
+        assert list(cw.dense()) == list(CellWeights(n, dict(cw.as_dict())).dense())
+
+
+def test_snapshot_edge_costs():
+    rng = random.Random(5)
+    n = 10
+    sparse = random_weights(rng, n)
+    for weights in (sparse, CellWeights(n, sparse)):
+        maze = MazeSnapshot(n, (), weights)
+        for i, row in enumerate(maze.adj):
+            for j, w in row:
+                assert w == sparse.get(maze.cells[j], 1)
@@ -5,19 +5,23 @@ def neighbors(pos, n):
         nx, ny = x+dx, y+dy
         if 0<=nx<n and 0<=ny<n:
             yield (nx, ny)
-def generate_weights(n):
+def generate_weights(n, rng=random):
     weights = {}
     for i in range(n):
         for j in range(n):
-            if random.random() < 0.2:
-                weights[(i,j)] = random.randint(1,9)
+            if rng.random() < 0.2:
+                weights[(i,j)] = rng.randint(1,9)
     return weights
 
+def generate_walls(n, start, goal, density=0.18, rng=random):
+    cells = [(i, j) for i in range(n) for j in range(n) if (i, j) != start and (i, j) != goal]
+    return set(rng.sample(cells, int(len(cells) * density)))
+
 def in_bounds(x,y,n):
     return 0<=x<n and 0<=y<n
 
-def heavy_work():
+def heavy_work(iterations=50000):
     x = 1.0
-    for _ in range(50000): 
+    for _ in range(iterations):
         x = x * 1.0000001
     return x
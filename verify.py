@@ -0,0 +1,95 @@
+"""Correctness oracle for solver answers.
+
+An Oracle holds reference distance fields from one start cell, computed
+once per maze: step counts (BFS) and weighted costs (Dijkstra). check()
+then judges a returned path in O(path length):
+
+    "ok"          valid and as short as the algorithm promises
+    "invalid"     wrong endpoints, a jump between non-adjacent cells, or a wall
+    "suboptimal"  valid, but longer than the reference allows
+    "missed"      no path returned although the goal is reachable
+
+BFS is held to the fewest steps, Dijkstra / A* / HDA* / IDA* / SMA* to the
+lowest cost, DFS only to validity.
+"""
+from collections import OrderedDict
+from algorithms.dijkstra_sequential import distances
+
+VERDICTS = ("ok", "invalid", "suboptimal", "missed")
+WRONG = frozenset(VERDICTS[1:])
+
+# what each algorithm guarantees; the first word of the label is the algorithm
+METRICS = {"BFS": "hops", "DFS": None, "Dijkstra": "cost", "A*": "cost", "HDA*": "cost",
+           "IDA*": "cost", "SMA*": "cost"}
+
+CACHE_SIZE = 8
+_cache = OrderedDict()  # (fingerprint, start) -> Oracle
+
+
+class Oracle:
+
+    def __init__(self, maze, start):
+        self.maze = maze
+        self.start = tuple(start)
+        s = maze.index(start)
+        hops = [-1] * len(maze.adj)
+        hops[s] = 0
+        frontier = [s]
+        while frontier:
+            nxt = []
+            for curr in frontier:
+                for nx, _ in maze.adj[curr]:
+                    if hops[nx] < 0:
+                        hops[nx] = hops[curr] + 1
+                        nxt.append(nx)
+            frontier = nxt
+        self.hops = hops
+        self.cost = distances(maze, s)
+
+    def check(self, algo, path, goal, bound=1.0, reduced=False):
+        """(verdict, value, reference) for a path returned by algo.
+
+        value/reference are in the algorithm's metric (None for DFS or when
+        there is nothing to compare). bound > 1 accepts answers up to that
+        factor of the optimum (weighted A*). reduced: the solver ran on a
+        ReducedMaze, where BFS counts corridors rather than cells, so its
+        path is only checked for validity.
+        """
+        maze = self.maze
+        metric = METRICS.get(algo.split()[0], "cost")
+        if reduced and metric == "hops":
+            metric = None
+        t = maze.index(goal)
+        reachable = self.hops[t] >= 0
+        reference = None
+        if metric == "hops" and reachable:
+            reference = self.hops[t]
+        elif metric == "cost" and reachable:
+            reference = self.cost[t]
+
+        if not path:
+            return ("missed" if reachable else "ok"), None, reference
+        if tuple(path[0]) != self.start or tuple(path[-1]) != tuple(goal):
+            return "invalid", None, reference
+        cost = 0
+        for a, b in zip(path, path[1:]):
+            if abs(a[0] - b[0]) + abs(a[1] - b[1]) != 1 or maze.is_wall(b):
+                return "invalid", None, reference
+            cost += maze.edge_weight(a, b)
+        if metric is None:
+            return "ok", None, None
+        value = len(path) - 1 if metric == "hops" else cost
+        return ("ok" if value <= reference * bound else "suboptimal"), value, reference
+
+
+def oracle_for(maze, start):
+    """Oracle(maze, start) with a small cache keyed by maze fingerprint."""
+    key = (maze.fingerprint(), tuple(start))
+    oracle = _cache.get(key)
+    if oracle is None:
+        oracle = _cache[key] = Oracle(maze, start)
+        if len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+    else:
+        _cache.move_to_end(key)
+    return oracle
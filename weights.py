@@ -0,0 +1,82 @@
+"""Per-cell step costs, stored by density.
+
+utils.generate_weights returns a {(x, y): w} dict covering about a fifth of
+the cells. CellWeights wraps such a dict as-is (no copy), which is the form
+that is cheap to edit, and derives the other two forms on demand:
+
+    dense() - row-major plane with one unsigned byte per cell (wider only if
+              a weight does not fit), what the solver hot loops index
+    coo()   - (indices, values) arrays of the non-1 cells in index order,
+              the compact form used when pickling for worker processes
+"""
+from array import array
+
+
+def _typecode(values):
+    top = max(values, default=1)
+    return "B" if top <= 0xFF else "H" if top <= 0xFFFF else "l"
+
+
+class CellWeights:
+
+    __slots__ = ("n", "_sparse", "_dense")
+
+    def __init__(self, n, weights=None):
+        self.n = n
+        self._sparse = {} if weights is None else weights
+        self._dense = None
+
+    @classmethod
+    def from_coo(cls, n, indices, values):
+        return cls(n, {divmod(i, n): w for i, w in zip(indices, values)})
+
+    @classmethod
+    def from_dense(cls, n, plane):
+        return cls(n, {divmod(i, n): w for i, w in enumerate(plane) if w != 1})
+
+    def __reduce__(self):
+        return (CellWeights.from_coo, (self.n, *self.coo()))
+
+    def __len__(self):
+        return len(self._sparse)
+
+    def density(self):
+        """Fraction of cells whose weight is stored explicitly."""
+        return len(self._sparse) / (self.n * self.n) if self.n else 0.0
+
+    def get(self, pos, default=1):
+        return self._sparse.get(pos, default)
+
+    def set(self, pos, w):
+        """Change one cell, patching the dense plane in place if it is built."""
+        x, y = pos
+        if w == 1:
+            self._sparse.pop(pos, None)
+        else:
+            self._sparse[pos] = w
+        if self._dense is not None:
+            try:
+                self._dense[x * self.n + y] = w
+            except OverflowError:
+                self._dense = None  # too wide for the plane; rebuilt on next use
+
+    def as_dict(self):
+        """The {(x, y): w} form (the wrapped dict itself, not a copy)."""
+        return self._sparse
+
+    def dense(self):
+        if self._dense is None:
+            n = self.n
+            items = [(x * n + y, w) for (x, y), w in self._sparse.items() if 0 <= x < n and 0 <= y < n]
+            plane = array(_typecode(w for _, w in items), [1]) * (n * n)
+            for i, w in items:
+                plane[i] = w
+            self._dense = plane
+        return self._dense
+
+    def coo(self):
+        n = self.n
+        items = sorted((x * n + y, w) for (x, y), w in self._sparse.items()
+                       if 0 <= x < n and 0 <= y < n and w != 1)
+        return (array("l", (i for i, _ in items)),
+                array(_typecode(w for _, w in items), (w for _, w in items)))
@@ -0,0 +1,98 @@
+"""Synthetic per-node cost, applied the same way by every solver.
+
+Solvers call `workload(i)` once for every cell they expand, so a sequential
+and a parallel run of the same search pay for the same work and speedups
+reflect how each kind of load scales:
+
+    "none"   - no synthetic cost (the default)
+    "cpu"    - pure-Python float loop, holds the GIL (threads cannot overlap it)
+    "io"     - sleeps, like waiting on a device or the network (releases the GIL)
+    "memory" - scattered reads and writes in a buffer larger than the caches
+
+Workloads are module-level classes holding only plain settings, so they
+pickle into worker processes.
+"""
+import time
+from utils import heavy_work
+
+WORKLOADS = ("none", "cpu", "io", "memory")
+
+
+class NoWork:
+    name = "none"
+
+    def __call__(self, i):
+        pass
+
+    def __repr__(self):
+        return "NoWork()"
+
+
+class CpuWork:
+    name = "cpu"
+
+    def __init__(self, iterations=50000):
+        self.iterations = iterations
+
+    def __call__(self, i):
+        return heavy_work(self.iterations)
+
+    def __repr__(self):
+        return f"CpuWork({self.iterations})"
+
+
+class IoWork:
+    name = "io"
+
+    def __init__(self, latency=0.001):
+        self.latency = latency
+
+    def __call__(self, i):
+        time.sleep(self.latency)
+
+    def __repr__(self):
+        return f"IoWork({self.latency})"
+
+
+class MemoryWork:
+    name = "memory"
+
+    def __init__(self, touches=2000, size_mb=32):
+        self.touches = touches
+        self.size_mb = size_mb
+        self._buffer = None
+
+    def __getstate__(self):
+        # the buffer is per process; receivers allocate their own
+        return {"touches": self.touches, "size_mb": self.size_mb, "_buffer": None}
+
+    def __call__(self, i):
+        buf = self._buffer
+        if buf is None:
+            buf = self._buffer = bytearray(self.size_mb << 20)
+        size = len(buf)
+        # page-sized, cell-dependent strides defeat the caches and the prefetcher
+        pos = (i * 2654435761) % size
+        step = 4096 + 64 * (i % 61)
+        for _ in range(self.touches):
+            buf[pos] = (buf[pos] + 1) & 0xFF
+            pos = (pos + step) % size
+
+    def __repr__(self):
+        return f"MemoryWork({self.touches}, {self.size_mb})"
+
+
+NO_WORK = NoWork()
+
+
+def make_workload(name="none", amount=None):
+    """Workload by name; amount is iterations (cpu), seconds (io) or touches (memory)."""
+    if name == "none":
+        return NO_WORK
+    if name == "cpu":
+        return CpuWork() if amount is None else CpuWork(int(amount))
+    if name == "io":
+        return IoWork() if amount is None else IoWork(float(amount))
+    if name == "memory":
+        return MemoryWork() if amount is None else MemoryWork(int(amount))
+    raise ValueError(f"unknown workload: {name}")